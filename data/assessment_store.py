@@ -0,0 +1,260 @@
+# =====================================================
+# Persistent assessment / override store
+# =====================================================
+# neighbourhood_result, applied_overrides and manual_override used to
+# live only in st.session_state, so a browser refresh or a worker
+# restart lost them and a session was tied to one worker. They are
+# kept in SQLite as well, keyed by an assessment id that travels in the
+# page URL (?assessment=<id>), so any worker can pick a session up.
+#
+# - WAL mode, writes queued and group-committed by a background
+#   thread (data/sqlite_store.py), so pages never wait on disk
+# - indexed tables for assessments, components and overrides (the full
+#   result documents are kept alongside as JSON)
+#
+# The database is .cache/assessments.sqlite3 unless ASSESSMENT_DB
+# points elsewhere, e.g. a volume shared by the workers on one host.
+# (WAL needs a local filesystem, not a network share.)
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from data.sqlite_store import MAX_WRITE_BATCH, BatchedSQLiteStore, dumps, number
+
+
+ASSESSMENT_DB_ENV_VAR = "ASSESSMENT_DB"
+ASSESSMENT_DB_PATH = Path(__file__).resolve().parents[1] / ".cache" / "assessments.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id                  TEXT PRIMARY KEY,
+    created_at          REAL NOT NULL,
+    updated_at          REAL NOT NULL,
+    address             TEXT,
+    suburb              TEXT,
+    state               TEXT,
+    postcode            TEXT,
+    zoning              TEXT,
+    lga                 TEXT,
+    score               REAL,
+    label               TEXT,
+    scoring_version_id  TEXT,
+    result              TEXT NOT NULL,
+    manual_override     TEXT
+);
+CREATE INDEX IF NOT EXISTS assessments_created ON assessments (created_at);
+CREATE INDEX IF NOT EXISTS assessments_suburb ON assessments (suburb, state);
+CREATE INDEX IF NOT EXISTS assessments_version ON assessments (scoring_version_id);
+
+CREATE TABLE IF NOT EXISTS components (
+    assessment_id  TEXT NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    name           TEXT NOT NULL,
+    position       INTEGER NOT NULL,
+    score          REAL,
+    label          TEXT,
+    PRIMARY KEY (assessment_id, name)
+);
+CREATE INDEX IF NOT EXISTS components_name_score ON components (name, score);
+
+CREATE TABLE IF NOT EXISTS overrides (
+    assessment_id   TEXT NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    component       TEXT NOT NULL,
+    original_score  REAL,
+    adjusted_score  REAL,
+    applied_at      REAL NOT NULL,
+    detail          TEXT NOT NULL,
+    PRIMARY KEY (assessment_id, component)
+);
+CREATE INDEX IF NOT EXISTS overrides_applied ON overrides (applied_at);
+CREATE INDEX IF NOT EXISTS overrides_component ON overrides (component, applied_at);
+"""
+
+
+class AssessmentStore(BatchedSQLiteStore):
+    """
+    SQLite store for assessments, their components and overrides.
+    """
+
+    def __init__(self, path: Path | str | None = None, max_batch: int = MAX_WRITE_BATCH):
+        super().__init__(
+            path or os.environ.get(ASSESSMENT_DB_ENV_VAR) or ASSESSMENT_DB_PATH,
+            SCHEMA,
+            synchronous="NORMAL",
+            max_batch=max_batch,
+            name="assessment store",
+        )
+
+    # -------------------------------------------------
+    # Writes (queued)
+    # -------------------------------------------------
+    def save_assessment(self, assessment_id: str, result: dict) -> None:
+        """
+        Insert or replace an assessment (a neighbourhood_result dict)
+        and its components. Existing overrides are kept.
+        """
+        now = time.time()
+        summary = result.get("summary", {})
+        version = result.get("scoring_version") or {}
+        doc = {k: v for k, v in result.items() if k != "composite"}
+
+        statements = [
+            (
+                """
+                INSERT INTO assessments (
+                    id, created_at, updated_at, address, suburb, state,
+                    postcode, zoning, lga, score, label, scoring_version_id,
+                    result
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    address = excluded.address,
+                    suburb = excluded.suburb,
+                    state = excluded.state,
+                    postcode = excluded.postcode,
+                    zoning = excluded.zoning,
+                    lga = excluded.lga,
+                    score = excluded.score,
+                    label = excluded.label,
+                    scoring_version_id = excluded.scoring_version_id,
+                    result = excluded.result
+                """,
+                (
+                    assessment_id, now, now,
+                    summary.get("address"), summary.get("suburb"),
+                    summary.get("state"), summary.get("postcode"),
+                    summary.get("zoning"), summary.get("lga"),
+                    number(result.get("score")), result.get("label"),
+                    version.get("id"), dumps(doc),
+                ),
+            ),
+            ("DELETE FROM components WHERE assessment_id = ?", (assessment_id,)),
+        ]
+        for position, (name, comp) in enumerate(result.get("components", {}).items()):
+            statements.append(
+                (
+                    "INSERT INTO components VALUES (?, ?, ?, ?, ?)",
+                    (
+                        assessment_id, name, position,
+                        number(comp.get("score")), comp.get("label"),
+                    ),
+                )
+            )
+        self._submit(statements)
+
+    def save_overrides(self, assessment_id: str, overrides: dict) -> None:
+        """
+        Replace an assessment's applied overrides ({component: override}).
+        """
+        now = time.time()
+        statements = [("DELETE FROM overrides WHERE assessment_id = ?", (assessment_id,))]
+        for component, override in overrides.items():
+            statements.append(
+                (
+                    "INSERT INTO overrides VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        assessment_id, component,
+                        number(override.get("original_score")),
+                        number(override.get("adjusted_score")),
+                        override.get("applied_at", now),
+                        dumps(override),
+                    ),
+                )
+            )
+        self._submit(statements)
+
+    def save_manual_override(self, assessment_id: str, context: dict | None) -> None:
+        """
+        Set (or clear, with None) the pending manual review context.
+        """
+        self._submit(
+            [
+                (
+                    "UPDATE assessments SET manual_override = ?, updated_at = ? WHERE id = ?",
+                    (
+                        dumps(context) if context is not None else None,
+                        time.time(),
+                        assessment_id,
+                    ),
+                )
+            ]
+        )
+
+    # -------------------------------------------------
+    # Reads
+    # -------------------------------------------------
+    def load(self, assessment_id: str) -> dict | None:
+        """
+        {"neighbourhood_result", "applied_overrides", "manual_override"}
+        for one assessment, or None if it is unknown.
+        """
+        conn = self._reader()
+        row = conn.execute(
+            "SELECT result, manual_override FROM assessments WHERE id = ?",
+            (assessment_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        overrides = {
+            r["component"]: json.loads(r["detail"])
+            for r in conn.execute(
+                "SELECT component, detail FROM overrides WHERE assessment_id = ?",
+                (assessment_id,),
+            )
+        }
+        return {
+            "neighbourhood_result": json.loads(row["result"]),
+            "applied_overrides": overrides,
+            "manual_override": (
+                json.loads(row["manual_override"]) if row["manual_override"] else None
+            ),
+        }
+
+    def recent(self, limit: int = 50, suburb: str | None = None) -> list[dict]:
+        """
+        Latest assessments (newest first), optionally for one suburb,
+        with their override counts.
+        """
+        where, params = "", ()
+        if suburb:
+            where, params = "WHERE a.suburb = ?", (suburb,)
+
+        rows = self._reader().execute(
+            f"""
+            SELECT a.id, a.created_at, a.updated_at, a.address, a.suburb,
+                   a.state, a.postcode, a.score, a.label,
+                   a.scoring_version_id,
+                   (SELECT COUNT(*) FROM overrides o WHERE o.assessment_id = a.id)
+                       AS overrides
+            FROM assessments a
+            {where}
+            ORDER BY a.created_at DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        return [dict(r) for r in rows]
+
+
+# -------------------------------------------------
+# Shared store for the app process
+# -------------------------------------------------
+_STORE: AssessmentStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_assessment_store() -> AssessmentStore:
+    """
+    The process-wide store, opened on first use and flushed on exit.
+    """
+    global _STORE
+
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = AssessmentStore()
+                atexit.register(_STORE.close)
+    return _STORE
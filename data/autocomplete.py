@@ -0,0 +1,162 @@
+# =====================================================
+# Prefix autocomplete for suburbs and LGAs
+# =====================================================
+# The Suburb and LGA inputs are free text, and a typo only shows up as
+# a silent SUBURB_NOT_FOUND / LGA_NOT_FOUND. These indexes complete
+# what the analyst has typed so far against the loaded datasets.
+#
+# Each index is a sorted list of normalised keys plus, for multi-word
+# names, the key from each later word on ("HILLS SHIRE" for "THE HILLS
+# SHIRE"). A prefix is one bisect into that list and its completions
+# are the contiguous run that follows, so a top-k lookup reads only
+# the matching run (cut short once k whole-key matches are found),
+# whatever the dataset size.
+#
+# Rebuilt whenever the underlying dataset is reloaded or replaced
+# (registry generation, or the content hash of a pinned snapshot).
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+from data.loaders import dataset_version, get_dataset
+from data.normalisation import normalise_lga_name, normalise_suburb_name
+
+
+DEFAULT_COMPLETIONS = 8
+
+
+class PrefixIndex:
+    """
+    Sorted-key prefix index over (key, display name) pairs.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str, str]],
+        normalise: Callable[[str], str],
+    ):
+        self.normalise = normalise
+
+        # One display name per key (first seen wins)
+        names: dict[str, str] = {}
+        for key, display in entries:
+            if key and key not in names:
+                names[key] = display
+
+        self.keys: list[str] = sorted(names)
+        self.names: list[str] = [names[k] for k in self.keys]
+
+        # (search text, word offset, key position); offset 0 = the
+        # whole key, so plain prefix matches sort ahead of word matches
+        # with the same text
+        terms = []
+        for pos, key in enumerate(self.keys):
+            terms.append((key, 0, pos))
+            start = key.find(" ")
+            while start != -1:
+                terms.append((key[start + 1:], start + 1, pos))
+                start = key.find(" ", start + 1)
+        terms.sort()
+
+        self._terms: list[str] = [t for t, _, _ in terms]
+        self._offsets: list[int] = [o for _, o, _ in terms]
+        self._positions: list[int] = [p for _, _, p in terms]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        pos = bisect_left(self.keys, key)
+        return pos < len(self.keys) and self.keys[pos] == key
+
+    def complete(self, text: str, k: int = DEFAULT_COMPLETIONS) -> list[tuple[str, str]]:
+        """
+        Up to k [(key, display name)] whose key, or one of whose words
+        onwards, starts with the normalised text. Whole-key matches
+        come first, each group in key order.
+        """
+        prefix = self.normalise(text) if text else ""
+        if not prefix or k <= 0:
+            return []
+
+        whole: list[int] = []
+        words: set[int] = set()
+
+        start = bisect_left(self._terms, prefix)
+        for i in range(start, len(self._terms)):
+            if not self._terms[i].startswith(prefix):
+                break
+            if self._offsets[i] == 0:
+                whole.append(self._positions[i])
+                # Whole-key matches come in key order, so k of them
+                # end the scan
+                if len(whole) >= k:
+                    break
+            else:
+                words.add(self._positions[i])
+
+        ranked = whole + sorted(words.difference(whole))
+        return [(self.keys[p], self.names[p]) for p in ranked[:k]]
+
+
+# =====================================================
+# Process-wide indexes over the loaded datasets
+# =====================================================
+# Cached by (dataset, version): a pinned snapshot gets its own entry
+# instead of replacing the live index.
+_LOCK = threading.Lock()
+_INDEXES: OrderedDict[tuple[str, int | str], PrefixIndex] = OrderedDict()
+MAX_INDEXES = 6
+
+_SOURCES = {
+    # dataset → (key column, display column, normaliser)
+    "seifa": ("SUBURB_KEY", "suburb_name", normalise_suburb_name),
+    "lga_irsad": ("LGA_KEY", "lga_name", normalise_lga_name),
+}
+
+
+def _get_index(name: str) -> PrefixIndex:
+    df = get_dataset(name)
+    version = (name, dataset_version(name))
+
+    index = _INDEXES.get(version)
+    if index is not None:
+        return index
+
+    key_col, name_col, normalise = _SOURCES[name]
+    with _LOCK:
+        if version not in _INDEXES:
+            entries = zip(df[key_col].astype(str), df[name_col].astype(str))
+            _INDEXES[version] = PrefixIndex(entries, normalise)
+            while len(_INDEXES) > MAX_INDEXES:
+                _INDEXES.popitem(last=False)
+        return _INDEXES[version]
+
+
+def get_suburb_index() -> PrefixIndex:
+    """
+    Prefix index over the SEIFA suburbs (SUBURB_KEY → suburb_name).
+    """
+    return _get_index("seifa")
+
+
+def get_lga_index() -> PrefixIndex:
+    """
+    Prefix index over the IRSAD LGAs (LGA_KEY → lga_name).
+    """
+    return _get_index("lga_irsad")
+
+
+def complete_suburbs(text: str, k: int = DEFAULT_COMPLETIONS) -> list[tuple[str, str]]:
+    """
+    Known suburbs starting with what has been typed so far.
+    """
+    return get_suburb_index().complete(text, k)
+
+
+def complete_lgas(text: str, k: int = DEFAULT_COMPLETIONS) -> list[tuple[str, str]]:
+    """
+    Known LGAs starting with what has been typed so far.
+    """
+    return get_lga_index().complete(text, k)
@@ -0,0 +1,170 @@
+# =====================================================
+# Columnar on-disk cache for derived datasets
+# =====================================================
+# The loaders derive SUBURB_KEY / LGA_KEY / crime_percentile from the
+# source CSVs. The derived frame is stored as Feather next to a small
+# JSON sidecar describing the source it was built from, so a cold
+# worker reads columns straight from disk instead of re-parsing and
+# re-normalising the CSV.
+#
+# Invalidation:
+# - source mtime + size unchanged  → reuse artifact
+# - mtime changed, sha256 unchanged → reuse artifact, refresh sidecar
+# - otherwise                       → rebuild
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    feather = None
+
+
+# Bump when the derivation logic in the loaders changes so existing
+# artifacts are rebuilt.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_ENV_VAR = "SCORING_DATASET_CACHE"
+
+
+def cache_enabled() -> bool:
+    """
+    Cache is on unless pyarrow is missing or SCORING_DATASET_CACHE=0.
+    """
+    if feather is None:
+        return False
+    return os.environ.get(CACHE_ENV_VAR, "1") != "0"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _artifact_paths(cache_dir: Path, name: str) -> tuple[Path, Path]:
+    return cache_dir / f"{name}.feather", cache_dir / f"{name}.json"
+
+
+def _read_meta(meta_path: Path) -> dict | None:
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _read_artifact(artifact_path: Path) -> pd.DataFrame | None:
+    try:
+        return feather.read_feather(artifact_path)
+    except Exception:
+        # Truncated or written by an incompatible pyarrow: rebuild
+        return None
+
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> None:
+    """
+    Write a file so readers see the old or the new content, never a
+    partial file: `write` fills a temporary file next to `path`, which
+    then replaces it.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _write_meta(meta_path: Path, meta: dict) -> None:
+    write_atomic(
+        meta_path,
+        lambda p: p.write_text(json.dumps(meta, indent=2), encoding="utf-8"),
+    )
+
+
+def load_cached_dataset(
+    name: str,
+    source: Path,
+    build: Callable[[Path], pd.DataFrame],
+    cache_dir: Path,
+) -> pd.DataFrame:
+    """
+    Return the derived frame for `source`, using the on-disk artifact
+    when it is still valid and rebuilding it otherwise.
+
+    `build` parses and derives the frame from the source CSV. It must
+    return a frame with a default RangeIndex.
+    """
+    if not cache_enabled():
+        return build(source)
+
+    artifact_path, meta_path = _artifact_paths(cache_dir, name)
+
+    stat = source.stat()
+    meta = _read_meta(meta_path)
+    sha256 = None
+
+    if (
+        meta is not None
+        and meta.get("format_version") == CACHE_FORMAT_VERSION
+        and meta.get("source") == source.name
+        and artifact_path.exists()
+    ):
+        unchanged = (
+            meta.get("mtime_ns") == stat.st_mtime_ns
+            and meta.get("size") == stat.st_size
+        )
+
+        if not unchanged:
+            # Touched but possibly identical (e.g. fresh checkout)
+            sha256 = file_sha256(source)
+            unchanged = meta.get("sha256") == sha256
+
+            if unchanged:
+                meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                try:
+                    _write_meta(meta_path, meta)
+                except OSError:
+                    pass
+
+        if unchanged:
+            df = _read_artifact(artifact_path)
+            if df is not None:
+                return df
+
+    if sha256 is None:
+        sha256 = file_sha256(source)
+
+    df = build(source)
+
+    # A read-only deployment still works, it just never caches.
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            artifact_path,
+            lambda p: feather.write_feather(df, p),
+        )
+        _write_meta(
+            meta_path,
+            {
+                "format_version": CACHE_FORMAT_VERSION,
+                "source": source.name,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": sha256,
+                "rows": len(df),
+            },
+        )
+    except OSError:
+        pass
+
+    return df
@@ -0,0 +1,95 @@
+# =====================================================
+# Memory-compact dataset representation
+# =====================================================
+# Every Streamlit worker holds its own copy of the location frames.
+# Compact mode shrinks them:
+# - name / key strings      → category
+# - *_decile                → Int8 (nullable; SEIFA has gaps)
+# - raw index scores        → float32
+# - integer codes / counts  → smallest integer type
+# - columns the runtime never reads can be dropped
+#
+# crime_percentile stays float64: it is compared against the crime
+# score thresholds and must not move across a boundary.
+import os
+
+import pandas as pd
+
+
+COMPACT_ENV_VAR = "SCORING_COMPACT_DATASETS"
+
+# Columns the runtime reads, per dataset. Everything else is dropped
+# when drop_unused=True.
+RUNTIME_COLUMNS: dict[str, list[str]] = {
+    "crime": ["Suburb", "SUBURB_KEY", "crime_12m", "crime_percentile"],
+    "seifa": [
+        "suburb_code",
+        "suburb_name",
+        "SUBURB_KEY",
+        "IRSD_score",
+        "IRSD_decile",
+        "IRSAD_score",
+        "IRSAD_decile",
+    ],
+    "lga_irsad": ["lga_code", "lga_name", "LGA_KEY", "IRSAD_score", "IRSAD_decile"],
+}
+
+# Kept at full precision (threshold-driving)
+_FLOAT64_COLUMNS = {"crime_percentile"}
+
+
+def compact_mode_enabled() -> bool:
+    return os.environ.get(COMPACT_ENV_VAR, "0") == "1"
+
+
+def _compact_column(name: str, col: pd.Series) -> pd.Series:
+    if name in _FLOAT64_COLUMNS:
+        return col
+
+    if name.endswith("_decile"):
+        return col.astype("Int8")
+
+    if pd.api.types.is_string_dtype(col) or pd.api.types.is_object_dtype(col):
+        return col.astype("category")
+
+    if pd.api.types.is_integer_dtype(col):
+        return pd.to_numeric(col, downcast="integer")
+
+    if pd.api.types.is_float_dtype(col):
+        return col.astype("float32")
+
+    return col
+
+
+def compact_dataset(
+    df: pd.DataFrame,
+    name: str,
+    drop_unused: bool = True,
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Return a compact copy of a location dataset plus a size report:
+    {"dataset", "bytes_before", "bytes_after", "bytes_saved",
+     "dropped_columns"}
+    """
+    bytes_before = int(df.memory_usage(deep=True).sum())
+
+    dropped: list[str] = []
+    if drop_unused and name in RUNTIME_COLUMNS:
+        keep = [c for c in df.columns if c in RUNTIME_COLUMNS[name]]
+        dropped = [c for c in df.columns if c not in keep]
+        df = df[keep]
+
+    compact = pd.DataFrame(
+        {col: _compact_column(col, df[col]) for col in df.columns},
+        index=df.index,
+    )
+
+    bytes_after = int(compact.memory_usage(deep=True).sum())
+
+    return compact, {
+        "dataset": name,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "dropped_columns": dropped,
+    }
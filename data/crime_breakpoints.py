@@ -0,0 +1,146 @@
+# =====================================================
+# Crime percentile breakpoints
+# =====================================================
+# crime_percentile is crime_12m.rank(pct=True) * 100 over the whole
+# crime dataset, so scoring a count that is not a row of the loaded
+# frame (a new suburb, a refreshed count, a what-if value) would mean
+# re-ranking everything.
+#
+# The sorted crime_12m values are kept as one compact array instead.
+# For a count c, with
+#   below = number of values <  c
+#   upto  = number of values <= c
+# the average rank of c's tie group is (below + upto + 1) / 2, so
+#   percentile = (below + upto + 1) / 2 / n * 100
+# which is exactly rank(pct=True) for counts already in the dataset and
+# the midpoint between neighbours for counts that are not (capped at
+# 100 above the highest count). Both counts are binary searches:
+# O(log n) per lookup.
+#
+# Rebuilt whenever the crime dataset is reloaded or replaced (registry
+# generation, or the content hash of a pinned snapshot), e.g. after
+# ingest_crime_month.
+import threading
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+import pandas as pd
+
+from data.loaders import dataset_version, get_dataset
+from policies.location import crime_score_from_percentile
+
+
+def percentile_in(sorted_counts, crime_12m) -> float | None:
+    """
+    crime_percentile of one 12-month count against an ascending
+    sequence of counts (array or list), capped at 100. None for a
+    missing count or an empty sequence.
+    """
+    try:
+        count = float(crime_12m)
+    except (TypeError, ValueError):
+        return None
+    if count != count or not len(sorted_counts):
+        return None
+
+    below = bisect_left(sorted_counts, count)
+    upto = bisect_right(sorted_counts, count)
+    return min((below + upto + 1) / 2 / len(sorted_counts) * 100, 100.0)
+
+
+class CrimeBreakpoints:
+    """
+    Sorted crime_12m distribution with rank(pct=True) lookups.
+    """
+
+    def __init__(self, crime_12m):
+        values = pd.to_numeric(pd.Series(crime_12m), errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        # rank() leaves NaN unranked and out of the denominator
+        values = np.sort(values[~np.isnan(values)])
+
+        # Counts fit in int32; anything fractional stays float64
+        if len(values) and np.array_equal(values, np.floor(values)) and (
+            np.abs(values).max() <= np.iinfo(np.int32).max
+        ):
+            values = values.astype(np.int32)
+
+        self.values: np.ndarray = values
+        self.values.setflags(write=False)
+
+    @classmethod
+    def from_frame(cls, crime: pd.DataFrame) -> "CrimeBreakpoints":
+        return cls(crime["crime_12m"])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def percentile_of(self, crime_12m) -> float | None:
+        """
+        crime_percentile for one 12-month count (higher = safer).
+        None for a missing count or an empty distribution.
+        """
+        return percentile_in(self.values, crime_12m)
+
+    def percentiles_of(self, crime_12m) -> np.ndarray:
+        """
+        Vector form of percentile_of(); NaN where the count is missing.
+        """
+        counts = pd.to_numeric(pd.Series(crime_12m), errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        if not len(self.values):
+            return np.full(len(counts), np.nan)
+
+        below = np.searchsorted(self.values, counts, side="left")
+        upto = np.searchsorted(self.values, counts, side="right")
+        percentiles = np.minimum(
+            (below + upto + 1) / 2 / len(self.values) * 100, 100.0
+        )
+        return np.where(np.isnan(counts), np.nan, percentiles)
+
+    def score(self, crime_12m) -> tuple[float | None, int | None]:
+        """
+        (crime_percentile, crime_score) for one 12-month count.
+        """
+        percentile = self.percentile_of(crime_12m)
+        return percentile, crime_score_from_percentile(percentile)
+
+
+# =====================================================
+# Process-wide breakpoints for the loaded crime dataset
+# =====================================================
+_LOCK = threading.Lock()
+_BREAKPOINTS: tuple[int | str, CrimeBreakpoints] | None = None
+
+
+def get_crime_breakpoints() -> CrimeBreakpoints:
+    """
+    Breakpoints of the current crime dataset, rebuilt when it changes.
+    """
+    global _BREAKPOINTS
+
+    crime = get_dataset("crime")
+    generation = dataset_version("crime")
+
+    cached = _BREAKPOINTS
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    with _LOCK:
+        if _BREAKPOINTS is None or _BREAKPOINTS[0] != generation:
+            _BREAKPOINTS = (generation, CrimeBreakpoints.from_frame(crime))
+        return _BREAKPOINTS[1]
+
+
+def score_crime_count(crime_12m) -> tuple[float | None, int | None]:
+    """
+    (crime_percentile, crime_score) a suburb with this 12-month crime
+    count gets against the current crime dataset.
+    """
+    return get_crime_breakpoints().score(crime_12m)
@@ -0,0 +1,390 @@
+# =====================================================
+# Incremental rolling-window crime ingestion
+# =====================================================
+# The crime CSV is a 12-month window of monthly suburb counts
+# ("Jul 2024" … "Jun 2025") plus crime_12m and its ranks. A monthly
+# refresh appends one month, drops the oldest and re-derives the
+# percentiles.
+#
+# Instead of re-reading and re-ranking the whole file:
+# - counts live in a ring buffer of 12 month columns, so rolling
+#   replaces one column in place
+# - crime_12m changes by (new month − dropped month) per suburb
+# - the crime_12m values are kept in a sorted list, updated with
+#   bisect for the suburbs whose total changed; ranks and percentiles
+#   are then binary searches against it
+#
+# Percentiles match rank(pct=True) (ties share their average rank);
+# crime_rank / crime_risk_score follow the source file (rank "min",
+# highest count first, rescaled to 0–100).
+#
+# Each roll writes a new CSV named after its window
+# (suburb_crime_risk_12m_2024_08_to_2025_07.csv) – load_crime_data
+# picks the latest – and primes its Feather artifact so cold workers
+# skip the CSV rebuild.
+import time
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.cache import load_cached_dataset, write_atomic
+from data.crime_breakpoints import percentile_in
+from data.loaders import (
+    COLLATERAL_DATA_DIR,
+    DATASET_CACHE_DIR,
+    crime_data_path,
+    install_dataset,
+    mark_crime_source_loaded,
+)
+from data.normalisation import normalise_suburb_name, normalise_suburb_names
+
+
+WINDOW_MONTHS = 12
+
+MONTH_LABEL_FORMAT = "%b %Y"
+
+
+def _parse_month(label) -> pd.Period | None:
+    if isinstance(label, pd.Period):
+        return label.asfreq("M")
+    try:
+        return pd.Period(pd.to_datetime(label, format=MONTH_LABEL_FORMAT), "M")
+    except (TypeError, ValueError):
+        return None
+
+
+def crime_window_filename(first: pd.Period, last: pd.Period) -> str:
+    return (
+        f"suburb_crime_risk_12m_{first.year}_{first.month:02d}"
+        f"_to_{last.year}_{last.month:02d}.csv"
+    )
+
+
+class CrimeWindow:
+    """
+    Rolling 12-month window of suburb crime counts.
+    """
+
+    def __init__(
+        self,
+        suburbs: list[str],
+        months: list[pd.Period],
+        counts: np.ndarray,
+    ):
+        if len(months) != WINDOW_MONTHS:
+            raise ValueError(
+                f"Crime window needs {WINDOW_MONTHS} months, got {len(months)}"
+            )
+        if counts.shape != (len(suburbs), WINDOW_MONTHS):
+            raise ValueError("Crime counts do not match suburbs × months")
+
+        self.suburbs: list[str] = list(suburbs)
+        self._keys: list[str] = normalise_suburb_names(
+            pd.Series(self.suburbs, dtype=str)
+        ).tolist()
+        self._row: dict[str, int] = {s: i for i, s in enumerate(self.suburbs)}
+
+        # Ring buffer: column _oldest holds months[0]
+        self._months: list[pd.Period] = list(months)
+        self._counts = np.asarray(counts, dtype=np.int64).copy()
+        self._oldest = 0
+
+        self._totals = self._counts.sum(axis=1)
+        self._sorted: list[int] = sorted(self._totals.tolist())
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "CrimeWindow":
+        """
+        Build from a crime frame in the source CSV layout.
+        """
+        month_cols = [c for c in df.columns if _parse_month(c) is not None]
+        if "Suburb" not in df.columns or len(month_cols) != WINDOW_MONTHS:
+            raise ValueError(
+                f"Crime frame needs Suburb and {WINDOW_MONTHS} month columns"
+            )
+
+        months = [_parse_month(c) for c in month_cols]
+        order = np.argsort([m.ordinal for m in months], kind="stable")
+        months = [months[i] for i in order]
+
+        for prev, cur in zip(months, months[1:]):
+            if (cur - prev).n != 1:
+                raise ValueError(f"Crime months are not consecutive: {prev} → {cur}")
+
+        counts = (
+            df[[month_cols[i] for i in order]]
+            .fillna(0)
+            .to_numpy(dtype=np.int64)
+        )
+        return cls(df["Suburb"].astype(str).tolist(), months, counts)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "CrimeWindow":
+        return cls.from_frame(pd.read_csv(path))
+
+    # -------------------------------------------------
+    # Window state
+    # -------------------------------------------------
+    @property
+    def months(self) -> list[pd.Period]:
+        return list(self._months)
+
+    @property
+    def version(self) -> str:
+        """
+        Window identifier, e.g. "2024_07_to_2025_06".
+        """
+        first, last = self._months[0], self._months[-1]
+        return f"{first.year}_{first.month:02d}_to_{last.year}_{last.month:02d}"
+
+    def __len__(self) -> int:
+        return len(self.suburbs)
+
+    def copy(self) -> "CrimeWindow":
+        """
+        Independent copy; rolling it leaves this window unchanged.
+        """
+        other = object.__new__(CrimeWindow)
+        other.suburbs = list(self.suburbs)
+        other._keys = list(self._keys)
+        other._row = dict(self._row)
+        other._months = list(self._months)
+        other._counts = self._counts.copy()
+        other._oldest = self._oldest
+        other._totals = self._totals.copy()
+        other._sorted = list(self._sorted)
+        return other
+
+    def _ordered_counts(self) -> np.ndarray:
+        return np.roll(self._counts, -self._oldest, axis=1)
+
+    # -------------------------------------------------
+    # Rolling
+    # -------------------------------------------------
+    def roll(self, month, counts: Mapping[str, int] | pd.Series) -> dict:
+        """
+        Append one month of suburb counts and drop the oldest month.
+
+        `month` must directly follow the current window. Suburbs missing
+        from `counts` are recorded as 0 for the new month; suburbs not
+        yet in the window are added with 0 for the earlier months.
+
+        Returns {"month", "dropped_month", "version", "changed_suburbs",
+        "new_suburbs", "seconds"}.
+        """
+        start = time.perf_counter()
+
+        month = _parse_month(month)
+        if month is None:
+            raise ValueError("Crime month must look like 'Jul 2025'")
+        expected = self._months[-1] + 1
+        if month != expected:
+            raise ValueError(
+                f"Next crime month must be {expected.strftime(MONTH_LABEL_FORMAT)}, "
+                f"got {month.strftime(MONTH_LABEL_FORMAT)}"
+            )
+
+        if isinstance(counts, pd.Series):
+            counts = counts.to_dict()
+
+        new_suburbs = [str(s) for s in counts if str(s) not in self._row]
+        if new_suburbs:
+            self._add_suburbs(new_suburbs)
+
+        new_col = np.zeros(len(self.suburbs), dtype=np.int64)
+        for suburb, value in counts.items():
+            if pd.notna(value):
+                new_col[self._row[str(suburb)]] = int(value)
+
+        slot = self._oldest
+        delta = new_col - self._counts[:, slot]
+
+        changed = np.flatnonzero(delta)
+        for i in changed.tolist():
+            old_total = int(self._totals[i])
+            del self._sorted[bisect_left(self._sorted, old_total)]
+            insort(self._sorted, old_total + int(delta[i]))
+
+        self._totals += delta
+        self._counts[:, slot] = new_col
+        self._oldest = (slot + 1) % WINDOW_MONTHS
+
+        dropped = self._months.pop(0)
+        self._months.append(month)
+
+        return {
+            "month": month.strftime(MONTH_LABEL_FORMAT),
+            "dropped_month": dropped.strftime(MONTH_LABEL_FORMAT),
+            "version": self.version,
+            "changed_suburbs": int(len(changed)),
+            "new_suburbs": len(new_suburbs),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _add_suburbs(self, suburbs: list[str]) -> None:
+        # New rows start at 0 in every slot of the ring buffer
+        self._counts = np.vstack(
+            [self._counts, np.zeros((len(suburbs), WINDOW_MONTHS), dtype=np.int64)]
+        )
+        self._totals = np.concatenate(
+            [self._totals, np.zeros(len(suburbs), dtype=np.int64)]
+        )
+        for suburb in suburbs:
+            self._row[suburb] = len(self.suburbs)
+            self.suburbs.append(suburb)
+            self._keys.append(normalise_suburb_name(suburb))
+            insort(self._sorted, 0)
+
+    # -------------------------------------------------
+    # Ranks / percentiles
+    # -------------------------------------------------
+    def percentiles(self) -> np.ndarray:
+        """
+        crime_percentile per suburb (higher = safer), identical to
+        crime_12m.rank(pct=True) * 100.
+        """
+        ordered = np.asarray(self._sorted, dtype=np.int64)
+        below = np.searchsorted(ordered, self._totals, side="left")
+        upto = np.searchsorted(ordered, self._totals, side="right")
+        # Average rank of a tie group: below + (ties + 1) / 2
+        return (below + upto + 1) / 2 / len(ordered) * 100
+
+    def percentile_of(self, crime_12m) -> float | None:
+        """
+        Percentile a suburb with this 12-month count would get (same
+        lookup as CrimeBreakpoints.percentile_of).
+        """
+        return percentile_in(self._sorted, crime_12m)
+
+    def crime_ranks(self) -> np.ndarray:
+        """
+        crime_rank as in the source file: 1 = most crime, ties share
+        the lowest rank.
+        """
+        ordered = np.asarray(self._sorted, dtype=np.int64)
+        above = len(ordered) - np.searchsorted(ordered, self._totals, side="right")
+        return (above + 1).astype(float)
+
+    # -------------------------------------------------
+    # Output
+    # -------------------------------------------------
+    def _source_frame(self) -> tuple[pd.DataFrame, np.ndarray]:
+        ranks = self.crime_ranks()
+        max_rank = ranks.max() if len(ranks) else 1.0
+
+        df = pd.DataFrame(
+            self._ordered_counts(),
+            columns=[m.strftime(MONTH_LABEL_FORMAT) for m in self._months],
+        )
+        df.insert(0, "Suburb", pd.Series(self.suburbs, dtype=str))
+        df["crime_12m"] = self._totals
+        df["crime_rank"] = ranks
+        df["crime_risk_score"] = (
+            (ranks - 1) / (max_rank - 1) * 100 if max_rank > 1 else 100.0
+        )
+
+        order = np.argsort(self._totals, kind="stable")
+        return df.iloc[order].reset_index(drop=True), order
+
+    def to_source_frame(self) -> pd.DataFrame:
+        """
+        Window in the source CSV layout, lowest crime_12m first.
+        """
+        return self._source_frame()[0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Derived crime frame, same shape as load_crime_data().
+        """
+        df, order = self._source_frame()
+        df["SUBURB_KEY"] = pd.Series(self._keys, dtype=str).iloc[order].to_numpy()
+        df["crime_percentile"] = self.percentiles()[order]
+        return df
+
+
+# =====================================================
+# Versioned artifacts / live refresh
+# =====================================================
+_WINDOW: tuple[str, CrimeWindow] | None = None
+
+
+def get_crime_window() -> CrimeWindow:
+    """
+    Rolling window over the latest crime CSV, built on first use, kept
+    up to date by ingest_crime_month and rebuilt when another process
+    publishes a newer window.
+    """
+    global _WINDOW
+
+    path = crime_data_path()
+    if _WINDOW is None or _WINDOW[0] != path.name:
+        _WINDOW = (path.name, CrimeWindow.from_csv(path))
+
+    return _WINDOW[1]
+
+
+def write_crime_window(
+    window: CrimeWindow,
+    out_dir: Path = COLLATERAL_DATA_DIR,
+) -> Path:
+    """
+    Write the window as a new CSV named after its months. Existing
+    windows are never overwritten.
+    """
+    first, last = window.months[0], window.months[-1]
+    path = Path(out_dir) / crime_window_filename(first, last)
+    if path.exists():
+        raise FileExistsError(f"Crime window already written: {path.name}")
+
+    df = window.to_source_frame()
+    write_atomic(path, lambda p: df.to_csv(p, index=False))
+    return path
+
+
+def ingest_crime_month(
+    month,
+    counts: Mapping[str, int] | pd.Series,
+    out_dir: Path = COLLATERAL_DATA_DIR,
+) -> dict:
+    """
+    Roll the crime window forward by one month and publish it.
+
+    - writes the new versioned CSV (load_crime_data picks the latest)
+    - primes its Feather artifact from the incrementally built frame
+    - swaps the frame into this process's registry (the suburb feature
+      table is rebuilt from the new percentiles on next use); other
+      processes reload it when they see the new file
+
+    Returns the roll report plus "path".
+    """
+    global _WINDOW
+
+    window = get_crime_window()
+
+    # Refuse before rolling, so a rejected refresh leaves the window as is
+    target = Path(out_dir) / crime_window_filename(
+        window.months[1], window.months[-1] + 1
+    )
+    if target.exists():
+        raise FileExistsError(f"Crime window already written: {target.name}")
+
+    # Roll a copy: the shared window only moves on once the new file is
+    # published, so a failed write can be retried with the same month
+    window = window.copy()
+    report = window.roll(month, counts)
+
+    path = write_crime_window(window, out_dir)
+    _WINDOW = (path.name, window)
+    frame = window.to_frame()
+
+    # Prime the dataset cache with the frame already built here
+    frame = load_cached_dataset("crime", path, lambda _: frame, DATASET_CACHE_DIR)
+
+    install_dataset("crime", frame)
+    mark_crime_source_loaded()
+
+    report["path"] = str(path)
+    return report
@@ -0,0 +1,186 @@
+# =====================================================
+# Materialised suburb feature table
+# =====================================================
+# One row per SUBURB_KEY joining crime and SEIFA inputs with the
+# location policy outputs, built in a single vectorised pass the first
+# time it is needed. A page request is then one dict lookup instead of
+# two DataFrame lookups plus the scalar policy.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data.loaders import dataset_version, get_dataset
+from policies.location import (
+    assess_location_risk,
+    assess_location_risk_batch,
+    location_rationale,
+)
+from policies.tables import policy_hash
+
+
+FEATURE_COLUMNS = [
+    "crime_percentile",
+    "IRSD_decile",
+    "IRSAD_decile",
+    "crime_score",
+    "irsd_score",
+    "irsad_score",
+    "score",
+    "label",
+    "icon",
+    "flag",
+    "requires_manual_review",
+]
+
+
+def build_suburb_feature_table(
+    crime: pd.DataFrame,
+    seifa: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Join crime and SEIFA on SUBURB_KEY and score every suburb.
+
+    Keys that appear more than once keep their first row, matching
+    get_location_inputs. Suburbs present in only one dataset get the
+    policy's partial-data treatment.
+    """
+    crime_part = (
+        crime.loc[~crime["SUBURB_KEY"].duplicated(), ["SUBURB_KEY", "crime_percentile"]]
+        .set_index("SUBURB_KEY")
+    )
+    seifa_part = (
+        seifa.loc[~seifa["SUBURB_KEY"].duplicated(), ["SUBURB_KEY", "IRSD_decile", "IRSAD_decile"]]
+        .set_index("SUBURB_KEY")
+    )
+
+    inputs = crime_part.join(seifa_part, how="outer")
+    scored = assess_location_risk_batch(inputs)
+
+    table = pd.concat([inputs, scored], axis=1).reset_index()
+    return table[["SUBURB_KEY", *FEATURE_COLUMNS]]
+
+
+# -------------------------------------------------
+# Versioned cache
+# -------------------------------------------------
+# Tables are cached by (policy hash, crime version, SEIFA version), the
+# same keys get_dataset / get_policy_tables resolve for the caller, so a
+# rules reload or a new crime frame builds a new table, and a pinned
+# scoring snapshot gets its own table without touching the one live
+# sessions read.
+_LOCK = threading.Lock()
+
+# version → (table, SUBURB_KEY → row as a plain dict, NaN mapped to None)
+_FEATURE_TABLES: OrderedDict[tuple, tuple[pd.DataFrame, dict[str, dict]]] = OrderedDict()
+
+# Live table plus a few pinned versions
+MAX_FEATURE_TABLES = 4
+
+
+def _feature_records(df: pd.DataFrame) -> list[dict]:
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    for record in records:
+        for col in ("IRSD_decile", "IRSAD_decile"):
+            value = record[col]
+            if value is not None and float(value).is_integer():
+                record[col] = int(value)
+    return records
+
+
+def _feature_table() -> tuple[pd.DataFrame, dict[str, dict]]:
+    crime = get_dataset("crime")
+    seifa = get_dataset("seifa")
+    version = (policy_hash(), dataset_version("crime"), dataset_version("seifa"))
+
+    cached = _FEATURE_TABLES.get(version)
+    if cached is not None:
+        return cached
+
+    with _LOCK:
+        cached = _FEATURE_TABLES.get(version)
+        if cached is None:
+            table = build_suburb_feature_table(crime, seifa)
+            cached = (table, {r["SUBURB_KEY"]: r for r in _feature_records(table)})
+            _FEATURE_TABLES[version] = cached
+            while len(_FEATURE_TABLES) > MAX_FEATURE_TABLES:
+                _FEATURE_TABLES.popitem(last=False)
+        return cached
+
+
+def get_suburb_feature_table() -> pd.DataFrame:
+    """
+    Full feature table (for bulk enrichment) for the caller's scoring
+    rules and datasets; built on first use and rebuilt when either
+    changes.
+    """
+    return _feature_table()[0]
+
+
+def get_suburb_features(suburb_key: str | None) -> dict | None:
+    """
+    Feature row for one suburb as a dict, or None if the suburb is in
+    neither dataset. Do not mutate the returned dict.
+    """
+    records = _feature_table()[1]
+
+    if suburb_key is None:
+        return None
+
+    return records.get(suburb_key)
+
+
+def score_suburb_features(
+    suburb_key: str,
+    crime_percentile: float | None,
+    irsd_decile: float | None,
+    irsad_decile: float | None,
+) -> dict:
+    """
+    Feature row for inputs that are not in the table (e.g. the second
+    SEIFA row of a duplicated suburb name), same shape as
+    get_suburb_features.
+    """
+    # Compacted frames hold missing deciles as pd.NA (nullable Int8)
+    inputs = pd.DataFrame(
+        {
+            col: [np.nan if pd.isna(value) else value]
+            for col, value in (
+                ("crime_percentile", crime_percentile),
+                ("IRSD_decile", irsd_decile),
+                ("IRSAD_decile", irsad_decile),
+            )
+        },
+        index=pd.Index([suburb_key], name="SUBURB_KEY"),
+        dtype="float64",
+    )
+    scored = assess_location_risk_batch(inputs)
+
+    table = pd.concat([inputs, scored], axis=1).reset_index()
+    return _feature_records(table[["SUBURB_KEY", *FEATURE_COLUMNS]])[0]
+
+
+def location_result_from_features(features: dict | None) -> dict:
+    """
+    Build the assess_location_risk result from a feature row.
+    """
+    if features is None or features["score"] is None:
+        return assess_location_risk(None, None, None)
+
+    irsd_decile = features["IRSD_decile"]
+    irsad_decile = features["IRSAD_decile"]
+
+    return {
+        "risk_name": "Location",
+        "score": features["score"],
+        "label": features["label"],
+        "icon": features["icon"],
+        "flags": [features["flag"]] if features["flag"] else [],
+        "requires_manual_review": bool(features["requires_manual_review"]),
+        "rationale": location_rationale(
+            features["crime_percentile"],
+            irsd_decile if features["irsd_score"] is not None else None,
+            irsad_decile if features["irsad_score"] is not None else None,
+        ),
+    }
@@ -0,0 +1,200 @@
+# =====================================================
+# Typo-tolerant suburb matching
+# =====================================================
+# Exact SUBURB_KEY misses ("CSATLE HILL") push the location component
+# to INSUFFICIENT_DATA and manual review. This index suggests the
+# nearest known suburbs instead.
+#
+# Two stages:
+# 1. trigram inverted index → candidate keys sharing the most trigrams
+#    (one numpy bincount over the posting lists)
+# 2. optimal-string-alignment edit distance on those candidates only,
+#    so adjacent transpositions ("SA" ↔ "AS") cost 1
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from data.features import get_suburb_feature_table
+from data.loaders import dataset_version
+from data.normalisation import normalise_suburb_name
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, max_distance: int | None = None) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions).
+
+    With max_distance, only the diagonal band that can stay within the
+    bound is computed and any result above it is returned as
+    max_distance + 1.
+    """
+    if a == b:
+        return 0
+
+    la, lb = len(a), len(b)
+    bound = max_distance if max_distance is not None else max(la, lb)
+    over = bound + 1
+
+    if abs(la - lb) > bound:
+        return over
+    if not a or not b:
+        return max(la, lb)
+
+    big = over
+    prev_prev = None
+    prev = [j if j <= bound else big for j in range(lb + 1)]
+
+    for i in range(1, la + 1):
+        lo = max(1, i - bound)
+        hi = min(lb, i + bound)
+
+        cur = [big] * (lb + 1)
+        if i <= bound:
+            cur[0] = i
+
+        ca = a[i - 1]
+        row_min = cur[0]
+
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            best = prev[j - 1] + (ca != cb)
+            if prev[j] + 1 < best:
+                best = prev[j] + 1
+            if cur[j - 1] + 1 < best:
+                best = cur[j - 1] + 1
+            if (
+                prev_prev is not None
+                and j > 1
+                and ca == b[j - 2]
+                and a[i - 2] == cb
+                and prev_prev[j - 2] + 1 < best
+            ):
+                best = prev_prev[j - 2] + 1
+            cur[j] = best
+            if best < row_min:
+                row_min = best
+
+        if row_min > bound:
+            return over
+
+        prev_prev, prev = prev, cur
+
+    return prev[lb] if prev[lb] <= bound else over
+
+
+class SuburbMatcher:
+    """
+    Approximate-match index over a fixed set of suburb keys.
+    """
+
+    def __init__(self, keys, candidates: int = 24):
+        self.keys: list[str] = sorted({k for k in keys if k})
+        self.candidates = candidates
+
+        postings: dict[str, list[int]] = {}
+        for idx, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                postings.setdefault(gram, []).append(idx)
+
+        self._postings = {
+            gram: np.asarray(ids, dtype=np.int32)
+            for gram, ids in postings.items()
+        }
+        self._key_set = set(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def match(
+        self,
+        name: str,
+        k: int = 5,
+        max_distance: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """
+        Ranked [(suburb_key, edit_distance)] for a raw or normalised
+        suburb name, closest first. An exact key match comes back alone
+        with distance 0.
+        """
+        query = normalise_suburb_name(name) if name else ""
+        if not query:
+            return []
+
+        if query in self._key_set:
+            return [(query, 0)]
+
+        lists = [
+            self._postings[g] for g in _trigrams(query) if g in self._postings
+        ]
+        if not lists:
+            return []
+
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+
+        n = min(self.candidates, int(np.count_nonzero(shared)))
+        top = np.argpartition(-shared, n - 1)[:n]
+
+        if max_distance is None:
+            max_distance = max(2, len(query) // 3)
+
+        # Most-shared first, so the bound tightens quickly once k
+        # close matches have been found
+        top = top[np.argsort(-shared[top], kind="stable")]
+
+        scored = []
+        bound = max_distance
+        for idx in top.tolist():
+            key = self.keys[idx]
+            dist = edit_distance(query, key, bound)
+            if dist <= bound:
+                scored.append((dist, -int(shared[idx]), key))
+                if len(scored) >= k:
+                    scored.sort()
+                    bound = scored[k - 1][0]
+
+        scored.sort()
+        return [(key, dist) for dist, _, key in scored[:k]]
+
+
+# -------------------------------------------------
+# Shared matcher over the loaded suburb keys
+# -------------------------------------------------
+# The feature table's keys come from the crime and SEIFA datasets, so
+# matchers are cached by those two versions (a pinned snapshot gets its
+# own entry instead of replacing the live one).
+_LOCK = threading.Lock()
+_MATCHERS: OrderedDict[tuple, SuburbMatcher] = OrderedDict()
+MAX_MATCHERS = 4
+
+
+def get_suburb_matcher() -> SuburbMatcher:
+    """
+    Matcher over every SUBURB_KEY in the suburb feature table, built on
+    first use and rebuilt when the crime or SEIFA dataset changes.
+    """
+    table = get_suburb_feature_table()
+    version = (dataset_version("crime"), dataset_version("seifa"))
+
+    matcher = _MATCHERS.get(version)
+    if matcher is not None:
+        return matcher
+
+    with _LOCK:
+        if version not in _MATCHERS:
+            _MATCHERS[version] = SuburbMatcher(table["SUBURB_KEY"].tolist())
+            while len(_MATCHERS) > MAX_MATCHERS:
+                _MATCHERS.popitem(last=False)
+        return _MATCHERS[version]
+
+
+def suggest_suburbs(name: str, k: int = 5) -> list[tuple[str, int]]:
+    """
+    Closest known suburb keys for a (possibly misspelt) suburb name.
+    """
+    return get_suburb_matcher().match(name, k=k)
@@ -1,10 +1,20 @@
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
 import pandas as pd
-import streamlit as st
 from pathlib import Path
 
+from data.cache import load_cached_dataset
+from data.compact import compact_dataset, compact_mode_enabled
+from data.registry import DatasetRegistry, LazyDatasets
 from data.normalisation import (
-    normalise_suburb_name,
-    normalise_lga_name,
+    normalise_suburb_names,
+    normalise_lga_names,
 )
 
 # =====================================================
@@ -20,17 +30,21 @@ if not COLLATERAL_DATA_DIR.exists():
         f"Collateral data directory not found: {COLLATERAL_DATA_DIR}"
     )
 
+# Derived (normalised / ranked) datasets, rebuilt when the CSVs change
+DATASET_CACHE_DIR = BASE_DIR / ".cache" / "datasets"
+
 # =====================================================
 # Crime data (suburb-level)
 # =====================================================
-@st.cache_data
-def load_crime_data() -> pd.DataFrame:
+def crime_data_path() -> Path:
     """
-    Load suburb-level crime risk data and derive percentile.
+    Latest crime window CSV. Files are named
+    suburb_crime_risk_12m_<start>_to_<end>.csv, so the lexically
+    largest name is the most recent window (see data/crime_ingest.py).
     """
-    path = next(
+    path = max(
         COLLATERAL_DATA_DIR.glob("suburb_crime_risk*.csv"),
-        None,
+        default=None,
     )
 
     if path is None or not path.exists():
@@ -38,6 +52,24 @@ def load_crime_data() -> pd.DataFrame:
             "Suburb crime risk CSV not found in Collateral/data"
         )
 
+    return path
+
+
+def load_crime_data() -> pd.DataFrame:
+    """
+    Load suburb-level crime risk data and derive percentile.
+
+    The derived frame is read from the on-disk dataset cache unless
+    the CSV has changed since it was built (see data/cache.py).
+    """
+    path = crime_data_path()
+
+    return load_cached_dataset(
+        "crime", path, _build_crime_data, DATASET_CACHE_DIR
+    )
+
+
+def _build_crime_data(path: Path) -> pd.DataFrame:
     df = pd.read_csv(path)
 
     required_cols = {"Suburb", "crime_12m"}
@@ -47,7 +79,7 @@ def load_crime_data() -> pd.DataFrame:
         )
 
     # 🔑 Canonical suburb key (唯一标准)
-    df["SUBURB_KEY"] = df["Suburb"].astype(str).apply(normalise_suburb_name)
+    df["SUBURB_KEY"] = normalise_suburb_names(df["Suburb"].astype(str))
 
     # Higher percentile = safer suburb
     df["crime_percentile"] = (
@@ -60,7 +92,6 @@ def load_crime_data() -> pd.DataFrame:
 # =====================================================
 # SEIFA (IRSD / IRSAD) – suburb-level
 # =====================================================
-@st.cache_data
 def load_seifa_data() -> pd.DataFrame:
     """
     Load suburb-level IRSD / IRSAD data.
@@ -72,6 +103,12 @@ def load_seifa_data() -> pd.DataFrame:
             f"SEIFA suburb file not found: {path}"
         )
 
+    return load_cached_dataset(
+        "seifa", path, _build_seifa_data, DATASET_CACHE_DIR
+    )
+
+
+def _build_seifa_data(path: Path) -> pd.DataFrame:
     df = pd.read_csv(path)
 
     required_cols = {
@@ -85,9 +122,7 @@ def load_seifa_data() -> pd.DataFrame:
         )
 
     # 🔑 Canonical suburb key（必须和 crime 用同一个 normalise）
-    df["SUBURB_KEY"] = df["suburb_name"].astype(str).apply(
-        normalise_suburb_name
-    )
+    df["SUBURB_KEY"] = normalise_suburb_names(df["suburb_name"].astype(str))
 
     return df
 
@@ -95,7 +130,6 @@ def load_seifa_data() -> pd.DataFrame:
 # =====================================================
 # LGA IRSAD – LGA-level
 # =====================================================
-@st.cache_data
 def load_lga_irsad_data() -> pd.DataFrame:
     """
     Load LGA-level IRSAD data (ABS 2021).
@@ -107,50 +141,278 @@ def load_lga_irsad_data() -> pd.DataFrame:
             f"LGA IRSAD file not found: {path}"
         )
 
+    return load_cached_dataset(
+        "lga_irsad", path, _build_lga_irsad_data, DATASET_CACHE_DIR
+    )
+
+
+def _build_lga_irsad_data(path: Path) -> pd.DataFrame:
     df = pd.read_csv(path)
 
     if "lga_name" not in df.columns:
         raise ValueError("LGA IRSAD CSV missing lga_name column")
 
     # 🔑 Canonical LGA key
-    df["LGA_KEY"] = df["lga_name"].astype(str).apply(normalise_lga_name)
+    df["LGA_KEY"] = normalise_lga_names(df["lga_name"].astype(str))
 
     return df
 
 
+# =====================================================
+# Key indexes
+# =====================================================
+# dataset name → canonical key column
+LOCATION_KEY_COLUMNS = {
+    "crime": "SUBURB_KEY",
+    "seifa": "SUBURB_KEY",
+    "lga_irsad": "LGA_KEY",
+}
+
+# (id(df), key_col) → {key: row position}
+_KEY_INDEXES: dict[tuple[int, str], dict[str, int]] = {}
+
+
+def build_key_index(df: pd.DataFrame, key_col: str) -> dict[str, int]:
+    """
+    Map each key to the position of its first row.
+
+    First occurrence wins, matching the previous iloc[0] behaviour
+    when a key appears more than once.
+    """
+    index: dict[str, int] = {}
+    for pos, key in enumerate(df[key_col].tolist()):
+        index.setdefault(key, pos)
+    return index
+
+
+def get_key_index(df: pd.DataFrame, key_col: str) -> dict[str, int]:
+    """
+    Return the key index for a frame, building it on first use.
+
+    Indexes are held per frame object and dropped when the frame is
+    garbage collected.
+    """
+    cache_key = (id(df), key_col)
+
+    index = _KEY_INDEXES.get(cache_key)
+    if index is None:
+        index = build_key_index(df, key_col)
+        _KEY_INDEXES[cache_key] = index
+        weakref.finalize(df, _KEY_INDEXES.pop, cache_key, None)
+
+    return index
+
+
+# =====================================================
+# Crime window refresh
+# =====================================================
+# ingest_crime_month publishes a new window CSV from one process. Every
+# process checks the latest crime file (name and mtime) at most every
+# CRIME_CHECK_SECONDS and reloads the crime dataset when it is not the
+# one loaded; the generation bump rebuilds everything keyed on it.
+CRIME_CHECK_SECONDS = 2.0
+
+_CRIME_LOCK = threading.Lock()
+_CRIME_SOURCE: tuple[str, int] | None = None
+_CRIME_NEXT_CHECK = 0.0
+
+
+def _crime_source() -> tuple[str, int] | None:
+    try:
+        path = crime_data_path()
+        return path.name, path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def mark_crime_source_loaded() -> None:
+    """
+    Record the latest crime file as the one loaded (the loader does
+    this; ingest_crime_month after installing the frame it built).
+    """
+    global _CRIME_SOURCE
+    _CRIME_SOURCE = _crime_source()
+
+
+def _load_latest_crime_data() -> pd.DataFrame:
+    # Recorded first: a file published mid-load is picked up next check
+    mark_crime_source_loaded()
+    return load_crime_data()
+
+
+def _check_crime_source() -> None:
+    global _CRIME_NEXT_CHECK
+
+    if time.monotonic() < _CRIME_NEXT_CHECK:
+        return
+
+    with _CRIME_LOCK:
+        if time.monotonic() < _CRIME_NEXT_CHECK:
+            return
+        if LOCATION_REGISTRY.is_loaded("crime") and _crime_source() != _CRIME_SOURCE:
+            LOCATION_REGISTRY.unload("crime")
+        _CRIME_NEXT_CHECK = time.monotonic() + CRIME_CHECK_SECONDS
+
+
+# =====================================================
+# Dataset registry
+# =====================================================
+# Nothing is read at import time; each dataset loads (and builds its
+# key index) the first time it is accessed, once per process.
+LOCATION_REGISTRY = DatasetRegistry()
+
+# dataset name → compaction report (only filled in compact mode)
+COMPACTION_REPORTS: dict[str, dict] = {}
+
+
+def _prepare_dataset(name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply compact mode (SCORING_COMPACT_DATASETS=1) before a frame is
+    shared.
+    """
+    if compact_mode_enabled():
+        df, COMPACTION_REPORTS[name] = compact_dataset(df, name)
+    return df
+
+
+def _registry_loader(name: str, loader):
+    def load() -> pd.DataFrame:
+        return _prepare_dataset(name, loader())
+
+    return load
+
+
+for _name, _loader in (
+    ("crime", _load_latest_crime_data),
+    ("seifa", load_seifa_data),
+    ("lga_irsad", load_lga_irsad_data),
+):
+    LOCATION_REGISTRY.register(
+        _name,
+        _registry_loader(_name, _loader),
+        on_load=lambda df, key_col=LOCATION_KEY_COLUMNS[_name]: get_key_index(
+            df, key_col
+        ),
+    )
+
+
+def install_dataset(name: str, df: pd.DataFrame) -> None:
+    """
+    Replace a loaded dataset with a freshly derived frame (e.g. an
+    incremental crime refresh) without re-running its loader.
+    """
+    LOCATION_REGISTRY.replace(name, _prepare_dataset(name, df))
+
+
+# Scoring snapshots pin (content hash, frame) per dataset for the
+# current thread / context only; the registry itself is untouched.
+_PINNED_DATASETS: ContextVar[Mapping[str, tuple[str, pd.DataFrame]] | None] = (
+    ContextVar("pinned_datasets", default=None)
+)
+
+
+@contextmanager
+def use_datasets(frames: Mapping[str, tuple[str, pd.DataFrame]]):
+    """
+    Serve {name: (content_hash, frame)} from get_dataset inside the
+    block instead of the loaded datasets.
+    """
+    token = _PINNED_DATASETS.set(dict(frames))
+    try:
+        yield
+    finally:
+        _PINNED_DATASETS.reset(token)
+
+
+def get_dataset(name: str) -> pd.DataFrame:
+    """
+    Return one location dataset, loading it on first use.
+    """
+    pinned = _PINNED_DATASETS.get()
+    if pinned is not None and name in pinned:
+        return pinned[name][1]
+    if name == "crime":
+        _check_crime_source()
+    return LOCATION_REGISTRY.get(name)
+
+
+def dataset_version(name: str) -> int | str:
+    """
+    Cache key for the frame get_dataset(name) returns: the registry
+    generation, or the content hash of a pinned frame.
+    """
+    pinned = _PINNED_DATASETS.get()
+    if pinned is not None and name in pinned:
+        return pinned[name][0]
+    if name == "crime":
+        _check_crime_source()
+    return LOCATION_REGISTRY.generation(name)
+
+
 # =====================================================
 # Public dataset bundle
 # =====================================================
-def get_location_datasets() -> dict[str, pd.DataFrame]:
+def get_location_datasets() -> LazyDatasets:
     """
-    Load all datasets required for location / neighbourhood risk.
+    Datasets required for location / neighbourhood risk.
+
+    Returns a dict-like view; each dataset is loaded only when first
+    accessed and is then shared across reruns and sessions (treat the
+    frames as read-only). Key indexes are built as part of the load,
+    so row lookups through get_location_inputs are constant time.
     """
-    return {
-        "crime": load_crime_data(),
-        "seifa": load_seifa_data(),
-        "lga_irsad": load_lga_irsad_data(),
-    }
+    _check_crime_source()
+    return LOCATION_REGISTRY.view(list(LOCATION_KEY_COLUMNS))
 
 
 # =====================================================
 # Row-level access helpers
 # =====================================================
 def _get_row_by_key(
-    df: pd.DataFrame,
+    df: pd.DataFrame | None,
     key_col: str,
     key: str | None,
-):
+) -> pd.Series | None:
     if df is None or df.empty or key is None:
         return None
 
     if key_col not in df.columns:
         return None
 
-    matched = df[df[key_col] == key]
-    if matched.empty:
+    pos = get_key_index(df, key_col).get(key)
+    if pos is None:
         return None
 
-    return matched.iloc[0]
+    return df.iloc[pos]
+
+
+def _get_rows_by_keys(
+    df: pd.DataFrame | None,
+    key_col: str,
+    keys: list[str | None],
+) -> pd.DataFrame | None:
+    """
+    Bulk variant of _get_row_by_key.
+
+    Returns one row per requested key, in request order and indexed
+    by the requested key. Keys without a match come back as all-NaN rows.
+    """
+    if df is None or df.empty or key_col not in df.columns:
+        return None
+
+    index = get_key_index(df, key_col)
+    positions = np.array(
+        [index.get(k, -1) if k is not None else -1 for k in keys],
+        dtype=np.int64,
+    )
+    found = positions >= 0
+
+    rows = df.iloc[np.where(found, positions, 0)].reset_index(drop=True)
+    if not found.all():
+        rows = rows.where(np.broadcast_to(found[:, None], rows.shape))
+
+    rows.index = pd.Index(keys, name=key_col)
+    return rows
 
 
 # =====================================================
@@ -158,13 +420,43 @@ def _get_row_by_key(
 # =====================================================
 def get_location_inputs(
     datasets: dict,
-    suburb_key: str,
-    lga_key: str | None = None,
+    suburb_key: str | list[str],
+    lga_key: str | list[str] | None = None,
 ) -> dict:
     """
     Collect all raw inputs required for location risk assessment.
+
+    With a single suburb key each entry is a row (Series) or None.
+    With a list of suburb keys each entry is a DataFrame aligned to
+    the requested keys; lga_key, if given, must be a list of the same
+    length.
     """
 
+    if isinstance(suburb_key, (list, tuple)):
+        suburb_keys = list(suburb_key)
+        lga_keys = list(lga_key) if lga_key is not None else None
+
+        if lga_keys is not None and len(lga_keys) != len(suburb_keys):
+            raise ValueError("suburb_key and lga_key lists must be the same length")
+
+        return {
+            "crime": _get_rows_by_keys(
+                datasets.get("crime"),
+                "SUBURB_KEY",
+                suburb_keys,
+            ),
+            "seifa": _get_rows_by_keys(
+                datasets.get("seifa"),
+                "SUBURB_KEY",
+                suburb_keys,
+            ),
+            "lga": _get_rows_by_keys(
+                datasets.get("lga_irsad"),
+                "LGA_KEY",
+                lga_keys,
+            ) if lga_keys is not None else None,
+        }
+
     return {
         "crime": _get_row_by_key(
             datasets.get("crime"),
@@ -1,24 +1,44 @@
 # =====================================================
 # Utility: Suburb Normalisation
 # =====================================================
+import re
+from functools import lru_cache
+
 import pandas as pd
 
+# Scalar calls (pages, policies) are memoised; bounded so free-text
+# input cannot grow the cache without limit.
+NORMALISE_CACHE_SIZE = 4096
+
+# Noise is removed one token at a time, in this order, as the original
+# chain of .replace calls did: removing one token can join the text
+# around it into another ("CITY O(NSW)F" → "CITY OF" → ""), so a
+# single alternation pass would give different keys. The column form
+# only runs these passes on rows that contain a token at all.
+_STATE_SUFFIXES = ("(NSW)", "(VIC)", "(QLD)", "(WA)", "(SA)", "(TAS)", "(ACT)", "(NT)")
+_SUBURB_NOISE = _STATE_SUFFIXES
+_LGA_NOISE = (*_STATE_SUFFIXES, "COUNCIL", "CITY OF", "CITY")
+
+_SUBURB_NOISE_RE = re.compile("|".join(map(re.escape, _SUBURB_NOISE)))
+_LGA_NOISE_RE = re.compile("|".join(map(re.escape, _LGA_NOISE)))
+_WHITESPACE_RE = re.compile(r"\s+")
+_NOT_PRINTABLE_ASCII_RE = re.compile(r"[^\x20-\x7e]")
+
+
+def _remove_noise(text: str, noise: tuple[str, ...]) -> str:
+    for token in noise:
+        text = text.replace(token, "")
+    return text
+
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def normalise_suburb_name(name: str) -> str:
     if pd.isna(name):
         return ""
-    return (
-        name.upper()
-        .replace("(NSW)", "")
-        .replace("(VIC)", "")
-        .replace("(QLD)", "")
-        .replace("(WA)", "")
-        .replace("(SA)", "")
-        .replace("(TAS)", "")
-        .replace("(ACT)", "")
-        .replace("(NT)", "")
-        .strip()
-    )
+    return _remove_noise(name.upper(), _SUBURB_NOISE).strip()
 
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def normalise_lga_name(name: str) -> str:
     """
     Normalise LGA names for robust matching between:
@@ -35,21 +55,8 @@ def normalise_lga_name(name: str) -> str:
     if not name:
         return ""
 
-    cleaned = (
-        name.upper()
-        .replace("(NSW)", "")
-        .replace("(VIC)", "")
-        .replace("(QLD)", "")
-        .replace("(WA)", "")
-        .replace("(SA)", "")
-        .replace("(TAS)", "")
-        .replace("(ACT)", "")
-        .replace("(NT)", "")
-        .replace("COUNCIL", "")
-        .replace("CITY OF", "")
-        .replace("CITY", "")   # optional but practical
-        .strip()
-    )
+    # CITY removal is optional but practical
+    cleaned = _remove_noise(name.upper(), _LGA_NOISE).strip()
 
     # Collapse multiple spaces into one
     cleaned = " ".join(cleaned.split())
@@ -57,3 +64,69 @@ def normalise_lga_name(name: str) -> str:
     return cleaned
 
 
+# =====================================================
+# Vectorised (column) normalisation
+# =====================================================
+def _normalise_column(
+    names: pd.Series,
+    noise: tuple[str, ...],
+    noise_re: re.Pattern,
+    scalar,
+    collapse_whitespace: bool,
+) -> pd.Series:
+    missing = names.isna()
+    values = names.astype(str)
+
+    cleaned = values.str.upper()
+
+    # Rows without any token are left alone by every pass
+    noisy = cleaned.str.contains(noise_re.pattern, regex=True)
+    if noisy.any():
+        part = cleaned[noisy]
+        for token in noise:
+            part = part.str.replace(token, "", regex=False)
+        cleaned[noisy] = part
+
+    cleaned = cleaned.str.strip()
+
+    if collapse_whitespace:
+        cleaned = cleaned.str.replace(_WHITESPACE_RE.pattern, " ", regex=True)
+
+    # Column upper-casing / trimming can differ from str.upper /
+    # str.strip outside printable ASCII (e.g. "ß", control characters),
+    # so those rows take the scalar path.
+    irregular = values.str.contains(_NOT_PRINTABLE_ASCII_RE.pattern, regex=True)
+    if irregular.any():
+        cleaned[irregular] = values[irregular].map(scalar)
+
+    cleaned[missing] = ""
+    return cleaned
+
+
+def normalise_suburb_names(names: pd.Series) -> pd.Series:
+    """
+    Column form of normalise_suburb_name; same keys, column string
+    operations instead of a Python call per row.
+    """
+    return _normalise_column(
+        names,
+        _SUBURB_NOISE,
+        _SUBURB_NOISE_RE,
+        normalise_suburb_name,
+        collapse_whitespace=False,
+    )
+
+
+def normalise_lga_names(names: pd.Series) -> pd.Series:
+    """
+    Column form of normalise_lga_name.
+    """
+    return _normalise_column(
+        names,
+        _LGA_NOISE,
+        _LGA_NOISE_RE,
+        normalise_lga_name,
+        collapse_whitespace=True,
+    )
+
+
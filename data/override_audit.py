@@ -0,0 +1,297 @@
+# =====================================================
+# Manual override audit log
+# =====================================================
+# Every confirmed manual override is appended here: who changed which
+# component of which assessment, from what to what, under which policy
+# trigger and why. Unlike the assessment store (which only holds the
+# overrides currently applied) the log keeps every entry:
+#
+# - append-only: UPDATE and DELETE are rejected by triggers
+# - entries are buffered and committed in batches by a background
+#   thread with synchronous=FULL, so each batch is one fsync;
+#   record() waits for its entry's commit, so an override is only
+#   applied once its audit entry is durable
+# - indexed on time, (component, time) and (analyst, time), so a
+#   governance query over a date range reads only its own rows however
+#   long the log grows
+#
+# The log is .cache/override_audit.sqlite3 unless OVERRIDE_AUDIT_DB
+# points elsewhere.
+#
+#     python -m data.override_audit --from 2026-01-01 --to 2026-04-01 \
+#         --component Zoning --csv zoning_overrides.csv
+import argparse
+import atexit
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator
+
+from data.sqlite_store import MAX_WRITE_BATCH, BatchedSQLiteStore, dumps, number
+
+
+OVERRIDE_AUDIT_DB_ENV_VAR = "OVERRIDE_AUDIT_DB"
+OVERRIDE_AUDIT_DB_PATH = (
+    Path(__file__).resolve().parents[1] / ".cache" / "override_audit.sqlite3"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS override_audit (
+    id              INTEGER PRIMARY KEY,
+    logged_at       REAL NOT NULL,
+    assessment_id   TEXT,
+    analyst         TEXT,
+    module          TEXT,
+    component       TEXT NOT NULL,
+    original_score  REAL,
+    adjusted_score  REAL,
+    trigger         TEXT,
+    policy          TEXT,
+    justification   TEXT NOT NULL,
+    context         TEXT
+);
+CREATE INDEX IF NOT EXISTS override_audit_logged ON override_audit (logged_at);
+CREATE INDEX IF NOT EXISTS override_audit_component
+    ON override_audit (component, logged_at);
+CREATE INDEX IF NOT EXISTS override_audit_analyst
+    ON override_audit (analyst, logged_at);
+
+CREATE TRIGGER IF NOT EXISTS override_audit_no_update
+BEFORE UPDATE ON override_audit
+BEGIN
+    SELECT RAISE(ABORT, 'override audit log is append-only');
+END;
+
+CREATE TRIGGER IF NOT EXISTS override_audit_no_delete
+BEFORE DELETE ON override_audit
+BEGIN
+    SELECT RAISE(ABORT, 'override audit log is append-only');
+END;
+"""
+
+AUDIT_COLUMNS = [
+    "id",
+    "logged_at",
+    "assessment_id",
+    "analyst",
+    "module",
+    "component",
+    "original_score",
+    "adjusted_score",
+    "trigger",
+    "policy",
+    "justification",
+    "context",
+]
+
+# Longest record() waits for its entry to be committed
+AUDIT_WRITE_TIMEOUT = 30.0
+
+_INSERT = f"""
+INSERT INTO override_audit ({", ".join(AUDIT_COLUMNS[1:])})
+VALUES ({", ".join("?" for _ in AUDIT_COLUMNS[1:])})
+"""
+
+
+def _timestamp(value) -> float | None:
+    """
+    Unix time for a datetime, a date (local midnight), an ISO string or
+    a number.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    return float(value)
+
+
+class OverrideAuditLog(BatchedSQLiteStore):
+    """
+    Append-only log of manual overrides.
+    """
+
+    def __init__(self, path: Path | str | None = None, max_batch: int = MAX_WRITE_BATCH):
+        super().__init__(
+            path or os.environ.get(OVERRIDE_AUDIT_DB_ENV_VAR) or OVERRIDE_AUDIT_DB_PATH,
+            SCHEMA,
+            synchronous="FULL",
+            max_batch=max_batch,
+            name="override audit log",
+        )
+
+    # -------------------------------------------------
+    # Writing (buffered)
+    # -------------------------------------------------
+    def append(
+        self,
+        override: dict,
+        analyst: str | None = None,
+        assessment_id: str | None = None,
+        logged_at: float | None = None,
+    ) -> Future:
+        """
+        Queue one entry. `override` is an applied_overrides record
+        (module, component, original_score, adjusted_score, trigger,
+        policy, justification, context).
+
+        The returned Future completes once the entry is committed.
+        """
+        if not override.get("component"):
+            raise ValueError("An override audit entry needs a component.")
+        if not (override.get("justification") or "").strip():
+            raise ValueError("An override audit entry needs a justification.")
+
+        policy = override.get("policy")
+        return self._submit(
+            [
+                (
+                    _INSERT,
+                    (
+                        logged_at if logged_at is not None else time.time(),
+                        assessment_id,
+                        analyst,
+                        override.get("module"),
+                        override["component"],
+                        number(override.get("original_score")),
+                        number(override.get("adjusted_score")),
+                        override.get("trigger"),
+                        dumps(policy) if policy is not None else None,
+                        override["justification"].strip(),
+                        dumps(override.get("context") or {}),
+                    ),
+                )
+            ]
+        )
+
+    def record(
+        self,
+        override: dict,
+        analyst: str | None = None,
+        assessment_id: str | None = None,
+        timeout: float = AUDIT_WRITE_TIMEOUT,
+    ) -> None:
+        """
+        append() and wait for the commit, for callers that must not
+        apply an override without its audit entry. Raises the write's
+        error, or TimeoutError if it is not committed within `timeout`
+        seconds.
+        """
+        self.append(override, analyst=analyst, assessment_id=assessment_id).result(timeout)
+
+    # -------------------------------------------------
+    # Queries (indexed)
+    # -------------------------------------------------
+    @staticmethod
+    def _where(start, end, component, analyst) -> tuple[str, list]:
+        clauses, params = [], []
+        if component is not None:
+            clauses.append("component = ?")
+            params.append(component)
+        if analyst is not None:
+            clauses.append("analyst = ?")
+            params.append(analyst)
+        if start is not None:
+            clauses.append("logged_at >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            clauses.append("logged_at < ?")
+            params.append(_timestamp(end))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_entries(
+        self,
+        start=None,
+        end=None,
+        component: str | None = None,
+        analyst: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Entries logged in [start, end) for a component and / or analyst,
+        oldest first, streamed from the database.
+
+        start / end  datetime, date (local midnight), ISO string or
+                     unix time; None = unbounded
+        """
+        where, params = self._where(start, end, component, analyst)
+        sql = f"SELECT {', '.join(AUDIT_COLUMNS)} FROM override_audit{where} ORDER BY logged_at, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self._reader().execute(sql, params):
+            entry = dict(row)
+            entry["policy"] = json.loads(entry["policy"]) if entry["policy"] else None
+            entry["context"] = json.loads(entry["context"]) if entry["context"] else {}
+            yield entry
+
+    def entries(self, start=None, end=None, component=None, analyst=None, limit=None) -> list[dict]:
+        """
+        iter_entries() as a list.
+        """
+        return list(self.iter_entries(start, end, component, analyst, limit))
+
+    def count(self, start=None, end=None, component=None, analyst=None) -> int:
+        where, params = self._where(start, end, component, analyst)
+        return self._reader().execute(
+            f"SELECT COUNT(*) FROM override_audit{where}", params
+        ).fetchone()[0]
+
+
+# -------------------------------------------------
+# Shared log for the app process
+# -------------------------------------------------
+_LOG: OverrideAuditLog | None = None
+_LOG_LOCK = threading.Lock()
+
+
+def get_override_audit_log() -> OverrideAuditLog:
+    """
+    The process-wide audit log, opened on first use and flushed on exit.
+    """
+    global _LOG
+
+    if _LOG is None:
+        with _LOG_LOCK:
+            if _LOG is None:
+                _LOG = OverrideAuditLog()
+                atexit.register(_LOG.close)
+    return _LOG
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the manual override audit log")
+    parser.add_argument("--from", dest="start", help="ISO date / time (inclusive)")
+    parser.add_argument("--to", dest="end", help="ISO date / time (exclusive)")
+    parser.add_argument("--component")
+    parser.add_argument("--analyst")
+    parser.add_argument("--csv", type=Path, help="write entries here instead of stdout")
+    args = parser.parse_args()
+
+    log = get_override_audit_log()
+    entries = log.iter_entries(args.start, args.end, args.component, args.analyst)
+
+    out = open(args.csv, "w", newline="", encoding="utf-8") if args.csv else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=AUDIT_COLUMNS)
+        writer.writeheader()
+        for entry in entries:
+            entry["logged_at"] = datetime.fromtimestamp(entry["logged_at"]).isoformat(
+                timespec="seconds"
+            )
+            entry["policy"] = dumps(entry["policy"]) if entry["policy"] else ""
+            entry["context"] = dumps(entry["context"])
+            writer.writerow(entry)
+    finally:
+        if args.csv:
+            out.close()
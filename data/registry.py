@@ -0,0 +1,183 @@
+# =====================================================
+# Lazy dataset registry
+# =====================================================
+# Datasets are registered with a loader and only read the first time
+# something asks for them, so importing data / policies modules costs
+# nothing. Loaded frames are held for the life of the process and
+# shared by every caller (treat them as read-only).
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, Iterator
+
+import pandas as pd
+
+
+class DatasetRegistry:
+    """
+    Process-wide, thread-safe registry of lazily loaded datasets.
+
+    Each dataset is loaded at most once. The registry records which
+    datasets are loaded and how long each load took.
+    """
+
+    def __init__(self):
+        self._loaders: dict[str, Callable[[], pd.DataFrame]] = {}
+        self._on_load: dict[str, Callable[[pd.DataFrame], None] | None] = {}
+        self._datasets: dict[str, pd.DataFrame] = {}
+        self._load_seconds: dict[str, float] = {}
+        # Bumped every time a new frame is installed for a dataset
+        self._generations: dict[str, int] = {}
+        self._locks: dict[str, threading.Lock] = {}
+
+    # -------------------------------------------------
+    # Registration
+    # -------------------------------------------------
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], pd.DataFrame],
+        on_load: Callable[[pd.DataFrame], None] | None = None,
+    ) -> None:
+        """
+        Register a dataset loader. `on_load` runs once on the freshly
+        loaded frame (e.g. to build lookup indexes) and counts towards
+        the recorded load time.
+        """
+        self._loaders[name] = loader
+        self._on_load[name] = on_load
+        self._locks.setdefault(name, threading.Lock())
+
+    def names(self) -> list[str]:
+        return list(self._loaders)
+
+    # -------------------------------------------------
+    # Access
+    # -------------------------------------------------
+    def get(self, name: str) -> pd.DataFrame:
+        """
+        Return the dataset, loading it on first use.
+        """
+        df = self._datasets.get(name)
+        if df is not None:
+            return df
+
+        if name not in self._loaders:
+            raise KeyError(f"Unknown dataset: {name}")
+
+        with self._locks[name]:
+            # Another thread may have finished the load while we waited
+            df = self._datasets.get(name)
+            if df is not None:
+                return df
+
+            start = time.perf_counter()
+            df = self._loaders[name]()
+
+            on_load = self._on_load[name]
+            if on_load is not None:
+                on_load(df)
+
+            self._load_seconds[name] = time.perf_counter() - start
+            self._datasets[name] = df
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+        return df
+
+    def replace(self, name: str, df: pd.DataFrame) -> None:
+        """
+        Install a new frame for a registered dataset, running its
+        on_load hook, without calling the loader.
+        """
+        if name not in self._loaders:
+            raise KeyError(f"Unknown dataset: {name}")
+
+        with self._locks[name]:
+            start = time.perf_counter()
+
+            on_load = self._on_load[name]
+            if on_load is not None:
+                on_load(df)
+
+            self._load_seconds[name] = time.perf_counter() - start
+            self._datasets[name] = df
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._datasets
+
+    def generation(self, name: str) -> int:
+        """
+        How many frames have been installed for a dataset (0 = never
+        loaded). Changes whenever the data a caller would see changes.
+        """
+        return self._generations.get(name, 0)
+
+    def loaded(self) -> list[str]:
+        return [name for name in self._loaders if name in self._datasets]
+
+    def view(self, names: list[str] | None = None) -> "LazyDatasets":
+        """
+        Mapping over (a subset of) the registered datasets that loads
+        each one only when it is accessed.
+        """
+        return LazyDatasets(self, names if names is not None else self.names())
+
+    # -------------------------------------------------
+    # Introspection / maintenance
+    # -------------------------------------------------
+    def report(self) -> dict[str, dict]:
+        """
+        Load status per dataset:
+        {name: {"loaded": bool, "load_seconds": float | None, "rows": int | None}}
+        """
+        return {
+            name: {
+                "loaded": name in self._datasets,
+                "load_seconds": self._load_seconds.get(name),
+                "rows": len(self._datasets[name]) if name in self._datasets else None,
+            }
+            for name in self._loaders
+        }
+
+    def unload(self, name: str | None = None) -> None:
+        """
+        Drop one (or every) loaded dataset; the next access reloads it.
+        """
+        names = [name] if name is not None else list(self._datasets)
+        for n in names:
+            with self._locks[n]:
+                self._datasets.pop(n, None)
+                self._load_seconds.pop(n, None)
+
+
+class LazyDatasets(Mapping):
+    """
+    Read-only dict-like view over a DatasetRegistry.
+
+    Supports the dict API the pages and policies already use
+    (datasets.get("crime"), datasets["seifa"]) without loading
+    datasets nobody asks for.
+    """
+
+    def __init__(self, registry: DatasetRegistry, names: list[str]):
+        self._registry = registry
+        self._names = list(names)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._names:
+            raise KeyError(name)
+        return self._registry.get(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        loaded = set(self._registry.loaded())
+        status = ", ".join(
+            f"{n}{'' if n in loaded else ' (not loaded)'}" for n in self._names
+        )
+        return f"LazyDatasets({status})"
@@ -0,0 +1,281 @@
+# =====================================================
+# State / postcode-aware suburb resolution
+# =====================================================
+# normalise_suburb_name only strips the plain "(NSW)"-style suffixes,
+# so the same suburb name can map to several SEIFA rows (ABBOTSFORD
+# exists in NSW and QLD; ALISON twice in NSW, qualified by LGA).
+# A plain key lookup silently takes the first row.
+#
+# The resolver indexes every SEIFA suburb by its base name (all
+# qualifiers removed), state and postcode, then walks a fallback chain
+# of dictionary lookups and reports how the match was made and whether
+# it was ambiguous.
+#
+# State comes from the first digit of the ABS suburb (SAL) code. The
+# shipped SEIFA file has no postcode column; postcode matching is used
+# only when the dataset provides one.
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from data.features import get_suburb_features, score_suburb_features
+from data.loaders import dataset_version, get_dataset, get_key_index
+from data.normalisation import normalise_lga_name, normalise_suburb_name
+
+
+# ABS SAL code prefix → state / territory
+SAL_STATE_PREFIX = {
+    "1": "NSW",
+    "2": "VIC",
+    "3": "QLD",
+    "4": "SA",
+    "5": "WA",
+    "6": "TAS",
+    "7": "NT",
+    "8": "ACT",
+    "9": "OT",
+}
+
+# States covered by the crime dataset (NSW BOCSAR); suburbs elsewhere
+# get no crime percentile rather than a same-named NSW suburb's
+CRIME_DATASET_STATES = {"NSW"}
+
+# Trailing "(VIC.)" / "(CENTRAL COAST - NSW)" style qualifier
+_QUALIFIER_RE = re.compile(r"\s*\(([^)]*)\)\s*$")
+
+
+def base_suburb_name(key: str) -> str:
+    """
+    Suburb key with any trailing qualifier removed.
+    """
+    return _QUALIFIER_RE.sub("", key)
+
+
+def _qualifier(key: str) -> str:
+    match = _QUALIFIER_RE.search(key)
+    return match.group(1) if match else ""
+
+
+@dataclass(frozen=True)
+class SuburbResolution:
+    """
+    Outcome of a resolve() call.
+
+    key         SUBURB_KEY of the chosen SEIFA row (None if no match)
+    position    row position of that suburb in the SEIFA dataset
+    state       its state / territory
+    matched_on  which step of the fallback chain matched
+    ambiguous   more than one suburb fitted that step
+    candidates  (SUBURB_KEY, state) of every suburb that fitted it
+    fallback    a more specific step (state / postcode) was requested
+                but did not match
+    """
+
+    key: str | None
+    matched_on: str | None
+    position: int | None = None
+    state: str | None = None
+    ambiguous: bool = False
+    candidates: tuple[tuple[str, str], ...] = field(default_factory=tuple)
+    fallback: bool = False
+
+
+class SuburbResolver:
+    """
+    Dictionary-based resolver over the SEIFA suburb list.
+    """
+
+    def __init__(self, seifa: pd.DataFrame):
+        keys = seifa["SUBURB_KEY"].astype(str).tolist()
+        states = [
+            SAL_STATE_PREFIX.get(code[:1], "")
+            for code in seifa["suburb_code"].astype(str).tolist()
+        ] if "suburb_code" in seifa.columns else [""] * len(keys)
+        postcodes = (
+            seifa["postcode"].astype(str).str.strip().tolist()
+            if "postcode" in seifa.columns
+            else None
+        )
+
+        self.has_postcode = postcodes is not None
+        self._keys = keys
+        self._states = states
+
+        # Every index maps to SEIFA row positions, in file order
+        self._by_key: dict[str, list[int]] = {}
+        self._by_base: dict[str, list[int]] = {}
+        self._by_base_state: dict[tuple[str, str], list[int]] = {}
+        self._by_base_state_postcode: dict[tuple[str, str, str], list[int]] = {}
+
+        for pos, key in enumerate(keys):
+            base = base_suburb_name(key)
+            state = states[pos]
+
+            self._by_key.setdefault(key, []).append(pos)
+            self._by_base.setdefault(base, []).append(pos)
+            self._by_base_state.setdefault((base, state), []).append(pos)
+            if postcodes is not None:
+                self._by_base_state_postcode.setdefault(
+                    (base, state, postcodes[pos]), []
+                ).append(pos)
+
+    def _prefer_lga(self, positions: list[int], lga_key: str | None) -> list[int]:
+        """
+        Keep the candidates whose qualifier names the given LGA
+        (e.g. "ALISON (DUNGOG - NSW)" for LGA Dungog), if any do.
+        """
+        if not lga_key or len(positions) < 2:
+            return positions
+
+        narrowed = []
+        for pos in positions:
+            # "CENTRAL COAST - NSW" → "CENTRAL COAST"
+            qualifier_lga = _qualifier(self._keys[pos]).split(" - ")[0].strip()
+            if qualifier_lga and (qualifier_lga in lga_key or lga_key in qualifier_lga):
+                narrowed.append(pos)
+
+        return narrowed or positions
+
+    def resolve(
+        self,
+        suburb: str,
+        state: str | None = None,
+        postcode: str | None = None,
+        lga: str | None = None,
+    ) -> SuburbResolution:
+        """
+        Resolve a raw suburb name using whatever of state / postcode /
+        LGA is known.
+
+        Chain (first hit wins):
+        1. suburb + state + postcode   (only if the dataset has postcodes)
+        2. suburb + state
+        3. exact SUBURB_KEY            (the previous behaviour)
+        4. suburb name alone
+        """
+        key = normalise_suburb_name(suburb) if suburb else ""
+        if not key:
+            return SuburbResolution(key=None, matched_on=None)
+
+        base = base_suburb_name(key)
+        state = state.strip().upper() if state else None
+        postcode = postcode.strip() if postcode else None
+        lga_key = normalise_lga_name(lga) if lga else None
+
+        steps: list[tuple[str, list[int] | None]] = []
+        if state and postcode and self.has_postcode:
+            steps.append(
+                ("suburb+state+postcode",
+                 self._by_base_state_postcode.get((base, state, postcode)))
+            )
+        if state:
+            steps.append(("suburb+state", self._by_base_state.get((base, state))))
+        steps.append(("suburb_key", self._by_key.get(key)))
+        steps.append(("suburb", self._by_base.get(base)))
+
+        requested = steps[0][0]
+
+        for matched_on, positions in steps:
+            if not positions:
+                continue
+
+            positions = self._prefer_lga(positions, lga_key)
+            chosen = positions[0]
+
+            return SuburbResolution(
+                key=self._keys[chosen],
+                matched_on=matched_on,
+                position=chosen,
+                state=self._states[chosen] or None,
+                ambiguous=len(positions) > 1,
+                candidates=tuple((self._keys[p], self._states[p]) for p in positions),
+                fallback=matched_on != requested,
+            )
+
+        return SuburbResolution(key=None, matched_on=None, fallback=bool(state))
+
+
+# -------------------------------------------------
+# Shared resolver over the loaded SEIFA dataset
+# -------------------------------------------------
+_LOCK = threading.Lock()
+_RESOLVER: tuple[int, SuburbResolver] | None = None
+
+# Resolvers over pinned SEIFA snapshots, by content hash; kept apart so
+# a pinned context never replaces the resolver live sessions use
+_PINNED_RESOLVERS: OrderedDict[str, SuburbResolver] = OrderedDict()
+MAX_PINNED_RESOLVERS = 4
+
+
+def get_suburb_resolver() -> SuburbResolver:
+    """
+    Resolver over the SEIFA dataset, built on first use and rebuilt if
+    the dataset is reloaded or replaced.
+    """
+    global _RESOLVER
+
+    seifa = get_dataset("seifa")
+    version = dataset_version("seifa")
+
+    if isinstance(version, str):
+        resolver = _PINNED_RESOLVERS.get(version)
+        if resolver is not None:
+            return resolver
+        with _LOCK:
+            if version not in _PINNED_RESOLVERS:
+                _PINNED_RESOLVERS[version] = SuburbResolver(seifa)
+                while len(_PINNED_RESOLVERS) > MAX_PINNED_RESOLVERS:
+                    _PINNED_RESOLVERS.popitem(last=False)
+            return _PINNED_RESOLVERS[version]
+
+    cached = _RESOLVER
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _LOCK:
+        if _RESOLVER is None or _RESOLVER[0] != version:
+            _RESOLVER = (version, SuburbResolver(seifa))
+        return _RESOLVER[1]
+
+
+def resolve_suburb(
+    suburb: str,
+    state: str | None = None,
+    postcode: str | None = None,
+    lga: str | None = None,
+) -> SuburbResolution:
+    return get_suburb_resolver().resolve(suburb, state, postcode, lga)
+
+
+def resolved_suburb_features(resolution: SuburbResolution) -> dict | None:
+    """
+    Feature row for the SEIFA suburb a resolution picked.
+
+    The precomputed table holds the first row per SUBURB_KEY; any other
+    row (ABBOTSFORD, QLD) is scored on the fly from its own deciles.
+    """
+    if resolution.key is None:
+        return None
+
+    seifa = get_dataset("seifa")
+    if get_key_index(seifa, "SUBURB_KEY").get(resolution.key) == resolution.position:
+        return get_suburb_features(resolution.key)
+
+    row = seifa.iloc[resolution.position]
+
+    crime_percentile = None
+    if resolution.state in CRIME_DATASET_STATES:
+        crime = get_dataset("crime")
+        crime_pos = get_key_index(crime, "SUBURB_KEY").get(resolution.key)
+        if crime_pos is not None:
+            crime_percentile = crime["crime_percentile"].iloc[crime_pos]
+
+    return score_suburb_features(
+        resolution.key,
+        crime_percentile,
+        row["IRSD_decile"],
+        row["IRSAD_decile"],
+    )
@@ -0,0 +1,333 @@
+# =====================================================
+# Reproducible scoring snapshots
+# =====================================================
+# A score is reproducible when we know exactly which data and which
+# policy produced it. Both are content-addressed:
+#
+# - dataset hash = sha256 over the derived frame's column names and
+#   row hashes (whatever file or refresh it came from)
+# - policy hash  = PolicyTables.content_hash (compiled tables + the
+#   scoring rules version, itself a hash of the YAML config)
+#
+# scoring_version() stamps the versions in force; assessment results
+# carry it (stamp_scoring_version also saves each new version the first
+# time a result is stamped with it). SnapshotStore.save() writes each dataset / policy version
+# once under .cache/snapshots, keyed by its hash, and rescoring pins a
+# stored version for the current context only: just the datasets that
+# version names are read, and live scoring is untouched.
+#
+# .cache/snapshots/
+#     datasets/<name>/<hash>.feather
+#     policies/<hash>.json            (scoring rules + policy tables)
+#     versions/<version id>.json      (policy hash + dataset hashes)
+import hashlib
+import json
+import threading
+import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from data.cache import feather, write_atomic
+from data.features import FEATURE_COLUMNS, build_suburb_feature_table
+from data.loaders import BASE_DIR, dataset_version, get_dataset, use_datasets
+from policies.scoring_rules import (
+    get_scoring_rules,
+    scoring_rules_from_dict,
+    scoring_rules_to_dict,
+    use_scoring_rules,
+)
+from policies.tables import (
+    get_policy_tables,
+    policy_tables_from_dict,
+    policy_tables_to_dict,
+    use_policy_tables,
+)
+
+
+SNAPSHOT_DIR = BASE_DIR / ".cache" / "snapshots"
+
+# Datasets a location / neighbourhood score depends on
+SNAPSHOT_DATASETS = ("crime", "seifa", "lga_irsad")
+
+# Pinned frames kept in memory per store
+MAX_LOADED_SNAPSHOTS = 6
+
+
+# =====================================================
+# Content hashes
+# =====================================================
+def frame_content_hash(df: pd.DataFrame) -> str:
+    """
+    Hash of a frame's columns and values (not its index).
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in df.columns]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+# name → (dataset version, hash)
+_DATASET_HASHES: dict[str, tuple[int | str, str]] = {}
+_HASH_LOCK = threading.Lock()
+
+
+def dataset_hash(name: str) -> str:
+    """
+    Content hash of the frame get_dataset(name) currently returns,
+    computed once per loaded frame.
+    """
+    df = get_dataset(name)
+    version = dataset_version(name)
+    if isinstance(version, str):
+        return version
+
+    cached = _DATASET_HASHES.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    content_hash = frame_content_hash(df)
+    with _HASH_LOCK:
+        _DATASET_HASHES[name] = (version, content_hash)
+    return content_hash
+
+
+@dataclass(frozen=True)
+class ScoringVersion:
+    """
+    Which policy and which dataset builds produced a score.
+    """
+
+    policy: str
+    # ((dataset name, content hash), ...) in SNAPSHOT_DATASETS order
+    datasets: tuple[tuple[str, str], ...]
+
+    @property
+    def id(self) -> str:
+        canonical = json.dumps(self.as_dict(), sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def as_dict(self) -> dict:
+        return {"policy": self.policy, "datasets": dict(self.datasets)}
+
+    @classmethod
+    def from_dict(cls, doc: dict) -> "ScoringVersion":
+        return cls(
+            policy=doc["policy"],
+            datasets=tuple((name, h) for name, h in doc["datasets"].items()),
+        )
+
+
+def scoring_version(names: tuple[str, ...] = SNAPSHOT_DATASETS) -> ScoringVersion:
+    """
+    Versions in force for the current context (loads the datasets).
+    """
+    return ScoringVersion(
+        policy=get_policy_tables().content_hash,
+        datasets=tuple((name, dataset_hash(name)) for name in names),
+    )
+
+
+# =====================================================
+# Snapshot store
+# =====================================================
+class SnapshotStore:
+    """
+    Content-addressed store of dataset and policy versions.
+    """
+
+    def __init__(self, root: Path = SNAPSHOT_DIR, max_loaded: int = MAX_LOADED_SNAPSHOTS):
+        self.root = Path(root)
+        self.max_loaded = max_loaded
+        self._frames: OrderedDict[tuple[str, str], pd.DataFrame] = OrderedDict()
+        self._policies: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _dataset_path(self, name: str, content_hash: str) -> Path:
+        return self.root / "datasets" / name / f"{content_hash}.feather"
+
+    def _policy_path(self, content_hash: str) -> Path:
+        return self.root / "policies" / f"{content_hash}.json"
+
+    def _version_path(self, version_id: str) -> Path:
+        return self.root / "versions" / f"{version_id}.json"
+
+    # -------------------------------------------------
+    # Writing
+    # -------------------------------------------------
+    def save(self, names: tuple[str, ...] = SNAPSHOT_DATASETS) -> ScoringVersion:
+        """
+        Snapshot the policy and datasets in force. Versions already in
+        the store are not written again.
+        """
+        if feather is None:
+            raise ImportError("Scoring snapshots need pyarrow")
+
+        version = scoring_version(names)
+
+        for name, content_hash in version.datasets:
+            path = self._dataset_path(name, content_hash)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                df = get_dataset(name).reset_index(drop=True)
+                write_atomic(path, lambda p: feather.write_feather(df, p))
+
+        policy_path = self._policy_path(version.policy)
+        if not policy_path.exists():
+            policy_path.parent.mkdir(parents=True, exist_ok=True)
+            doc = {
+                "scoring_rules": scoring_rules_to_dict(get_scoring_rules()),
+                "policy_tables": policy_tables_to_dict(get_policy_tables()),
+            }
+            write_atomic(
+                policy_path,
+                lambda p: p.write_text(
+                    json.dumps(doc, indent=2, ensure_ascii=False), encoding="utf-8"
+                ),
+            )
+
+        version_path = self._version_path(version.id)
+        if not version_path.exists():
+            version_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(
+                version_path,
+                lambda p: p.write_text(
+                    json.dumps(version.as_dict(), indent=2), encoding="utf-8"
+                ),
+            )
+
+        return version
+
+    # -------------------------------------------------
+    # Reading
+    # -------------------------------------------------
+    def versions(self) -> list[ScoringVersion]:
+        return [
+            ScoringVersion.from_dict(json.loads(p.read_text(encoding="utf-8")))
+            for p in sorted((self.root / "versions").glob("*.json"))
+        ]
+
+    def get_version(self, version_id: str) -> ScoringVersion:
+        path = self._version_path(version_id)
+        if not path.exists():
+            raise KeyError(f"Unknown scoring version: {version_id}")
+        return ScoringVersion.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def load_dataset(self, name: str, content_hash: str) -> pd.DataFrame:
+        """
+        One stored dataset version (kept in a small LRU).
+        """
+        key = (name, content_hash)
+        with self._lock:
+            df = self._frames.get(key)
+            if df is not None:
+                self._frames.move_to_end(key)
+                return df
+
+        path = self._dataset_path(name, content_hash)
+        if not path.exists():
+            raise KeyError(f"Dataset {name} version {content_hash} is not in the store")
+        df = feather.read_feather(path)
+
+        with self._lock:
+            self._frames[key] = df
+            while len(self._frames) > self.max_loaded:
+                self._frames.popitem(last=False)
+        return df
+
+    def load_policy(self, content_hash: str) -> tuple:
+        """
+        (ScoringRules, PolicyTables) of one stored policy version.
+        """
+        policy = self._policies.get(content_hash)
+        if policy is not None:
+            return policy
+
+        path = self._policy_path(content_hash)
+        if not path.exists():
+            raise KeyError(f"Policy version {content_hash} is not in the store")
+        doc = json.loads(path.read_text(encoding="utf-8"))
+
+        rules = scoring_rules_from_dict(doc["scoring_rules"])
+        tables = policy_tables_from_dict(doc["policy_tables"])
+        if tables.rules_version != rules.version:
+            raise ValueError(f"Policy version {content_hash} is inconsistent")
+
+        self._policies[content_hash] = (rules, tables)
+        return rules, tables
+
+    # -------------------------------------------------
+    # Rescoring
+    # -------------------------------------------------
+    @contextmanager
+    def pinned(self, version: ScoringVersion | str, names: tuple[str, ...] | None = None):
+        """
+        Score against a stored version inside the block: the policy
+        functions and get_dataset see the pinned policy and datasets
+        (only `names`, default all of the version's datasets, are read).
+        """
+        if isinstance(version, str):
+            version = self.get_version(version)
+
+        rules, tables = self.load_policy(version.policy)
+        frames = {
+            name: (content_hash, self.load_dataset(name, content_hash))
+            for name, content_hash in version.datasets
+            if names is None or name in names
+        }
+
+        with use_scoring_rules(rules), use_policy_tables(tables), use_datasets(frames):
+            yield version
+
+    def rescore_location(self, suburb_keys, version: ScoringVersion | str) -> pd.DataFrame:
+        """
+        Location features (crime / SEIFA inputs and location scores) for
+        SUBURB_KEYs under a stored version, one row per key in input
+        order. The version is kept in .attrs["scoring_version"].
+        """
+        with self.pinned(version, names=("crime", "seifa")) as pinned:
+            table = build_suburb_feature_table(
+                get_dataset("crime"), get_dataset("seifa")
+            ).set_index("SUBURB_KEY")
+
+        keys = pd.Index(list(suburb_keys), name="SUBURB_KEY")
+        result = table.reindex(keys)[FEATURE_COLUMNS]
+        result.attrs["scoring_version"] = {"id": pinned.id, **pinned.as_dict()}
+        return result
+
+
+# =====================================================
+# Stamping results
+# =====================================================
+_STAMP_LOCK = threading.Lock()
+
+# Version ids this process has already written to the store
+_SAVED_VERSIONS: set[str] = set()
+
+
+def stamp_scoring_version(store: SnapshotStore | None = None) -> ScoringVersion:
+    """
+    Versions in force, for stamping a result. The first time a version
+    id is stamped it is also saved to the snapshot store (default
+    location), so every stamped result can be replayed.
+
+    A store that cannot be written (read-only deployment, full disk)
+    only costs the replay: the version is still returned, with a
+    warning, and saving is retried on the next stamp.
+    """
+    version = scoring_version()
+    if version.id in _SAVED_VERSIONS or feather is None:
+        return version
+
+    with _STAMP_LOCK:
+        if version.id not in _SAVED_VERSIONS:
+            try:
+                version = (store or SnapshotStore()).save()
+            except OSError as exc:
+                warnings.warn(f"Scoring version {version.id} not saved: {exc}")
+                return version
+            _SAVED_VERSIONS.add(version.id)
+    return version
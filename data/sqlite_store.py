@@ -0,0 +1,207 @@
+# =====================================================
+# SQLite store with a background group-commit writer
+# =====================================================
+# Shared by the assessment store and the override audit log.
+#
+# - WAL mode: readers (this or other workers) never block the writer
+# - writes are queued and committed by one background thread, all that
+#   is queued (up to max_batch) in one transaction, so callers never
+#   wait on disk and a burst costs one commit / fsync instead of one
+#   per write
+# - a failed transaction (including a failed COMMIT) is rolled back; a
+#   batch the database was too busy to take is retried as a whole, and
+#   a batch that still fails is retried write by write, so a bad write
+#   only loses itself (kept in last_error)
+# - each write's Future completes when it is committed (or fails with
+#   its error), for callers that must not go on without it
+#
+# A write is a list of (sql, params) statements applied atomically.
+import json
+import queue
+import sqlite3
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+
+
+# Upper bound on writes committed in one transaction
+MAX_WRITE_BATCH = 256
+
+# Attempts (with a growing pause) at a batch that hits a busy / locked
+# database before it is retried write by write
+COMMIT_ATTEMPTS = 5
+COMMIT_RETRY_SECONDS = 0.2
+
+
+def _json_default(value):
+    # Scores can come through as numpy scalars
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+
+def dumps(doc) -> str:
+    return json.dumps(doc, default=_json_default, ensure_ascii=False)
+
+
+def number(value) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class BatchedSQLiteStore:
+    """
+    SQLite database (WAL) whose writes go through a background
+    group-commit thread.
+
+    synchronous  NORMAL: no fsync per commit; a power cut can lose the
+                 last commits but cannot corrupt the database.
+                 FULL: every committed batch is fsynced.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        schema: str,
+        synchronous: str = "NORMAL",
+        max_batch: int = MAX_WRITE_BATCH,
+        name: str = "sqlite-store",
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = synchronous
+        self.max_batch = max_batch
+        self.name = name
+        self.last_error: str | None = None
+
+        self._local = threading.local()
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+
+        conn = self._connect()
+        try:
+            conn.executescript(schema)
+        finally:
+            conn.close()
+
+        self._writer = threading.Thread(
+            target=self._write_loop, name=f"{name}-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """
+        This thread's read connection. Waits for the process's own
+        queued writes first, so a caller reads what it just wrote.
+        """
+        if self._queue.unfinished_tasks:
+            self.flush()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------
+    # Writer
+    # -------------------------------------------------
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            writes = [w for w in batch if w is not None]
+            try:
+                if writes:
+                    self._commit_with_retry(conn, [statements for statements, _ in writes])
+                for _, done in writes:
+                    done.set_result(None)
+            except Exception:
+                # Retry one by one so a bad write only loses itself
+                for statements, done in writes:
+                    try:
+                        self._commit_with_retry(conn, [statements])
+                        done.set_result(None)
+                    except Exception as exc:
+                        self.last_error = f"{type(exc).__name__}: {exc}"
+                        warnings.warn(f"{self.name} write failed: {self.last_error}")
+                        done.set_exception(exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if None in batch:
+                conn.close()
+                return
+
+    @staticmethod
+    def _commit(conn: sqlite3.Connection, writes: list) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statements in writes:
+                for sql, params in statements:
+                    conn.execute(sql, params)
+            conn.execute("COMMIT")
+        except Exception:
+            # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _commit_with_retry(self, conn: sqlite3.Connection, writes: list) -> None:
+        for attempt in range(1, COMMIT_ATTEMPTS + 1):
+            try:
+                self._commit(conn, writes)
+                return
+            except sqlite3.OperationalError as exc:
+                busy = "locked" in str(exc) or "busy" in str(exc)
+                if not busy or attempt == COMMIT_ATTEMPTS:
+                    raise
+                time.sleep(COMMIT_RETRY_SECONDS * attempt)
+
+    def _submit(self, statements: list[tuple[str, tuple]]) -> Future:
+        """
+        Queue one write; the returned Future completes once it is
+        committed, or fails with the error that lost it.
+        """
+        if self._closed:
+            raise RuntimeError(f"{self.name} is closed")
+        done: Future = Future()
+        self._queue.put((statements, done))
+        return done
+
+    def flush(self) -> None:
+        """
+        Wait until every queued write is committed.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Commit what is queued and stop the writer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
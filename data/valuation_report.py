@@ -0,0 +1,376 @@
+# =====================================================
+# Valuation report section extractor
+# =====================================================
+# The land inputs (Zoning Effect, Encumbrances, Title Search Sighted,
+# Site Dimensions, Units / Lot Entitlement, Overlays, Valuation Risk
+# Alerts) sit in the numbered sections 1–8 of a valuation report PDF.
+# This module reads a report page by page, picks those fields out of
+# the text and returns them as a flat dict, so the Land Risk page and
+# the batch scorer (doc/Collateral/data/land_risk_batch.py) no longer
+# depend on copy-paste.
+#
+# - pages are parsed one at a time and reading stops at section 9
+#   (assumptions / disclaimers), so the boilerplate is never parsed
+# - results are cached as JSON by the file's sha256; the same document
+#   is never parsed twice, whatever its file name
+# - extract_valuation_reports() fans uncached files out to a process
+#   pool
+#
+# Bump EXTRACTOR_VERSION when the field patterns change so cached
+# results are re-extracted.
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from data.cache import write_atomic
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - optional dependency
+    PdfReader = None
+
+
+EXTRACTOR_VERSION = 1
+
+REPORT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "valuation_reports"
+
+# Single-line fields: value runs to the end of the line, or up to the
+# next label the report prints on the same line.
+LINE_FIELDS: dict[str, re.Pattern] = {
+    "property_address": re.compile(
+        r"^Property Address:\s*(?P<value>.*?)(?:\s+Page \d+ of \d+)?$"
+    ),
+    "title_search_sighted": re.compile(r"^Title Search Sighted\?\s*(?P<value>.*)$"),
+    "encumbrances": re.compile(r"^Encumbrances\s*/\s*Restrictions:\s*(?P<value>.*)$"),
+    "site_dimensions": re.compile(
+        r"^Site Dimensions:\s*(?P<value>.*?)(?:\s+Site Area:.*)?$"
+    ),
+    "zoning": re.compile(r"^Zoning:\s*(?P<value>.*?)(?:\s+Current Use:.*)?$"),
+    "lga": re.compile(r"^LGA:\s*(?P<value>.*)$"),
+    "units_lot_entitlement": re.compile(
+        r"^Units\s*/\s*Lot Entitlement:\s*(?P<value>.*)$"
+    ),
+    "zoning_effect": re.compile(r"^Zoning Effect:\s*(?P<value>.*)$"),
+}
+
+# Block fields: heading on its own line, value on the lines below it
+# up to the next blank line.
+BLOCK_FIELDS: dict[str, re.Pattern] = {
+    "overlays": re.compile(r"^Overlays:\s*$"),
+}
+
+SECTION_HEADING = re.compile(r"^(?P<number>\d{1,2})\s+(?P<title>[A-Z][A-Z ,&/–-]+)$")
+RISK_ALERTS_HEADING = re.compile(r"^Valuation Risk Alerts:\s*$")
+RISK_ALERT_QUESTION = re.compile(r"^\d+\.\s+(?P<question>.+\?)\s*$")
+
+# Sections 9+ are assumptions, disclaimers and photographs
+LAST_SECTION = 8
+
+FIELDS = list(LINE_FIELDS) + list(BLOCK_FIELDS) + ["valuation_risk_alert"]
+
+
+# =====================================================
+# Page-by-page parsing
+# =====================================================
+class _SectionParser:
+    """
+    Line-oriented state machine fed one page at a time.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, str] = {}
+        self.locations: dict[str, dict] = {}
+        self.risk_alerts: list[dict] = []
+        self.section: str | None = None
+        self.done = False
+
+        self._block: str | None = None
+        self._block_lines: list[str] = []
+        self._in_alerts = False
+        self._question: str | None = None
+
+    def _record(self, field: str, value: str, page: int) -> None:
+        value = value.strip()
+        if value and field not in self.fields:
+            self.fields[field] = value
+            self.locations[field] = {"page": page, "section": self.section}
+
+    def _close_block(self, page: int) -> None:
+        if self._block is not None:
+            self._record(self._block, " ".join(self._block_lines), page)
+        self._block = None
+        self._block_lines = []
+
+    def feed_page(self, text: str, page: int) -> None:
+        for raw in text.splitlines():
+            line = raw.strip()
+
+            heading = SECTION_HEADING.match(line)
+            if heading:
+                self._close_block(page)
+                self._in_alerts = False
+                if int(heading["number"]) > LAST_SECTION:
+                    self.done = True
+                    return
+                self.section = f"{heading['number']} {heading['title'].strip()}"
+                continue
+
+            if self._block is not None:
+                if line:
+                    self._block_lines.append(line)
+                    continue
+                if self._block_lines:
+                    self._close_block(page)
+                continue
+
+            if self._in_alerts:
+                question = RISK_ALERT_QUESTION.match(line)
+                if question:
+                    self._question = question["question"]
+                    continue
+                if self._question and line:
+                    self.risk_alerts.append(
+                        {"question": self._question, "answer": line}
+                    )
+                    self._question = None
+                    continue
+                if not line and self.risk_alerts and self._question is None:
+                    self._in_alerts = False
+                continue
+
+            if RISK_ALERTS_HEADING.match(line):
+                self._in_alerts = True
+                self.locations.setdefault(
+                    "valuation_risk_alert", {"page": page, "section": self.section}
+                )
+                continue
+
+            for field, pattern in BLOCK_FIELDS.items():
+                if pattern.match(line):
+                    self._block = field
+                    break
+            else:
+                for field, pattern in LINE_FIELDS.items():
+                    match = pattern.match(line)
+                    if match:
+                        self._record(field, match["value"], page)
+                        break
+
+    def finish(self, page: int) -> None:
+        self._close_block(page)
+
+        # Binary alert for the scorer: any "Yes" raises it
+        answers = [a["answer"].strip().lower() for a in self.risk_alerts]
+        if answers:
+            self.fields["valuation_risk_alert"] = (
+                "Yes" if "yes" in answers else "No"
+            )
+
+
+def _open_reader(source: Path | bytes):
+    if PdfReader is None:
+        raise ImportError("Reading valuation reports needs pypdf (pip install pypdf)")
+    if isinstance(source, (bytes, bytearray)):
+        return PdfReader(io.BytesIO(source))
+    return PdfReader(str(source))
+
+
+def parse_valuation_report(source: Path | bytes) -> dict:
+    """
+    Extract the land fields from one valuation report PDF (path or
+    raw bytes), without the cache.
+
+    Returns
+    -------
+    dict
+        {
+            "fields": {field: text},          # see FIELDS; missing = not found
+            "locations": {field: {"page", "section"}},
+            "risk_alerts": [{"question", "answer"}],
+            "pages_read": int,
+            "page_count": int,
+        }
+    """
+    reader = _open_reader(source)
+    parser = _SectionParser()
+
+    page_no = 0
+    for page_no, page in enumerate(reader.pages, start=1):
+        parser.feed_page(page.extract_text() or "", page_no)
+        if parser.done:
+            break
+    parser.finish(page_no)
+
+    return {
+        "fields": parser.fields,
+        "locations": parser.locations,
+        "risk_alerts": parser.risk_alerts,
+        "pages_read": page_no,
+        "page_count": len(reader.pages),
+    }
+
+
+# =====================================================
+# Cache by content hash
+# =====================================================
+def _cache_path(cache_dir: Path, sha256: str) -> Path:
+    return Path(cache_dir) / f"{sha256}.json"
+
+
+def _read_cached(cache_dir: Path, sha256: str) -> dict | None:
+    try:
+        cached = json.loads(_cache_path(cache_dir, sha256).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("extractor_version") != EXTRACTOR_VERSION:
+        return None
+    return cached
+
+
+def _write_cached(cache_dir: Path, result: dict) -> None:
+    # A read-only deployment still works, it just never caches.
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            _cache_path(cache_dir, result["sha256"]),
+            lambda p: p.write_text(json.dumps(result, indent=2), encoding="utf-8"),
+        )
+    except OSError:
+        pass
+
+
+def _parse_to_result(source: Path | bytes, sha256: str) -> dict:
+    result = parse_valuation_report(source)
+    result["sha256"] = sha256
+    result["extractor_version"] = EXTRACTOR_VERSION
+    return result
+
+
+def extract_valuation_report(
+    source: Path | bytes,
+    cache_dir: Path = REPORT_CACHE_DIR,
+) -> dict:
+    """
+    parse_valuation_report() with the content-hash cache.
+    Adds "sha256", "extractor_version" and "cached" to the result.
+    """
+    data = source if isinstance(source, (bytes, bytearray)) else Path(source).read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+
+    cached = _read_cached(cache_dir, sha256)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+
+    result = _parse_to_result(bytes(data), sha256)
+    _write_cached(cache_dir, result)
+    result["cached"] = False
+    return result
+
+
+def _extract_file(args: tuple[str, str]) -> dict:
+    path, sha256 = args
+    try:
+        return _parse_to_result(Path(path), sha256)
+    except Exception as exc:
+        # One damaged PDF must not stop the batch
+        return {"sha256": sha256, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def extract_valuation_reports(
+    paths,
+    cache_dir: Path = REPORT_CACHE_DIR,
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    Extract many reports, in input order. Cached documents are read
+    from the cache; the rest are parsed in parallel (workers=1 parses
+    in-process). Identical files are parsed once.
+
+    Each result also carries "source" (the path) and "cached". A file
+    that cannot be parsed gets an "error" instead of fields.
+    """
+    paths = [Path(p) for p in paths]
+    hashes = [hashlib.sha256(p.read_bytes()).hexdigest() for p in paths]
+
+    results: dict[str, dict] = {}
+    todo: dict[str, str] = {}
+    for path, sha256 in zip(paths, hashes):
+        if sha256 in results or sha256 in todo:
+            continue
+        cached = _read_cached(cache_dir, sha256)
+        if cached is not None:
+            cached["cached"] = True
+            results[sha256] = cached
+        else:
+            todo[sha256] = str(path)
+
+    jobs = [(path, sha256) for sha256, path in todo.items()]
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+
+    if workers == 1:
+        parsed = map(_extract_file, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        parsed = pool.map(_extract_file, jobs)
+
+    try:
+        for result in parsed:
+            if "error" not in result:
+                _write_cached(cache_dir, result)
+            result["cached"] = False
+            results[result["sha256"]] = result
+    finally:
+        if workers != 1:
+            pool.shutdown()
+
+    return [
+        {**results[sha256], "source": str(path)}
+        for path, sha256 in zip(paths, hashes)
+    ]
+
+
+def section_record(result: dict, doc_id: str | None = None) -> dict:
+    """
+    Extraction result as an input record for the land risk batch
+    scorer ({"doc_id", "overlay", "zoning_effect", "valuation_risk_alert"}).
+    """
+    fields = result.get("fields", {})
+    return {
+        "doc_id": doc_id or Path(result.get("source", result.get("sha256", ""))).stem,
+        "overlay": fields.get("overlays"),
+        "zoning_effect": fields.get("zoning_effect"),
+        "valuation_risk_alert": fields.get("valuation_risk_alert"),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract valuation report sections")
+    parser.add_argument("pdfs", nargs="+", type=Path, help="PDF files or directories")
+    parser.add_argument("--jsonl", type=Path, help="write batch scorer records here")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    pdfs = []
+    for p in args.pdfs:
+        pdfs.extend(sorted(p.glob("*.pdf")) if p.is_dir() else [p])
+
+    extracted = extract_valuation_reports(pdfs, workers=args.workers)
+
+    if args.jsonl:
+        with open(args.jsonl, "w", encoding="utf-8") as fh:
+            for r in extracted:
+                if "error" not in r:
+                    fh.write(json.dumps(section_record(r), ensure_ascii=False) + "\n")
+
+    for r in extracted:
+        status = r.get("error") or (
+            f"{len(r['fields'])} fields, {r['pages_read']}/{r['page_count']} pages"
+            + (" (cached)" if r["cached"] else "")
+        )
+        print(f"{Path(r['source']).name}: {status}")
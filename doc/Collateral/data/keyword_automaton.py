@@ -0,0 +1,126 @@
+"""
+Land Risk – Planning & Legal
+Keyword Automaton (shared by the wording classifiers)
+
+Source: Valuation Report wording benchmarks
+Version: 1.0
+Purpose:
+    - Compile a {risk_level: [keywords]} table once
+    - Find every keyword occurrence in a report section in one pass
+    - Apply the conservative "highest risk level wins" rule
+    - Return the matched spans as evidence
+"""
+
+# =========================================================
+# 1. Matching backend
+# =========================================================
+# pyahocorasick (C Aho-Corasick) is used when installed. Without it,
+# each keyword is located with str.find, which runs in C and is
+# several times faster than an Aho-Corasick automaton written in
+# pure Python. Both backends return the same matches.
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+# =========================================================
+# 2. Keyword Automaton
+# =========================================================
+
+class KeywordAutomaton:
+    """
+    Multi-keyword matcher over a {risk_level: [keywords]} table.
+
+    Parameters
+    ----------
+    keywords : dict
+        Risk level → keywords (lower case).
+    priority : list
+        Risk levels, highest risk first. The first level with any
+        match wins.
+    """
+
+    def __init__(self, keywords: dict, priority: list, use_c_backend: bool = True):
+        missing = [level for level in keywords if level not in priority]
+        if missing:
+            raise ValueError(f"Risk levels missing from priority: {missing}")
+
+        self.priority = list(priority)
+        self._rank = {level: i for i, level in enumerate(self.priority)}
+
+        # keyword → highest-risk level it is listed under
+        self._level = {}
+        for level in self.priority:
+            for keyword in keywords.get(level, []):
+                keyword = keyword.lower()
+                if keyword and keyword not in self._level:
+                    self._level[keyword] = level
+
+        self._automaton = None
+        if use_c_backend and ahocorasick is not None and self._level:
+            automaton = ahocorasick.Automaton()
+            for keyword, level in self._level.items():
+                automaton.add_word(keyword, (keyword, level))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find_all(self, text: str) -> list:
+        """
+        Every keyword occurrence (overlapping ones included), ordered by
+        position.
+
+        Returns
+        -------
+        list of dict
+            {"keyword", "risk_level", "start", "end"}; start / end index
+            the input text (its lower-cased form if lower-casing changed
+            the length).
+        """
+        if not isinstance(text, str) or not text:
+            return []
+
+        lowered = text.lower()
+        matches = []
+
+        if self._automaton is not None:
+            for end, (keyword, level) in self._automaton.iter(lowered):
+                start = end - len(keyword) + 1
+                matches.append((start, keyword, level))
+        else:
+            for keyword, level in self._level.items():
+                start = lowered.find(keyword)
+                while start != -1:
+                    matches.append((start, keyword, level))
+                    start = lowered.find(keyword, start + 1)
+
+        matches.sort(key=lambda m: (m[0], -len(m[1])))
+
+        return [
+            {
+                "keyword": keyword,
+                "risk_level": level,
+                "start": start,
+                "end": start + len(keyword),
+            }
+            for start, keyword, level in matches
+        ]
+
+    def classify(self, text: str, default: str = "unknown") -> tuple:
+        """
+        Highest risk level matched in the text, plus the evidence for
+        that level.
+
+        Returns
+        -------
+        tuple
+            (risk_level, evidence) – evidence lists the matches of the
+            winning level; (default, []) when nothing matched.
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return default, []
+
+        level = min((m["risk_level"] for m in matches), key=self._rank.__getitem__)
+        return level, [m for m in matches if m["risk_level"] == level]
@@ -0,0 +1,335 @@
+"""
+Land Risk – Planning & Legal
+Batch Scoring Pipeline
+
+Source: Extracted valuation report sections (directory or JSONL)
+Version: 1.0
+Purpose:
+    - Stream extracted valuation sections from disk
+    - Score overlays, zoning effect and valuation risk alerts in
+      chunks across a process pool
+    - Write one row per document (scores + evidence) to a columnar file
+    - Report throughput in documents per second
+
+Input record (one JSON object per document):
+    {
+        "doc_id": "16_Middleton_Avenue",        # optional
+        "overlay": "<overlay wording>",
+        "zoning_effect": "<zoning wording>",
+        "valuation_risk_alert": "Yes" | "No"
+    }
+
+Usage:
+    python land_risk_batch.py sections.jsonl scores.parquet --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+try:
+    from .land_risk_overlays import score_overlay_effect
+    from .land_risk_zoning_effect import score_zoning_effect
+    from .land_risk_valuation_risk_alerts import score_valuation_risk_alert
+except ImportError:
+    from land_risk_overlays import score_overlay_effect
+    from land_risk_zoning_effect import score_zoning_effect
+    from land_risk_valuation_risk_alerts import score_valuation_risk_alert
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+# =========================================================
+# 1. Pipeline Settings
+# =========================================================
+
+CHUNK_SIZE = 500
+
+# Chunks queued per worker; bounds memory on very large inputs
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+OUTPUT_COLUMNS = [
+    "doc_id",
+    "source",
+    "overlay_risk_level",
+    "overlay_score",
+    "overlay_evidence",
+    "zoning_risk_level",
+    "zoning_score",
+    "zoning_evidence",
+    "valuation_risk_level",
+    "valuation_risk_score",
+    "error",
+]
+
+_SCORE_COLUMNS = {"overlay_score", "zoning_score", "valuation_risk_score"}
+
+
+def _output_schema():
+    return pa.schema(
+        [
+            (col, pa.int64() if col in _SCORE_COLUMNS else pa.string())
+            for col in OUTPUT_COLUMNS
+        ]
+    )
+
+# =========================================================
+# 2. Streaming Input
+# =========================================================
+
+def _read_jsonl(path: Path):
+    with open(path, encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            source = f"{path.name}:{line_no}"
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield {"source": source, "error": f"invalid JSON: {exc}"}
+                continue
+            yield {"source": source, "record": record}
+
+
+def iter_sections(source):
+    """
+    Yield extracted section records one at a time.
+
+    Parameters
+    ----------
+    source : str or Path
+        A .jsonl file, or a directory of .jsonl / .json files
+        (read in name order, one level deep).
+
+    Yields
+    ------
+    dict
+        {"source": "<file>[:line]", "record": dict}
+        or {"source": ..., "error": str} for unreadable records.
+    """
+
+    source = Path(source)
+
+    if source.is_file():
+        yield from _read_jsonl(source)
+        return
+
+    for path in sorted(source.iterdir()):
+        if path.suffix == ".jsonl":
+            yield from _read_jsonl(path)
+        elif path.suffix == ".json":
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError as exc:
+                yield {"source": path.name, "error": f"invalid JSON: {exc}"}
+                continue
+            yield {"source": path.name, "record": record}
+
+# =========================================================
+# 3. Per-Document Scoring (runs in the worker processes)
+# =========================================================
+
+def _evidence_json(evidence: list) -> str:
+    return json.dumps(evidence, ensure_ascii=False)
+
+
+def score_section(item: dict) -> dict:
+    """
+    Score one extracted record into a flat output row.
+    """
+
+    record = item.get("record")
+    error = item.get("error")
+
+    if record is not None and not isinstance(record, dict):
+        error = "record is not a JSON object"
+        record = None
+    record = record or {}
+
+    overlay = score_overlay_effect(record.get("overlay"))
+    zoning = score_zoning_effect(record.get("zoning_effect"))
+    alert = score_valuation_risk_alert(record.get("valuation_risk_alert"))
+
+    doc_id = record.get("doc_id")
+
+    return {
+        "doc_id": str(doc_id) if doc_id is not None else item["source"],
+        "source": item["source"],
+        "overlay_risk_level": overlay["overlay_risk_level"],
+        "overlay_score": overlay["overlay_score"],
+        "overlay_evidence": _evidence_json(overlay["overlay_evidence"]),
+        "zoning_risk_level": zoning["zoning_risk_level"],
+        "zoning_score": zoning["zoning_score"],
+        "zoning_evidence": _evidence_json(zoning["zoning_evidence"]),
+        "valuation_risk_level": alert["valuation_risk_level"],
+        "valuation_risk_score": alert["valuation_risk_score"],
+        "error": error,
+    }
+
+
+def score_chunk(items: list) -> dict:
+    """
+    Score a chunk of records; returns the rows as columns.
+    """
+
+    rows = [score_section(item) for item in items]
+    return {col: [row[col] for row in rows] for col in OUTPUT_COLUMNS}
+
+# =========================================================
+# 4. Columnar Output
+# =========================================================
+
+class _ColumnarWriter:
+    """
+    Appends column chunks to Parquet (pyarrow) or, without pyarrow,
+    to CSV.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._parquet = None
+        self._csv_header = True
+
+        if self.path.suffix != ".csv":
+            self.path = self.path.with_suffix(".parquet" if pa is not None else ".csv")
+
+    def write(self, columns: dict) -> None:
+        if self.path.suffix == ".parquet":
+            schema = _output_schema()
+            table = pa.table(columns, schema=schema)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, schema)
+            self._parquet.write_table(table)
+            return
+
+        import pandas as pd
+
+        pd.DataFrame(columns, columns=OUTPUT_COLUMNS).to_csv(
+            self.path,
+            mode="w" if self._csv_header else "a",
+            header=self._csv_header,
+            index=False,
+        )
+        self._csv_header = False
+
+    def close(self) -> None:
+        if self._parquet is None and self._csv_header:
+            # No documents: still leave a file with the schema / header
+            self.write({col: [] for col in OUTPUT_COLUMNS})
+        if self._parquet is not None:
+            self._parquet.close()
+
+# =========================================================
+# 5. Batch Runner
+# =========================================================
+
+def _chunks(items, size: int):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(source, output, workers: int = None, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Score every extracted section under `source` and write the rows
+    to `output` (.parquet, or .csv).
+
+    Parameters
+    ----------
+    workers : int, optional
+        Worker processes (default: CPU count). 1 scores in-process.
+    chunk_size : int
+        Documents per task sent to a worker.
+
+    Returns
+    -------
+    dict
+        {
+            "documents": int,
+            "errors": int,
+            "seconds": float,
+            "docs_per_second": float,
+            "output": str,
+            "workers": int,
+            "chunk_size": int
+        }
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    workers = workers or os.cpu_count() or 1
+    writer = _ColumnarWriter(output)
+
+    documents = 0
+    errors = 0
+    start = time.perf_counter()
+
+    def collect(columns: dict) -> None:
+        nonlocal documents, errors
+        writer.write(columns)
+        documents += len(columns["doc_id"])
+        errors += sum(e is not None for e in columns["error"])
+
+    chunks = _chunks(iter_sections(source), chunk_size)
+
+    try:
+        if workers == 1:
+            for chunk in chunks:
+                collect(score_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Keep a bounded queue of chunks in flight, written in
+                # input order
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(score_chunk, chunk))
+                    if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+
+    return {
+        "documents": documents,
+        "errors": errors,
+        "seconds": seconds,
+        "docs_per_second": documents / seconds if seconds > 0 else 0.0,
+        "output": str(writer.path),
+        "workers": workers,
+        "chunk_size": chunk_size,
+    }
+
+# =========================================================
+# 6. Command Line
+# =========================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch land risk scoring")
+    parser.add_argument("source", help="JSONL file or directory of extracted sections")
+    parser.add_argument("output", help="output file (.parquet or .csv)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    report = run_batch(args.source, args.output, args.workers, args.chunk_size)
+    print(
+        f"{report['documents']} documents ({report['errors']} errors) "
+        f"in {report['seconds']:.2f}s – {report['docs_per_second']:.0f} docs/s "
+        f"→ {report['output']}"
+    )
@@ -10,6 +10,11 @@ Purpose:
     - Assign numeric overlay score for land risk assessment
 """
 
+try:
+    from .keyword_automaton import KeywordAutomaton
+except ImportError:
+    from keyword_automaton import KeywordAutomaton
+
 # =========================================================
 # 1. Overlay Keyword Benchmarks
 #    (Derived from valuation report wording patterns)
@@ -52,6 +57,12 @@ OVERLAY_KEYWORDS = {
     ]
 }
 
+# Conservative risk-first principle: highest risk level wins
+OVERLAY_RISK_PRIORITY = ["very_high", "high", "medium", "low"]
+
+# Compiled once; rebuild if OVERLAY_KEYWORDS is changed at runtime
+OVERLAY_AUTOMATON = KeywordAutomaton(OVERLAY_KEYWORDS, OVERLAY_RISK_PRIORITY)
+
 # =========================================================
 # 2. Overlay Risk Level → Score Mapping
 # =========================================================
@@ -84,18 +95,25 @@ def classify_overlay_effect(overlay_text: str) -> str:
         'low', 'medium', 'high', 'very_high', or 'unknown'
     """
 
-    if not isinstance(overlay_text, str):
-        return "unknown"
+    return match_overlay_keywords(overlay_text)[0]
+
 
-    text = overlay_text.lower().strip()
+def match_overlay_keywords(overlay_text: str) -> tuple:
+    """
+    Classify overlay wording and return the keyword matches behind the
+    classification.
 
-    # Conservative risk-first principle
-    for level in ["very_high", "high", "medium", "low"]:
-        for keyword in OVERLAY_KEYWORDS[level]:
-            if keyword in text:
-                return level
+    Returns
+    -------
+    tuple
+        (risk_level, evidence) – evidence is a list of
+        {"keyword", "risk_level", "start", "end"} for the winning level.
+    """
+
+    if not isinstance(overlay_text, str):
+        return "unknown", []
 
-    return "unknown"
+    return OVERLAY_AUTOMATON.classify(overlay_text)
 
 # =========================================================
 # 4. Overlay Effect Scoring Wrapper (Recommended Entry Point)
@@ -114,16 +132,18 @@ def score_overlay_effect(overlay_text: str) -> dict:
     dict
         {
             "overlay_risk_level": str,
-            "overlay_score": int
+            "overlay_score": int,
+            "overlay_evidence": list   # matched keywords and spans
         }
     """
 
-    risk_level = classify_overlay_effect(overlay_text)
+    risk_level, evidence = match_overlay_keywords(overlay_text)
     score = OVERLAY_SCORE_MAP.get(risk_level, OVERLAY_SCORE_MAP["unknown"])
 
     return {
         "overlay_risk_level": risk_level,
-        "overlay_score": score
+        "overlay_score": score,
+        "overlay_evidence": evidence
     }
 
 # =========================================================
@@ -9,6 +9,11 @@ Purpose:
     - Assign numeric zoning score for land risk assessment
 """
 
+try:
+    from .keyword_automaton import KeywordAutomaton
+except ImportError:
+    from keyword_automaton import KeywordAutomaton
+
 # =========================================================
 # 1. Zoning Effect Keyword Benchmarks
 #    (Derived from valuation report wording patterns)
@@ -59,6 +64,12 @@ ZONING_KEYWORDS = {
     ]
 }
 
+# Risk-first principle: higher risk levels win
+ZONING_RISK_PRIORITY = ["very_high", "high", "medium_high", "medium", "low"]
+
+# Compiled once; rebuild if ZONING_KEYWORDS is changed at runtime
+ZONING_AUTOMATON = KeywordAutomaton(ZONING_KEYWORDS, ZONING_RISK_PRIORITY)
+
 # =========================================================
 # 2. Zoning Risk Level → Score Mapping
 # =========================================================
@@ -92,19 +103,25 @@ def classify_zoning_effect(zoning_text: str) -> str:
         'low', 'medium', 'medium_high', 'high', 'very_high', or 'unknown'
     """
 
-    if not isinstance(zoning_text, str):
-        return "unknown"
+    return match_zoning_keywords(zoning_text)[0]
+
 
-    text = zoning_text.lower().strip()
+def match_zoning_keywords(zoning_text: str) -> tuple:
+    """
+    Classify zoning wording and return the keyword matches behind the
+    classification.
 
-    # Risk-first principle:
-    # Always check higher risk levels first
-    for level in ["very_high", "high", "medium_high", "medium", "low"]:
-        for keyword in ZONING_KEYWORDS[level]:
-            if keyword in text:
-                return level
+    Returns
+    -------
+    tuple
+        (risk_level, evidence) – evidence is a list of
+        {"keyword", "risk_level", "start", "end"} for the winning level.
+    """
+
+    if not isinstance(zoning_text, str):
+        return "unknown", []
 
-    return "unknown"
+    return ZONING_AUTOMATON.classify(zoning_text)
 
 # =========================================================
 # 4. Zoning Effect Scoring Wrapper (Recommended Entry Point)
@@ -123,16 +140,18 @@ def score_zoning_effect(zoning_text: str) -> dict:
     dict
         {
             "zoning_risk_level": str,
-            "zoning_score": int
+            "zoning_score": int,
+            "zoning_evidence": list   # matched keywords and spans
         }
     """
 
-    risk_level = classify_zoning_effect(zoning_text)
+    risk_level, evidence = match_zoning_keywords(zoning_text)
     score = ZONING_SCORE_MAP.get(risk_level, ZONING_SCORE_MAP["unknown"])
 
     return {
         "zoning_risk_level": risk_level,
-        "zoning_score": score
+        "zoning_score": score,
+        "zoning_evidence": evidence
     }
 
 # =========================================================
@@ -1,11 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from policies.scoring_rules import (
+    band_categorical,
+    classify,
+    classify_array,
+    get_scoring_rules,
+)
+
+
 # =====================================================
 # Composite Location Risk Classification
 # =====================================================
 
 def classify_composite_location_risk(score: float):
-    if score < 40:
-        return "High Risk", "#E74C3C"   # red
-    elif score < 70:
-        return "Moderate Risk", "#F1C40F"  # amber
-    else:
-        return "Low Risk", "#2ECC71"    # green
+    """
+    (label, colour) from composite.bands in config/risk_weights.yaml.
+    """
+    band = classify(get_scoring_rules().composite_bands, score)
+    return band.label, band.icon
+
+
+def classify_composite_location_risk_batch(
+    scores,
+) -> tuple[pd.Categorical, pd.Categorical]:
+    """
+    Vector form of classify_composite_location_risk.
+    Returns (labels, colours); NaN scores get missing values.
+    """
+    bands = get_scoring_rules().composite_bands
+    scores = np.asarray(scores, dtype=np.float64)
+
+    codes = np.where(np.isnan(scores), -1, classify_array(bands, scores))
+
+    return (
+        band_categorical(codes, [b.label for b in bands]),
+        band_categorical(codes, [b.icon for b in bands]),
+    )
+
+
+# =====================================================
+# Component Classification
+# =====================================================
+
+def classify_component_score(component: str, score: float | None):
+    """
+    (label, icon) for a single component score, e.g. after a manual
+    override: location.bands for Location, zoning.bands (the 70 / 50
+    component scale) for the others. ("Unknown", None) when unscored.
+    """
+    if score is None:
+        return "Unknown", None
+
+    rules = get_scoring_rules()
+    bands = rules.location_bands if component == "Location" else rules.zoning_bands
+    band = classify(bands, score)
+    return band.label, band.icon
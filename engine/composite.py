@@ -1,4 +1,40 @@
-from typing import List, Dict
+from typing import List, Dict, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from engine.classification import (
+    classify_composite_location_risk,
+    classify_composite_location_risk_batch,
+)
+from policies.scoring_rules import round_score
+
+
+def _accumulate(
+    scored: List[tuple[str, float]],
+    weights: Mapping[str, float] | None,
+) -> tuple[float, float, Mapping[str, float]]:
+    """
+    Weighted sum and total weight over (name, score) pairs that all
+    have a score, in order. None weights = equal weights.
+    """
+    if weights is None:
+        equal_weight = 1 / len(scored) if scored else 0.0
+        weights = {name: equal_weight for name, _ in scored}
+
+    total_score = 0.0
+    total_weight = 0.0
+
+    for name, score in scored:
+        w = weights.get(name, 0)
+
+        if w <= 0:
+            continue
+
+        total_score += score * w
+        total_weight += w
+
+    return total_score, total_weight, weights
 
 
 def compute_location_neighbourhood_score(
@@ -27,38 +63,14 @@ def compute_location_neighbourhood_score(
     if not valid_results:
         raise ValueError("No valid risk scores found.")
 
-    # -----------------------------
-    # Default equal weights
-    # -----------------------------
-    if weights is None:
-        equal_weight = 1 / len(valid_results)
-        weights = {
-            r["risk_name"]: equal_weight
-            for r in valid_results
-        }
-
-    # -----------------------------
-    # Weighted aggregation
-    # -----------------------------
-    total_score = 0.0
-    total_weight = 0.0
-
-    for r in valid_results:
-        name = r["risk_name"]
-        score = r["score"]
-
-        w = weights.get(name, 0)
-
-        if w <= 0:
-            continue
-
-        total_score += score * w
-        total_weight += w
+    total_score, total_weight, weights = _accumulate(
+        [(r["risk_name"], r["score"]) for r in valid_results], weights
+    )
 
     if total_weight == 0:
         raise ValueError("Total weight is zero. Check weight configuration.")
 
-    final_score = round(total_score / total_weight, 1)
+    final_score = round_score(total_score / total_weight)
 
     # -----------------------------
     # Debug output
@@ -73,3 +85,221 @@ def compute_location_neighbourhood_score(
         }
 
     return final_score  # 👈 ③ 原 return 留在这里
+
+
+# =====================================================
+# Incremental composite (manual overrides)
+# =====================================================
+class CompositeScore:
+    """
+    Composite neighbourhood score of one assessment, kept current as
+    manual overrides change single components.
+
+    Holds each component's score and the weighted totals. update()
+    swaps one component and re-accumulates the totals over the
+    components in assessment order (a fixed handful, so constant time),
+    which keeps the result identical to compute_location_neighbourhood_score
+    on the overridden scores. Adjusting the totals by subtract-and-add
+    instead lets float error flip the 1 dp rounding.
+
+    weights  None = equal weights over the components that have a
+             score, as in compute_location_neighbourhood_score
+    """
+
+    def __init__(
+        self,
+        scores: Mapping[str, float | None],
+        weights: Mapping[str, float] | None = None,
+    ):
+        self.components = tuple(scores)
+        self._scores = dict(scores)
+        self._weights = dict(weights) if weights is not None else None
+        self._refresh()
+
+        # Score before any override
+        self.base_score = self.score
+
+    @classmethod
+    def from_components(
+        cls,
+        components: Mapping[str, Mapping],
+        weights: Mapping[str, float] | None = None,
+    ) -> "CompositeScore":
+        """
+        From an assessment's {"Location": {"score": ...}, ...} mapping.
+        """
+        return cls({name: comp.get("score") for name, comp in components.items()}, weights)
+
+    def __contains__(self, component: str) -> bool:
+        return component in self._scores
+
+    def score_of(self, component: str) -> float | None:
+        return self._scores[component]
+
+    def _refresh(self) -> None:
+        scored = [
+            (name, self._scores[name])
+            for name in self.components
+            if self._scores[name] is not None
+        ]
+        self.total_score, self.total_weight, _ = _accumulate(scored, self._weights)
+
+        if self.total_weight > 0:
+            self.score = round_score(self.total_score / self.total_weight)
+            self.label, self.icon = classify_composite_location_risk(self.score)
+        else:
+            self.score = None
+            self.label, self.icon = None, None
+
+    def update(self, component: str, score: float | None) -> Dict:
+        """
+        Set one component's score (e.g. an override's adjusted_score)
+        and return the new composite:
+
+            {
+                "component", "component_score",
+                "score", "previous_score", "delta",
+                "label", "icon"
+            }
+
+        delta is None when either composite is undefined.
+        """
+        if component not in self._scores:
+            raise KeyError(f"Unknown component: {component}")
+
+        previous = self.score
+        if self._scores[component] != score:
+            self._scores[component] = score
+            self._refresh()
+
+        delta = None
+        if previous is not None and self.score is not None:
+            delta = round_score(self.score - previous)
+
+        return {
+            "component": component,
+            "component_score": score,
+            "score": self.score,
+            "previous_score": previous,
+            "delta": delta,
+            "label": self.label,
+            "icon": self.icon,
+        }
+
+
+# =====================================================
+# Batch composite (portfolio rescoring)
+# =====================================================
+def compute_location_neighbourhood_scores(
+    scores,
+    weights: Mapping[str, float] | Sequence[float] | None = None,
+    missing: np.ndarray | None = None,
+    components: Sequence[str] | None = None,
+    contributions: bool = False,
+) -> pd.DataFrame:
+    """
+    Matrix form of compute_location_neighbourhood_score.
+
+    scores      (applications × components) array, or a DataFrame whose
+                columns are the component names (e.g. "Location",
+                "Zoning", "Lga", "Marketability")
+    weights     per-component weights (mapping by name or a vector in
+                column order); None = equal weights over the components
+                present in each row, as in the scalar path
+    missing     optional boolean mask of scores to ignore; NaN scores
+                are always ignored
+    components  column names when `scores` is a plain array
+
+    Each row is renormalised over its present, positively weighted
+    components. Rows where nothing remains get a NaN score and no
+    label (the scalar path raises instead).
+
+    Returns a DataFrame with score, label, icon (classified as in
+    classify_composite_location_risk) and total_weight, plus one
+    contribution_<component> column per component if requested
+    (weight share × score, summing to the unrounded score).
+    """
+    index = None
+    if isinstance(scores, pd.DataFrame):
+        index = scores.index
+        components = list(scores.columns)
+        matrix = scores.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        matrix = np.asarray(scores, dtype=np.float64)
+        if matrix.ndim != 2:
+            raise ValueError("Scores must be an (applications × components) array.")
+        if components is None:
+            components = [f"component_{i}" for i in range(matrix.shape[1])]
+
+    n_rows, n_cols = matrix.shape
+    if len(components) != n_cols:
+        raise ValueError("Component names do not match the score columns.")
+
+    present = ~np.isnan(matrix)
+    if missing is not None:
+        missing = np.asarray(missing, dtype=bool)
+        if missing.shape != matrix.shape:
+            raise ValueError("Missing-mask shape does not match the scores.")
+        present &= ~missing
+
+    # -----------------------------
+    # Weight matrix
+    # -----------------------------
+    if weights is None:
+        counts = present.sum(axis=1)
+        with np.errstate(divide="ignore"):
+            equal_weight = np.where(counts > 0, 1 / counts, 0.0)
+        weight_matrix = np.broadcast_to(equal_weight[:, None], matrix.shape)
+    else:
+        if isinstance(weights, Mapping):
+            vector = np.array(
+                [weights.get(c, 0) for c in components], dtype=np.float64
+            )
+        else:
+            vector = np.asarray(weights, dtype=np.float64)
+            if vector.shape != (n_cols,):
+                raise ValueError("Weight vector does not match the score columns.")
+        weight_matrix = np.broadcast_to(vector, matrix.shape)
+
+    used = present & (weight_matrix > 0)
+
+    # -----------------------------
+    # Weighted aggregation (column by column, in the scalar path's
+    # accumulation order)
+    # -----------------------------
+    total_score = np.zeros(n_rows)
+    total_weight = np.zeros(n_rows)
+
+    for j in range(n_cols):
+        use = used[:, j]
+        w = weight_matrix[:, j]
+        total_score = np.where(use, total_score + matrix[:, j] * w, total_score)
+        total_weight = np.where(use, total_weight + w, total_weight)
+
+    has_score = total_weight > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        raw_score = np.where(has_score, total_score / total_weight, np.nan)
+    final_score = round_score(raw_score)
+
+    labels, icons = classify_composite_location_risk_batch(final_score)
+
+    result = pd.DataFrame(
+        {
+            "score": final_score,
+            "label": labels,
+            "icon": icons,
+            "total_weight": total_weight,
+        },
+        index=index,
+    )
+
+    if contributions:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(used, weight_matrix / total_weight[:, None], 0.0)
+            contribution = np.where(
+                has_score[:, None], share * np.where(used, matrix, 0.0), np.nan
+            )
+        for j, name in enumerate(components):
+            result[f"contribution_{name}"] = contribution[:, j]
+
+    return result
@@ -0,0 +1,347 @@
+# =====================================================
+# What-if sensitivity over weight and threshold grids
+# =====================================================
+# Answers "how would the portfolio's ratings move if crime weighed 0.5
+# instead of 0.4, or the Low Risk cut-off moved from 70 to 75?" for a
+# whole grid of scenarios at once.
+#
+# - component scores are scored once (applications × components)
+# - every weight vector is applied together as a (scenarios ×
+#   applications) array, accumulated component by component in the
+#   scalar path's order, so a scenario equal to the live config gives
+#   the live scores exactly
+# - each threshold set re-bands those scores with a few comparisons
+# - baseline → scenario rating migrations for every grid point come
+#   from a single bincount
+from dataclasses import dataclass
+from itertools import product
+from typing import Mapping, Sequence
+import time
+
+import numpy as np
+import pandas as pd
+
+from engine.composite import compute_location_neighbourhood_scores
+from policies.location import assess_location_risk_batch
+from policies.scoring_rules import (
+    LOCATION_COMPONENTS,
+    Band,
+    get_scoring_rules,
+    round_score,
+)
+
+
+UNKNOWN_RATING = "Unknown"
+
+# Upper bound on (grid points × applications) held in memory at once
+SCENARIO_BLOCK_CELLS = 4_000_000
+
+
+@dataclass(frozen=True)
+class SensitivityResult:
+    """
+    Rating migrations for every (weights, thresholds) grid point.
+
+    scenarios   one row per grid point: its weights (weight_<component>)
+                and cut-offs (threshold_<i>), the number of applications
+                per rating, and changed / upgraded / downgraded counts
+    migrations  (scenarios × ratings × ratings) counts, baseline rating
+                on the rows, scenario rating on the columns
+    ratings     rating labels, best first, then "Unknown"
+    """
+
+    scenarios: pd.DataFrame
+    migrations: np.ndarray
+    ratings: tuple[str, ...]
+    baseline: pd.Categorical
+    seconds: float
+
+    def migration_matrix(self, scenario: int) -> pd.DataFrame:
+        """
+        Baseline (rows) → scenario (columns) counts for one grid point.
+        """
+        return pd.DataFrame(
+            self.migrations[scenario],
+            index=pd.Index(self.ratings, name="baseline"),
+            columns=pd.Index(self.ratings, name="scenario"),
+        )
+
+
+# =====================================================
+# Grid helpers
+# =====================================================
+def weight_grid(
+    options: Mapping[str, Sequence[float]],
+    components: Sequence[str],
+) -> np.ndarray:
+    """
+    Cartesian product of per-component weight options, e.g.
+    weight_grid({"crime": [0.4, 0.5], "irsd": [0.3], "irsad": [0.2, 0.3]},
+    LOCATION_COMPONENTS) → 4 × 3 array in component order.
+    """
+    missing = [c for c in components if c not in options]
+    if missing:
+        raise ValueError(f"No weight options for: {missing}")
+
+    return np.array(
+        list(product(*(options[c] for c in components))), dtype=np.float64
+    )
+
+
+def _threshold_kind(bands: tuple[Band, ...]) -> str:
+    # Validation guarantees all conditional bands use the same side
+    return "min" if bands[0].min is not None else "below"
+
+
+def band_thresholds(bands: tuple[Band, ...]) -> tuple[float, ...]:
+    """
+    Cut-offs of a band table in band order (the fallback has none).
+    """
+    kind = _threshold_kind(bands)
+    return tuple(getattr(b, kind) for b in bands[:-1])
+
+
+def _check_thresholds(thresholds: np.ndarray, kind: str, size: int) -> None:
+    if thresholds.ndim != 2 or thresholds.shape[1] != size:
+        raise ValueError(f"Each threshold set needs {size} cut-offs")
+    steps = np.diff(thresholds, axis=1)
+    # Bands are checked in order: min cut-offs descend, below ascend
+    if (steps > 0).any() if kind == "min" else (steps < 0).any():
+        raise ValueError("Threshold cut-offs are out of band order")
+
+
+# =====================================================
+# Core engine
+# =====================================================
+def _weighted_scores(matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    (scenarios × applications) composite scores, renormalised over each
+    row's present components and rounded as the scalar path rounds
+    (round_score).
+    """
+    present = ~np.isnan(matrix)
+    values = np.where(present, matrix, 0.0)
+
+    n_scenarios = weights.shape[0]
+    n_rows = matrix.shape[0]
+    total_score = np.zeros((n_scenarios, n_rows))
+    total_weight = np.zeros((n_scenarios, n_rows))
+
+    for j in range(matrix.shape[1]):
+        w = weights[:, j][:, None]
+        use = present[:, j][None, :] & (w > 0)
+        total_score = np.where(use, total_score + values[:, j] * w, total_score)
+        total_weight = np.where(use, total_weight + w, total_weight)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            total_weight > 0, round_score(total_score / total_weight), np.nan
+        )
+
+
+def _band_codes(scores: np.ndarray, thresholds: np.ndarray, kind: str) -> np.ndarray:
+    """
+    Band index per score for one threshold set; NaN → len(thresholds) + 1
+    (Unknown).
+    """
+    codes = np.zeros(scores.shape, dtype=np.int64)
+    if kind == "min":
+        # First band whose min the score reaches
+        for cut in thresholds:
+            codes += scores < cut
+    else:
+        # First band whose upper bound the score is below
+        for cut in thresholds:
+            codes += scores >= cut
+    return np.where(np.isnan(scores), len(thresholds) + 1, codes)
+
+
+def rating_sensitivity(
+    scores,
+    weights,
+    bands: tuple[Band, ...],
+    thresholds=None,
+    baseline_scores=None,
+    components: Sequence[str] | None = None,
+) -> SensitivityResult:
+    """
+    Re-rate a portfolio under every combination of weight vector and
+    threshold set.
+
+    scores           (applications × components) scores, or a DataFrame
+                     whose columns are the components; NaN = missing
+    weights          (weight sets × components) array, or a list of
+                     {component: weight} mappings
+    bands            band table the ratings come from
+    thresholds       (threshold sets × cut-offs); None = the bands' own
+    baseline_scores  ratings are migrated from these scores under the
+                     unchanged bands (the wrappers pass the live scores)
+
+    Grid points run weights-major: scenario = w * len(thresholds) + t.
+    """
+    start = time.perf_counter()
+
+    if isinstance(scores, pd.DataFrame):
+        components = list(scores.columns)
+        matrix = scores.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        matrix = np.asarray(scores, dtype=np.float64)
+        if components is None:
+            components = [f"component_{i}" for i in range(matrix.shape[1])]
+    if matrix.ndim != 2 or matrix.shape[1] != len(components):
+        raise ValueError("Scores must be an (applications × components) array.")
+
+    if len(weights) and isinstance(weights[0], Mapping):
+        weights = [[w.get(c, 0) for c in components] for w in weights]
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 2 or weights.shape[1] != len(components):
+        raise ValueError("Weight grid does not match the score columns.")
+
+    kind = _threshold_kind(bands)
+    live_cuts = np.array(band_thresholds(bands), dtype=np.float64)
+    if thresholds is None:
+        thresholds = live_cuts[None, :]
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    _check_thresholds(thresholds, kind, len(live_cuts))
+
+    ratings = (*(b.label for b in bands), UNKNOWN_RATING)
+    n_ratings = len(ratings)
+
+    if baseline_scores is None:
+        baseline_scores = _weighted_scores(matrix, weights[:1])[0]
+    baseline = _band_codes(
+        np.asarray(baseline_scores, dtype=np.float64), live_cuts, kind
+    )
+
+    # -----------------------------
+    # Broadcast scoring / banding, a block of weight sets at a time
+    # -----------------------------
+    n_rows = matrix.shape[0]
+    n_cells = n_ratings * n_ratings
+    block = max(1, SCENARIO_BLOCK_CELLS // max(n_rows * len(thresholds), 1))
+
+    blocks = []
+    for first in range(0, len(weights), block):
+        scenario_scores = _weighted_scores(matrix, weights[first:first + block])
+
+        # (weight sets × threshold sets × applications) → grid points
+        codes = np.stack(
+            [_band_codes(scenario_scores, cuts, kind) for cuts in thresholds],
+            axis=1,
+        ).reshape(-1, n_rows)
+        n_block = codes.shape[0]
+
+        # One bincount for every migration matrix in the block
+        flat = (
+            np.arange(n_block)[:, None] * n_cells
+            + baseline[None, :] * n_ratings
+            + codes
+        )
+        blocks.append(
+            np.bincount(flat.ravel(), minlength=n_block * n_cells)
+            .reshape(n_block, n_ratings, n_ratings)
+        )
+
+    migrations = np.concatenate(blocks)
+    n_scenarios = len(migrations)
+
+    # -----------------------------
+    # Scenario summary
+    # -----------------------------
+    # Present ratings best first: band 0 is the best rating for
+    # min-bands (higher score = safer) and the worst for below-bands
+    if kind == "below":
+        order = [*range(n_ratings - 2, -1, -1), n_ratings - 1]
+        ratings = tuple(ratings[i] for i in order)
+        migrations = migrations[:, order][:, :, order]
+
+    rank = np.arange(n_ratings - 1)
+    better = rank[None, :] < rank[:, None]
+    worse = rank[None, :] > rank[:, None]
+
+    rated_moves = migrations[:, :-1, :-1]
+    summary = {"scenario": np.arange(n_scenarios)}
+    for j, name in enumerate(components):
+        summary[f"weight_{name}"] = np.repeat(weights[:, j], len(thresholds))
+    for k in range(thresholds.shape[1]):
+        summary[f"threshold_{k + 1}"] = np.tile(thresholds[:, k], len(weights))
+    for i, label in enumerate(ratings):
+        summary[label] = migrations[:, :, i].sum(axis=1)
+    summary["changed"] = (
+        migrations.sum(axis=(1, 2)) - np.trace(migrations, axis1=1, axis2=2)
+    )
+    summary["upgraded"] = (rated_moves * better).sum(axis=(1, 2))
+    summary["downgraded"] = (rated_moves * worse).sum(axis=(1, 2))
+
+    baseline_labels = pd.Categorical.from_codes(
+        baseline, [*(b.label for b in bands), UNKNOWN_RATING]
+    ).reorder_categories(list(ratings))
+
+    return SensitivityResult(
+        scenarios=pd.DataFrame(summary),
+        migrations=migrations,
+        ratings=ratings,
+        baseline=baseline_labels,
+        seconds=time.perf_counter() - start,
+    )
+
+
+# =====================================================
+# Portfolio wrappers
+# =====================================================
+def location_sensitivity(
+    inputs: pd.DataFrame,
+    weights,
+    thresholds=None,
+) -> SensitivityResult:
+    """
+    Location score sensitivity (calculate_location_score).
+
+    inputs   location inputs (crime_percentile, IRSD_decile,
+             IRSAD_decile) or the crime_score / irsd_score / irsad_score
+             columns of assess_location_risk_batch
+    weights  grid over LOCATION_COMPONENTS (see weight_grid)
+    thresholds  grid over the location.bands cut-offs (min, descending),
+             e.g. [(75, 50), (80, 50)]
+
+    Baseline = the live location ratings.
+    """
+    score_columns = [f"{c}_score" for c in LOCATION_COMPONENTS]
+    if not set(score_columns).issubset(inputs.columns):
+        inputs = assess_location_risk_batch(inputs)
+
+    scores = inputs[score_columns].set_axis(list(LOCATION_COMPONENTS), axis=1)
+
+    rules = get_scoring_rules()
+    live_weights = np.array([[w for _, w in rules.location_weights]])
+    baseline = _weighted_scores(
+        scores.to_numpy(dtype=np.float64, na_value=np.nan), live_weights
+    )[0]
+
+    return rating_sensitivity(
+        scores, weights, rules.location_bands, thresholds, baseline
+    )
+
+
+def composite_sensitivity(
+    scores: pd.DataFrame,
+    weights,
+    thresholds=None,
+) -> SensitivityResult:
+    """
+    Composite neighbourhood score sensitivity
+    (compute_location_neighbourhood_score).
+
+    scores   one column per component (e.g. Location, Zoning, Lga,
+             Marketability); NaN = missing
+    weights  grid over those columns
+    thresholds  grid over the composite.bands cut-offs (below,
+             ascending), e.g. [(40, 70), (40, 75)]
+
+    Baseline = the live composite ratings (equal weights).
+    """
+    baseline = compute_location_neighbourhood_scores(scores)["score"].to_numpy()
+
+    return rating_sensitivity(
+        scores, weights, get_scoring_rules().composite_bands, thresholds, baseline
+    )
@@ -3,16 +3,23 @@
 # =====================================================
 import streamlit as st
 
-from utils.session import init_session_state
+from utils.session import (
+    assessment_query,
+    init_session_state,
+    persist_assessment,
+    set_neighbourhood_result,
+)
 from data.normalisation import (
     normalise_suburb_name,
     normalise_lga_name,
 )
 
-from data.loaders import get_location_datasets
-from data.location import get_location_inputs
+from data.features import location_result_from_features
+from data.fuzzy import suggest_suburbs
+from data.autocomplete import complete_lgas, complete_suburbs, get_lga_index
+from data.resolver import resolve_suburb, resolved_suburb_features
+from data.snapshots import stamp_scoring_version
 
-from policies.location import assess_location_risk
 from policies.narratives.location_narrative import build_location_narrative
 from policies.zoning import assess_zoning_risk
 from policies.lga import assess_lga_risk
@@ -41,12 +48,6 @@ st.set_page_config(
 )
 
 
-# =====================================================
-# Load Data (cached)
-# =====================================================
-datasets = get_location_datasets()
-
-
 # =====================================================
 # Header
 # =====================================================
@@ -66,6 +67,29 @@ st.subheader("📍 Property Address")
 
 address_line = st.text_input("Street Address")
 suburb = st.text_input("Suburb")
+
+# -------- Typo-tolerant suburb match --------
+suburb_key = normalise_suburb_name(suburb) if suburb else ""
+
+if suburb_key and resolve_suburb(suburb_key).key is None:
+    # Completions of a partly typed name first, then near misses
+    suggestions = [key for key, _ in complete_suburbs(suburb)]
+    suggestions += [
+        key for key, _ in suggest_suburbs(suburb) if key not in suggestions
+    ]
+
+    if suggestions:
+        # Nothing is substituted until the analyst picks a suggestion
+        keep_label = f"Keep as entered ({suburb.strip()})"
+        choice = st.selectbox(
+            "Suburb not found – did you mean",
+            [keep_label] + suggestions,
+        )
+        if choice != keep_label:
+            suburb_key = choice
+    else:
+        st.caption("Suburb not found in the location datasets.")
+
 state = st.selectbox(
     "State / Territory",
     ["NSW", "VIC", "QLD", "WA", "SA", "TAS", "ACT", "NT"],
@@ -143,6 +167,21 @@ lga = st.text_input(
     help="e.g. City of Sydney, Parramatta City Council",
 )
 
+# -------- LGA completion --------
+if lga and normalise_lga_name(lga) not in get_lga_index():
+    lga_suggestions = [name for _, name in complete_lgas(lga)]
+
+    if lga_suggestions:
+        keep_label = f"Keep as entered ({lga.strip()})"
+        choice = st.selectbox(
+            "LGA not found – did you mean",
+            [keep_label] + lga_suggestions,
+        )
+        if choice != keep_label:
+            lga = choice
+    else:
+        st.caption("LGA not found in the IRSAD dataset.")
+
 st.markdown("---")
 
 
@@ -174,7 +213,8 @@ if all([address_line, suburb, postcode]):
     # -------- Input signature（防止无脑清 session）--------
     input_signature = (
         address_line.strip(),
-        suburb.strip(),
+        suburb_key,
+        state,
         postcode.strip(),
         zoning_value,
         lga.strip() if lga else "",
@@ -186,44 +226,34 @@ if all([address_line, suburb, postcode]):
         st.session_state["_last_neighbourhood_input"] = input_signature
 
     # -------- Normalised keys --------
-    suburb_key = normalise_suburb_name(suburb)
     lga_key = normalise_lga_name(lga) if lga else None
 
-    # -------- Fetch raw rows --------
-    location_inputs = get_location_inputs(
-        datasets,
-        suburb_key=suburb_key,
-        lga_key=lga_key,
-    )
+    # -------- Resolve suburb (state / postcode / LGA aware) --------
+    resolution = resolve_suburb(suburb_key, state, postcode, lga)
+
+    if resolution.fallback and resolution.key is not None:
+        st.warning(
+            f"{suburb.strip()} was not found in {state}; "
+            f"using {resolution.key} ({resolution.state})."
+        )
+    elif resolution.ambiguous:
+        st.caption(
+            "Several suburbs match: "
+            + ", ".join(f"{key} ({cand_state})" for key, cand_state in resolution.candidates)
+            + f". Using {resolution.key} – enter the LGA to narrow this down."
+        )
 
-    crime_row = location_inputs.get("crime")
-    seifa_row = location_inputs.get("seifa")
+    suburb_features = resolved_suburb_features(resolution)
 
     # -------- Extract indicators --------
     crime_percentile = (
-        float(crime_row["crime_percentile"])
-        if crime_row is not None and "crime_percentile" in crime_row
-        else None
-    )
-
-    irsd_decile = (
-        int(seifa_row["IRSD_decile"])
-        if seifa_row is not None and "IRSD_decile" in seifa_row
-        else None
-    )
-
-    irsad_decile = (
-        int(seifa_row["IRSAD_decile"])
-        if seifa_row is not None and "IRSAD_decile" in seifa_row
-        else None
+        suburb_features["crime_percentile"] if suburb_features else None
     )
+    irsd_decile = suburb_features["IRSD_decile"] if suburb_features else None
+    irsad_decile = suburb_features["IRSAD_decile"] if suburb_features else None
 
     # -------- Location assessment --------
-    location_result = assess_location_risk(
-        crime_percentile=crime_percentile,
-        irsd_decile=irsd_decile,
-        irsad_decile=irsad_decile,
-    )
+    location_result = location_result_from_features(suburb_features)
 
     location_result["rationale"] = build_location_narrative(
         crime_percentile=crime_percentile,
@@ -257,24 +287,23 @@ if all([address_line, suburb, postcode]):
 
 
     # -------- Composite score --------
-    composite_score = round(
-        compute_location_neighbourhood_score(
-            results=[
-                location_result,
-                zoning_result,
-                lga_result,
-                marketability_result,
-            ]
-        ),
-        1,
+    composite_score = compute_location_neighbourhood_score(
+        results=[
+            location_result,
+            zoning_result,
+            lga_result,
+            marketability_result,
+        ]
     )
 
     composite_label, composite_icon = classify_composite_location_risk(
         composite_score
     )
 
-    # -------- Persist to session --------
-    st.session_state["neighbourhood_result"] = {
+    # -------- Persist to session / store --------
+    version = stamp_scoring_version()
+
+    result = {
         "score": composite_score,
         "label": composite_label,
         "icon": composite_icon,
@@ -297,8 +326,13 @@ if all([address_line, suburb, postcode]):
             "Lga": lga_result,
             "Marketability": marketability_result,
         },
+        # Policy + dataset content hashes, for audit replays
+        "scoring_version": {"id": version.id, **version.as_dict()},
     }
 
+    # Session only; stored when the analyst moves on (below)
+    set_neighbourhood_result(result, input_signature)
+
 
 # =====================================================
 # Navigation
@@ -310,14 +344,18 @@ with col1:
         "📊 Show Detailed Neighbourhood Risk Results",
         use_container_width=True,
     ):
-        st.switch_page("pages/3_Neighbourhood_Risk_Results.py")
+        persist_assessment()
+        st.switch_page(
+            "pages/3_Neighbourhood_Risk_Results.py", query_params=assessment_query()
+        )
 
 with col2:
     if st.button(
         "➡️ Continue to Land Risk Assessment",
         use_container_width=True,
     ):
-        st.switch_page("pages/4_Land_Risk.py")
+        persist_assessment()
+        st.switch_page("pages/4_Land_Risk.py", query_params=assessment_query())
 
 
 # =====================================================
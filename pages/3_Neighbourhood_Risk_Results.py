@@ -5,8 +5,10 @@ import streamlit as st
 import streamlit.components.v1 as components
 import html
 
-from utils.session import init_session_state
+from utils.session import assessment_query, init_session_state, save_manual_override
 from policies.zoning import ZONING_POLICY_REGISTRY
+from engine.composite import CompositeScore
+from engine.classification import classify_component_score
 
 # =====================================================
 # Session Init
@@ -65,40 +67,30 @@ st.markdown(
 st.markdown("---")
 
 # -------------------------------------------------
-# Recalculate composite score using overridden values
+# Composite score with overridden values
 # -------------------------------------------------
-component_scores = []
+# One CompositeScore per assessment; only components whose override
+# changed since the last render are updated.
+composite = result.get("composite")
+if composite is None:
+    composite = CompositeScore.from_components(components_data)
+    result["composite"] = composite
 
 for name, comp in components_data.items():
-    base_score = comp.get("score")
-
+    current = comp.get("score")
     if name in applied_overrides:
-        base_score = applied_overrides[name]["adjusted_score"]
-
-    if base_score is not None:
-        component_scores.append(base_score)
+        current = applied_overrides[name]["adjusted_score"]
 
-if component_scores:
-    score = round(sum(component_scores) / len(component_scores), 1)
+    if composite.score_of(name) != current:
+        composite.update(name, current)
 
 # =====================================================
 # Composite Neighbourhood Risk
 # =====================================================
 st.subheader("📌 Neighbourhood Risk")
 
-# ❌ 不要再用 result.get("score")
-# score = result.get("score")
-
-# ✅ 用 override 后重新算的 score
-final_score = score
-
-# 根据 final_score 动态算 label
-if final_score >= 70:
-    label = "Low Risk"
-elif final_score >= 50:
-    label = "Moderate Risk"
-else:
-    label = "Elevated Risk"
+final_score = composite.score if composite.score is not None else "—"
+label = composite.label or "Unknown"
 
 if label == "Low Risk":
     bg, bar, text = "#f1f8f4", "#2e7d32", "#2e7d32"
@@ -155,6 +147,12 @@ components.html(
     height=140,
 )
 
+if None not in (composite.base_score, composite.score) and composite.score != composite.base_score:
+    st.caption(
+        f"Manual overrides moved the composite from {composite.base_score} "
+        f"to {composite.score} ({composite.score - composite.base_score:+.1f})."
+    )
+
 # =====================================================
 # Risk Component Breakdown
 # =====================================================
@@ -181,16 +179,12 @@ for name, comp in components_data.items():
     rationale = comp.get("rationale", "See detailed policy interpretation")
 
     # -------------------------------------------------
-    # 🔑 Dynamic risk label derived from CURRENT score
+    # 🔑 Risk label from the policy bands for the CURRENT score
     # -------------------------------------------------
-    if score is None:
-        label = "Unknown"
-    elif score >= 70:
-        label = "Low Risk"
-    elif score >= 50:
-        label = "Moderate Risk"
+    if is_manually_reviewed:
+        label, _ = classify_component_score(name, score)
     else:
-        label = "Elevated Risk"
+        label = comp.get("label") or classify_component_score(name, score)[0]
 
     # -------------------------------------------------
     # Visual priority: Manual Reviewed > Policy Warning > Normal
@@ -356,8 +350,8 @@ if manual_review_target:
     )
 
     if st.button("⚠️ Request Manual Override for Zoning", use_container_width=True):
-        st.session_state["manual_override"] = manual_review_target
-        st.switch_page("pages/5_Manual_Review.py")
+        save_manual_override(manual_review_target)
+        st.switch_page("pages/5_Manual_Review.py", query_params=assessment_query())
 
 # =====================================================
 # Navigation
@@ -366,11 +360,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("⬅️ Back to Neighbourhood Assessment", use_container_width=True):
-        st.switch_page("pages/2_Neighbourhood_Risk.py")
+        st.switch_page("pages/2_Neighbourhood_Risk.py", query_params=assessment_query())
 
 with col2:
     if st.button("➡️ Continue to Land Risk Assessment", use_container_width=True):
-        st.switch_page("pages/4_Land_Risk.py")
+        st.switch_page("pages/4_Land_Risk.py", query_params=assessment_query())
 
 # =====================================================
 # Disclaimer
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from data.valuation_report import PdfReader, extract_valuation_report
+
 st.set_page_config(
     page_title="Land Risk Assessment",
     layout="centered"
@@ -13,6 +15,58 @@ st.caption("Collateral · Land Risk Factors")
 
 st.markdown("---")
 
+# =====================================================
+# Valuation Report (optional PDF extraction)
+# =====================================================
+st.subheader("📄 Valuation Report")
+
+report_fields = {}
+
+if PdfReader is None:
+    st.caption("Install pypdf to read valuation report PDFs directly.")
+else:
+    report_pdf = st.file_uploader(
+        "Upload the valuation report to pre-fill the zoning-effect commentary",
+        type=["pdf"]
+    )
+
+    if report_pdf is not None:
+        try:
+            report = extract_valuation_report(report_pdf.getvalue())
+        except Exception as exc:
+            st.error(f"Could not read the valuation report: {exc}")
+        else:
+            report_fields = report["fields"]
+
+            if not report_fields:
+                st.warning("No valuation report sections found in this PDF.")
+            else:
+                extracted_rows = [
+                    ("Title Search Sighted", "title_search_sighted"),
+                    ("Encumbrances / Restrictions", "encumbrances"),
+                    ("Site Dimensions", "site_dimensions"),
+                    ("Zoning", "zoning"),
+                    ("Units / Lot Entitlement", "units_lot_entitlement"),
+                    ("Zoning Effect", "zoning_effect"),
+                    ("Overlays", "overlays"),
+                    ("Valuation Risk Alert", "valuation_risk_alert"),
+                ]
+                st.table(
+                    {
+                        "Field": [label for label, _ in extracted_rows],
+                        "Valuation Report": [
+                            report_fields.get(key, "Not found")
+                            for _, key in extracted_rows
+                        ],
+                        "Section": [
+                            report["locations"].get(key, {}).get("section") or "–"
+                            for _, key in extracted_rows
+                        ],
+                    }
+                )
+
+st.markdown("---")
+
 # =====================================================
 # Planning & Legal
 # =====================================================
@@ -46,6 +100,7 @@ st.markdown(
 
 zoning_effect_text = st.text_area(
     label="",
+    value=report_fields.get("zoning_effect", ""),
     placeholder=(
         "Example statements commonly used in valuation reports:\n\n"
         "• Residential use is permitted under current zoning.\n"
@@ -64,6 +119,21 @@ zoning_effect_text = st.text_area(
 st.markdown("---")
 st.subheader("📑 Title & Encumbrance")
 
+# Free text in the report; the ratings below are the analyst's call
+title_notes = [
+    (label, report_fields[key])
+    for label, key in (
+        ("Title search sighted", "title_search_sighted"),
+        ("Encumbrances / restrictions", "encumbrances"),
+    )
+    if report_fields.get(key)
+]
+if title_notes:
+    st.caption(
+        "From the valuation report (not applied to the fields below): "
+        + "; ".join(f"{label}: {value}" for label, value in title_notes)
+    )
+
 col1, col2 = st.columns(2)
 
 with col1:
@@ -4,7 +4,15 @@
 import streamlit as st
 import streamlit.components.v1 as components
 
-from utils.session import init_session_state
+from data.override_audit import get_override_audit_log
+from utils.session import (
+    assessment_query,
+    current_assessment_id,
+    init_session_state,
+    persist_assessment,
+    save_applied_overrides,
+    save_manual_override,
+)
 
 # =====================================================
 # Session Init
@@ -191,6 +199,15 @@ justification = st.text_area(
     height=140,
 )
 
+# Recorded with the override in the audit log (the signed-in user
+# when authentication is configured)
+signed_in_analyst = st.user.get("email")
+analyst = st.text_input(
+    "Reviewing Analyst (Required)",
+    value=signed_in_analyst or "",
+    disabled=signed_in_analyst is not None,
+)
+
 # =====================================================
 # Action Buttons
 # =====================================================
@@ -201,19 +218,20 @@ col1, col2 = st.columns(2)
 with col1:
     if st.button("❌ Cancel Override", use_container_width=True):
         # 不做任何修改，直接返回结果页
-        st.switch_page("pages/3_Neighbourhood_Risk_Results.py")
+        st.switch_page(
+            "pages/3_Neighbourhood_Risk_Results.py", query_params=assessment_query()
+        )
 
 with col2:
     if st.button("✅ Confirm Override", use_container_width=True):
         if not justification.strip():
             st.error("Override justification is required.")
+        elif not analyst.strip():
+            st.error("Reviewing analyst is required.")
         else:
-            # -------------------------------------------------
-            # Apply manual override (persist to session)
-            # -------------------------------------------------
             applied_overrides = st.session_state.get("applied_overrides", {})
 
-            applied_overrides[component] = {
+            override = {
                 # 元信息（可审计）
                 "module": module,
                 "component": component,
@@ -229,17 +247,40 @@ with col2:
                 "justification": justification.strip(),
             }
 
-            st.session_state["applied_overrides"] = applied_overrides
+            # -------------------------------------------------
+            # Append-only audit trail first: an override is only
+            # applied once its audit entry is committed
+            # -------------------------------------------------
+            try:
+                get_override_audit_log().record(
+                    override,
+                    analyst=analyst.strip(),
+                    assessment_id=current_assessment_id() or persist_assessment(),
+                )
+            except Exception as exc:
+                st.error(
+                    "The override could not be recorded in the audit log and "
+                    f"has not been applied. Please try again. ({exc})"
+                )
+                st.stop()
+
+            # -------------------------------------------------
+            # Apply manual override (persist to session / store)
+            # -------------------------------------------------
+            applied_overrides[component] = override
+            save_applied_overrides(applied_overrides)
 
             # 清理当前 manual review context，防止回流重复触发
-            st.session_state.pop("manual_override", None)
+            save_manual_override(None)
 
             st.success("Manual override has been applied successfully.")
 
             # -------------------------------------------------
             # Return to Results page (override will be applied there)
             # -------------------------------------------------
-            st.switch_page("pages/3_Neighbourhood_Risk_Results.py")
+            st.switch_page(
+                "pages/3_Neighbourhood_Risk_Results.py", query_params=assessment_query()
+            )
 
 # =====================================================
 # Disclaimer
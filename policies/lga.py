@@ -1,19 +1,29 @@
 import pandas as pd
 
 from data.normalisation import normalise_lga_name
-from data.location import get_location_datasets
+from data.loaders import dataset_version, get_dataset, get_key_index
+from policies.memo import memoise_policy, policy_version
+from policies.scoring_rules import classify, get_scoring_rules
+from policies.tables import get_policy_tables
 
 
-# =====================================================
-# Load data (policy-owned, read-only)
-# =====================================================
-_datasets = get_location_datasets()
-lga_irsad_df = _datasets.get("lga_irsad", pd.DataFrame())
+def classify_lga_irsad_decile(irsad_decile: int) -> tuple[str, str, int]:
+    """
+    IRSAD interpretation (config/risk_weights.yaml, lga.irsad_bands).
+    Returns (label, icon, score).
+    """
+    band = classify(get_scoring_rules().lga_irsad_bands, irsad_decile)
+    return band.label, band.icon, band.score
 
 
 # =====================================================
 # Policy: LGA Risk
 # =====================================================
+@memoise_policy(
+    "lga",
+    key=lambda lga_name: normalise_lga_name(lga_name) if lga_name else None,
+    version=lambda: (policy_version(), dataset_version("lga_irsad")),
+)
 def assess_lga_risk(lga_name: str) -> dict:
     """
     Assess LGA-level socio-economic risk using IRSAD decile.
@@ -41,6 +51,12 @@ def assess_lga_risk(lga_name: str) -> dict:
 
     lga_key = normalise_lga_name(lga_name)
 
+    # Loaded on first assessment, not at import (read-only)
+    try:
+        lga_irsad_df = get_dataset("lga_irsad")
+    except (FileNotFoundError, ValueError):
+        lga_irsad_df = pd.DataFrame()
+
     # -------------------------------------------------
     # Defensive: dataset not available
     # -------------------------------------------------
@@ -54,9 +70,9 @@ def assess_lga_risk(lga_name: str) -> dict:
             "requires_manual_review": True,
         }
 
-    match = lga_irsad_df[lga_irsad_df["LGA_KEY"] == lga_key]
+    pos = get_key_index(lga_irsad_df, "LGA_KEY").get(lga_key)
 
-    if match.empty:
+    if pos is None:
         return {
             "risk_name": "LGA Socio-Economic",
             "score": None,
@@ -66,17 +82,13 @@ def assess_lga_risk(lga_name: str) -> dict:
             "requires_manual_review": True,
         }
 
-    irsad_decile = int(match.iloc[0]["IRSAD_decile"])
+    irsad_decile = int(lga_irsad_df.iloc[pos]["IRSAD_decile"])
 
     # -------------------------------------------------
     # IRSAD interpretation
     # -------------------------------------------------
-    if irsad_decile >= 8:
-        label, icon, score = "Low Risk", "🟢", 90
-    elif irsad_decile >= 5:
-        label, icon, score = "Moderate Risk", "🟡", 60
-    else:
-        label, icon, score = "Elevated Risk", "🔴", 30
+    band = get_policy_tables().lga_irsad_bands.get(irsad_decile)
+    label, icon, score = band or classify_lga_irsad_decile(irsad_decile)
 
     return {
         "risk_name": "LGA Socio-Economic",
@@ -1,5 +1,16 @@
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, Mapping
+
+from policies.memo import memoise_policy
+from policies.scoring_rules import (
+    band_categorical,
+    classify,
+    classify_array,
+    get_scoring_rules,
+    round_score,
+)
+from policies.tables import get_policy_tables
 
 
 # =====================================================
@@ -13,19 +24,17 @@ def _load_decile_scoring_table(decile_col: str) -> pd.DataFrame:
 
 
 def _lookup_score(
-    table: pd.DataFrame,
-    key_col: str,
+    scores: Mapping[int, int],
     key: Optional[int],
 ) -> Optional[int]:
     if key is None:
         return None
 
-    match = table.loc[table[key_col] == key, "score"]
-    if match.empty:
+    try:
+        return scores.get(key)
+    except TypeError:
         return None
 
-    return int(match.iloc[0])
-
 
 # =====================================================
 # Crime scoring
@@ -37,28 +46,16 @@ def crime_score_from_percentile(percentile: Optional[float]) -> Optional[int]:
     if percentile is None:
         return None
 
-    if percentile >= 90:
-        return 100
-    elif percentile >= 75:
-        return 80
-    elif percentile >= 50:
-        return 60
-    elif percentile >= 25:
-        return 40
-    else:
-        return 20
+    return classify(get_scoring_rules().crime_score_bands, percentile).score
 
 
 def crime_rationale(percentile: Optional[float]) -> str:
+    rules = get_scoring_rules()
+
     if percentile is None:
-        return "Crime data unavailable at suburb level."
+        return rules.crime_rationale_missing
 
-    if percentile >= 75:
-        return "Crime incidence is materially lower than comparable suburbs."
-    elif percentile >= 50:
-        return "Crime levels are broadly in line with metropolitan averages."
-    else:
-        return "Elevated crime incidence relative to comparable suburbs."
+    return classify(rules.crime_rationale_bands, percentile).text
 
 
 # =====================================================
@@ -70,20 +67,21 @@ def calculate_location_score(
     irsad_score: Optional[int],
 ) -> Optional[float]:
     """
-    Weighted composite score.
+    Weighted composite score (weights from config/risk_weights.yaml).
     Automatically re-normalises weights if partial data.
     """
 
-    components = {
-        "crime": (crime_score, 0.4),
-        "irsd": (irsd_score, 0.3),
-        "irsad": (irsad_score, 0.3),
+    scores = {
+        "crime": crime_score,
+        "irsd": irsd_score,
+        "irsad": irsad_score,
     }
 
     weighted_sum = 0.0
     total_weight = 0.0
 
-    for score, weight in components.values():
+    for name, weight in get_scoring_rules().location_weights:
+        score = scores[name]
         if score is not None:
             weighted_sum += score * weight
             total_weight += weight
@@ -91,21 +89,42 @@ def calculate_location_score(
     if total_weight == 0:
         return None
 
-    return round(weighted_sum / total_weight, 1)
+    return round_score(weighted_sum / total_weight)
 
 
 def classify_location_risk(score: float) -> tuple[str, str]:
-    if score >= 75:
-        return "Low Risk", "🟢"
-    elif score >= 50:
-        return "Moderate Risk", "🟡"
-    else:
-        return "Elevated Risk", "🔴"
+    band = classify(get_scoring_rules().location_bands, score)
+    return band.label, band.icon
+
+
+def location_rationale(
+    crime_percentile: Optional[float],
+    irsd_decile: Optional[int],
+    irsad_decile: Optional[int],
+) -> str:
+    """
+    Analyst-readable rationale. Pass a decile as None when it did not
+    produce a score.
+    """
+    rules = get_scoring_rules()
+
+    rationale_parts = [
+        crime_rationale(crime_percentile),
+    ]
+
+    if irsd_decile is not None:
+        rationale_parts.append(rules.irsd_rationale.format(decile=irsd_decile))
+
+    if irsad_decile is not None:
+        rationale_parts.append(rules.irsad_rationale.format(decile=irsad_decile))
+
+    return " ".join(rationale_parts)
 
 
 # =====================================================
 # Public policy entry point
 # =====================================================
+@memoise_policy("location")
 def assess_location_risk(
     crime_percentile: Optional[float],
     irsd_decile: Optional[int],
@@ -123,19 +142,13 @@ def assess_location_risk(
     # -----------------------------
     # Step 1: Convert inputs
     # -----------------------------
+    rules = get_scoring_rules()
+    tables = get_policy_tables()
+
     crime_score = crime_score_from_percentile(crime_percentile)
 
-    irsd_score = _lookup_score(
-        _load_decile_scoring_table("IRSD_decile"),
-        "IRSD_decile",
-        irsd_decile,
-    )
-
-    irsad_score = _lookup_score(
-        _load_decile_scoring_table("IRSAD_decile"),
-        "IRSAD_decile",
-        irsad_decile,
-    )
+    irsd_score = _lookup_score(tables.irsd_decile_scores, irsd_decile)
+    irsad_score = _lookup_score(tables.irsad_decile_scores, irsad_decile)
 
     # -----------------------------
     # Step 2: Composite score
@@ -152,9 +165,9 @@ def assess_location_risk(
             "score": None,
             "label": "Unknown",
             "icon": "⚪",
-            "flags": ["INSUFFICIENT_DATA"],
+            "flags": [rules.location_flags["insufficient_data"]],
             "requires_manual_review": True,
-            "rationale": "Insufficient data to assess location risk.",
+            "rationale": rules.location_insufficient_text,
         }
 
 
@@ -166,21 +179,11 @@ def assess_location_risk(
     # -----------------------------
     # Step 4: Rationale
     # -----------------------------
-    rationale_parts = [
-        crime_rationale(crime_percentile),
-    ]
-
-    if irsd_score is not None:
-        rationale_parts.append(
-            f"IRSD decile {irsd_decile} reflects relative socio-economic disadvantage."
-        )
-
-    if irsad_score is not None:
-        rationale_parts.append(
-            f"IRSAD decile {irsad_decile} indicates overall advantage/disadvantage profile."
-        )
-
-    rationale = " ".join(rationale_parts)
+    rationale = location_rationale(
+        crime_percentile,
+        irsd_decile if irsd_score is not None else None,
+        irsad_decile if irsad_score is not None else None,
+    )
 
     # -----------------------------
     # Step 5: Output
@@ -191,9 +194,164 @@ def assess_location_risk(
         "label": label,
         "icon": icon,
         "flags": [] if all(v is not None for v in [crime_score, irsd_score, irsad_score])
-        else ["PARTIAL_DATA_USED"],
+        else [rules.location_flags["partial_data"]],
         "requires_manual_review": not all(
             v is not None for v in [crime_score, irsd_score, irsad_score]
         ),
         "rationale": rationale,
-    }
\ No newline at end of file
+    }
+
+
+# =====================================================
+# Batch policy entry point (portfolio rescoring)
+# =====================================================
+# Vector form of the scalar policy above; keep the two in step.
+def _decile_score_array(scores: Mapping[int, int]) -> np.ndarray:
+    """
+    decile → score as an array indexed by decile (index 0 unused).
+    """
+    array = np.full(11, np.nan)
+    for decile, score in scores.items():
+        array[decile] = score
+    return array
+
+
+def _as_float_array(values, size: int) -> np.ndarray:
+    if values is None:
+        return np.full(size, np.nan)
+    # to_numpy with na_value also covers nullable (Int8 / Float32) input
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+
+
+def _crime_scores(percentile: np.ndarray, bands) -> np.ndarray:
+    band_scores = np.array([b.score for b in bands], dtype=np.float64)
+    scores = band_scores[classify_array(bands, percentile)]
+    return np.where(np.isnan(percentile), np.nan, scores)
+
+
+def _decile_scores(decile: np.ndarray, scores: Mapping[int, int]) -> np.ndarray:
+    valid = (decile >= 1) & (decile <= 10) & (decile == np.floor(decile))
+    idx = np.where(valid, decile, 0).astype(np.int64)
+    return _decile_score_array(scores)[idx]
+
+
+def assess_location_risk_batch(
+    crime_percentile=None,
+    irsd_decile=None,
+    irsad_decile=None,
+) -> pd.DataFrame:
+    """
+    Vectorised assess_location_risk for many applications at once.
+
+    Accepts either three array-likes, or a DataFrame as the first
+    argument with crime_percentile and IRSD_decile / IRSAD_decile
+    columns (lower-case irsd_decile / irsad_decile also accepted).
+    NaN or None marks a missing input, as None does in the scalar path.
+
+    Returns a DataFrame (one row per application, same index as a
+    DataFrame input) with the component scores plus score, label, icon,
+    flag and requires_manual_review. The policy raises at most one flag,
+    so flag holds it directly ("" when the scalar flags list is empty).
+    Rationale text is not produced.
+    """
+
+    index = None
+
+    if isinstance(crime_percentile, pd.DataFrame):
+        frame = crime_percentile
+        index = frame.index
+
+        def _column(*names):
+            for name in names:
+                if name in frame.columns:
+                    return frame[name].to_numpy()
+            return None
+
+        crime_percentile = _column("crime_percentile")
+        irsd_decile = _column("IRSD_decile", "irsd_decile")
+        irsad_decile = _column("IRSAD_decile", "irsad_decile")
+
+    sizes = {
+        len(v) for v in (crime_percentile, irsd_decile, irsad_decile)
+        if v is not None
+    }
+    if len(sizes) > 1:
+        raise ValueError("Location inputs must all have the same length.")
+    size = sizes.pop() if sizes else (len(index) if index is not None else 0)
+
+    # -----------------------------
+    # Step 1: Convert inputs
+    # -----------------------------
+    rules = get_scoring_rules()
+    tables = get_policy_tables()
+
+    component_scores = {
+        "crime": _crime_scores(
+            _as_float_array(crime_percentile, size), rules.crime_score_bands
+        ),
+        "irsd": _decile_scores(
+            _as_float_array(irsd_decile, size), tables.irsd_decile_scores
+        ),
+        "irsad": _decile_scores(
+            _as_float_array(irsad_decile, size), tables.irsad_decile_scores
+        ),
+    }
+
+    # -----------------------------
+    # Step 2: Composite score (same accumulation order as
+    # calculate_location_score, so results match bit for bit)
+    # -----------------------------
+    weighted_sum = np.zeros(size)
+    total_weight = np.zeros(size)
+
+    for name, weight in rules.location_weights:
+        present = ~np.isnan(component_scores[name])
+        weighted_sum = np.where(
+            present, weighted_sum + component_scores[name] * weight, weighted_sum
+        )
+        total_weight = np.where(present, total_weight + weight, total_weight)
+
+    has_score = total_weight > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.where(
+            has_score, round_score(weighted_sum / total_weight), np.nan
+        )
+
+    # -----------------------------
+    # Step 3: Classification
+    # -----------------------------
+    # 0 = Unknown, then 1 + index into the location bands
+    bands = rules.location_bands
+    band = np.where(has_score, classify_array(bands, score) + 1, 0)
+
+    # -----------------------------
+    # Step 4: Flags / manual review
+    # -----------------------------
+    complete = np.logical_and.reduce(
+        [~np.isnan(v) for v in component_scores.values()]
+    )
+    # 0 = none, 1 = INSUFFICIENT_DATA, 2 = PARTIAL_DATA_USED
+    flag = np.select([~has_score, ~complete], [1, 2], default=0)
+
+    return pd.DataFrame(
+        {
+            "crime_score": component_scores["crime"],
+            "irsd_score": component_scores["irsd"],
+            "irsad_score": component_scores["irsad"],
+            "score": score,
+            "label": band_categorical(band, ["Unknown", *(b.label for b in bands)]),
+            "icon": band_categorical(band, ["⚪", *(b.icon for b in bands)]),
+            "flag": pd.Categorical.from_codes(
+                flag,
+                [
+                    "",
+                    rules.location_flags["insufficient_data"],
+                    rules.location_flags["partial_data"],
+                ],
+            ),
+            "requires_manual_review": ~complete,
+        },
+        index=index,
+    )
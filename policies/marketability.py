@@ -1,5 +1,8 @@
 import pandas as pd
 
+from policies.memo import memoise_policy
+from policies.tables import get_policy_tables
+
 # =====================================================
 # Benchmarks
 # =====================================================
@@ -32,22 +35,31 @@ def load_marketability_benchmarks_v1():
 # Load benchmark table once
 MARKETABILITY_TABLE = load_marketability_benchmarks_v1()
 
+# Policy mapping used by assess_marketability_risk:
+# level → (score, label)
+MARKETABILITY_POLICY = {
+    "VERY GOOD": (90, "Low Risk"),
+    "GOOD": (80, "Low Risk"),
+    "AVERAGE": (60, "Moderate Risk"),
+    "FAIR": (40, "Elevated Risk"),
+    "POOR": (20, "High Risk"),
+}
+
 
 # =====================================================
 # Public Policy Interface
 # =====================================================
 
+@memoise_policy(
+    "marketability",
+    key=lambda marketability: (
+        marketability.upper().strip() if marketability else None
+    ),
+)
 def assess_marketability_risk(marketability: str) -> dict:
-    mapping = {
-        "VERY GOOD": (90, "Low Risk"),
-        "GOOD": (80, "Low Risk"),
-        "AVERAGE": (60, "Moderate Risk"),
-        "FAIR": (40, "Elevated Risk"),
-        "POOR": (20, "High Risk"),
-    }
-
     if not marketability:
         return {
+            "risk_name": "Marketability",
             "score": None,
             "label": "Unknown",
             "rationale": "Marketability assessment not provided."
@@ -55,12 +67,13 @@ def assess_marketability_risk(marketability: str) -> dict:
 
     marketability = marketability.upper().strip()
 
-    score, label = mapping.get(
+    score, label = get_policy_tables().marketability.get(
         marketability,
         (None, "Unknown")
     )
 
     return {
+        "risk_name": "Marketability",
         "score": score,
         "label": label,
         "rationale": "See detailed policy interpretation"
@@ -0,0 +1,174 @@
+# =====================================================
+# Memoised policy entry points
+# =====================================================
+# Streamlit reruns a page top to bottom on every widget change, and a
+# portfolio batch repeats the same suburb / zoning / LGA many times.
+# The policy entry points are pure functions of their (normalised)
+# inputs plus the policy tables, scoring rules and datasets they read,
+# so their results are kept in a bounded LRU.
+#
+# - key      = (version, normalised inputs)
+# - version  = policy content hash (tables + scoring rules), plus the
+#              dataset version for policies that read a dataset
+# - results are copied on the way out (the result dict and its lists),
+#   so a caller setting result["rationale"] or appending a flag cannot
+#   change what the next caller gets. Nested registry entries such as
+#   the zoning "policy" dict are shared, exactly as without the memo.
+import numbers
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable
+
+from policies.tables import get_policy_tables
+
+
+POLICY_MEMO_SIZE = 2048
+
+_MEMOS: dict[str, "PolicyMemo"] = {}
+
+
+def policy_version() -> str:
+    """
+    Version stamp shared by every memoised policy: the content hash of
+    the policy tables and scoring rules in force (pinned ones included).
+    """
+    return get_policy_tables().content_hash
+
+
+def _copy_result(value):
+    if type(value) is dict:
+        return {k: list(v) if type(v) is list else v for k, v in value.items()}
+    return value
+
+
+def input_key(value):
+    """
+    Hashable cache key for one input. int and float are kept apart
+    (a rationale prints 7 and 7.0 differently) and NaN keys equal NaN.
+    """
+    value_type = type(value)
+    if value is None or value_type is str or value_type is bool:
+        return value
+    if value_type is int:
+        return ("int", value)
+    if value_type is float:
+        return ("float", "nan") if value != value else ("float", value)
+    if isinstance(value, numbers.Integral):
+        return ("int", int(value))
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return (type(value).__name__, value)
+    if number != number:
+        return ("float", "nan")
+    return ("float", number)
+
+
+class PolicyMemo:
+    """
+    Bounded LRU around one policy function, with hit / miss counts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        key: Callable[..., tuple],
+        version: Callable[[], object],
+        maxsize: int = POLICY_MEMO_SIZE,
+    ):
+        self.name = name
+        self.func = func
+        self.key = key
+        self.version = version
+        self.maxsize = maxsize
+
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args, **kwargs):
+        key = (self.version(), self.key(*args, **kwargs))
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return _copy_result(self._cache[key])
+            self.misses += 1
+
+        result = self.func(*args, **kwargs)
+
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return _copy_result(result)
+
+    def stats(self) -> dict:
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / calls if calls else None,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def memoise_policy(
+    name: str,
+    key: Callable[..., tuple] | None = None,
+    version: Callable[[], object] = policy_version,
+    maxsize: int = POLICY_MEMO_SIZE,
+):
+    """
+    Decorator registering a memoised policy function under `name`.
+
+    `key` maps the call arguments to their normalised form; by default
+    every positional and keyword argument goes through input_key.
+    The undecorated function stays available as `.uncached`.
+    """
+    def default_key(*args, **kwargs):
+        positional = tuple(map(input_key, args))
+        if not kwargs:
+            return positional
+        return positional + tuple(
+            sorted((k, input_key(v)) for k, v in kwargs.items())
+        )
+
+    def decorate(func):
+        memo = PolicyMemo(name, func, key or default_key, version, maxsize)
+        _MEMOS[name] = memo
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return memo(*args, **kwargs)
+
+        wrapper.memo = memo
+        wrapper.uncached = func
+        return wrapper
+
+    return decorate
+
+
+def memo_stats() -> dict[str, dict]:
+    """
+    {policy name: {"hits", "misses", "size", "maxsize", "hit_rate"}}
+    """
+    return {name: memo.stats() for name, memo in _MEMOS.items()}
+
+
+def clear_policy_memos() -> None:
+    for memo in _MEMOS.values():
+        memo.clear()
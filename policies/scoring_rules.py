@@ -0,0 +1,459 @@
+# =====================================================
+# Declarative scoring rules (config/*.yaml)
+# =====================================================
+# Weights, thresholds, score bands, flag names and rationale text are
+# declared in config/risk_weights.yaml and config/policy_text.yaml.
+# They are parsed and validated once into an immutable ScoringRules
+# object; the policy functions only read attributes from it.
+#
+# Reload: get_scoring_rules() re-checks the files' mtime / size at most
+# every RELOAD_CHECK_SECONDS. A changed file is compiled in full before
+# it replaces the current rules; if it fails validation the previous
+# rules stay in force and the error is kept in last_reload_error().
+#
+# Pinning: use_scoring_rules(rules) makes get_scoring_rules() return a
+# given (e.g. snapshotted) rule set for the current thread / context
+# only, so a historical rescore never disturbs live scoring.
+import hashlib
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+import yaml
+
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
+
+RISK_WEIGHTS_PATH = CONFIG_DIR / "risk_weights.yaml"
+POLICY_TEXT_PATH = CONFIG_DIR / "policy_text.yaml"
+
+RELOAD_CHECK_SECONDS = 2.0
+
+LOCATION_COMPONENTS = ("crime", "irsd", "irsad")
+
+# Location and composite scores are reported to 1 dp
+SCORE_DECIMALS = 1
+
+# |x * 10**decimals| this close to a .5 boundary is re-rounded exactly
+_ROUNDING_TIE_TOLERANCE = 1e-6
+
+
+# =====================================================
+# Compiled rule objects
+# =====================================================
+@dataclass(frozen=True)
+class Band:
+    """
+    One row of a band table. Matches value >= min, value < below, or
+    anything (fallback) when neither is set.
+    """
+
+    min: float | None = None
+    below: float | None = None
+    label: str | None = None
+    icon: str | None = None
+    score: int | float | None = None
+    text: str | None = None
+
+    def matches(self, value) -> bool:
+        if self.min is not None:
+            return value >= self.min
+        if self.below is not None:
+            return value < self.below
+        return True
+
+
+def classify(bands: tuple[Band, ...], value) -> Band:
+    """
+    First band that matches value. Validation guarantees a fallback.
+    """
+    for band in bands:
+        if band.matches(value):
+            return band
+    return bands[-1]
+
+
+def classify_array(bands: tuple[Band, ...], values: np.ndarray) -> np.ndarray:
+    """
+    Vector form of classify(): band index per value.
+    NaN falls through every comparison, exactly as in the scalar path.
+    """
+    conditions = []
+    for band in bands[:-1]:
+        if band.min is not None:
+            conditions.append(values >= band.min)
+        else:
+            conditions.append(values < band.below)
+    return np.select(conditions, np.arange(len(conditions)), default=len(bands) - 1)
+
+
+def round_score(value):
+    """
+    Round a score, or an array of scores, to SCORE_DECIMALS exactly as
+    Python's round() does (nearest decimal of the exact binary value,
+    ties to even), so scalar and vector paths report the same score.
+
+    np.round scales by 10 first, which can push a value just under a
+    .x5 boundary over it; those near-boundary values take round().
+    NaN stays NaN.
+    """
+    if np.ndim(value) == 0:
+        return round(float(value), SCORE_DECIMALS)
+
+    values = np.asarray(value, dtype=np.float64)
+    rounded = np.round(values, SCORE_DECIMALS)
+
+    with np.errstate(invalid="ignore"):
+        scaled = np.abs(values) * 10.0**SCORE_DECIMALS
+        near_tie = np.abs(scaled % 1.0 - 0.5) < _ROUNDING_TIE_TOLERANCE
+    if near_tie.any():
+        rounded[near_tie] = [
+            round(v, SCORE_DECIMALS) for v in values[near_tie].tolist()
+        ]
+    return rounded
+
+
+def band_categorical(codes: np.ndarray, values: list[str]) -> pd.Categorical:
+    """
+    Categorical of values[code] (code -1 → missing). Values may repeat
+    across bands, e.g. two bands sharing a label.
+    """
+    categories = list(dict.fromkeys(values))
+    remap = np.array([categories.index(v) for v in values] + [-1])
+    return pd.Categorical.from_codes(remap[codes], categories)
+
+
+@dataclass(frozen=True)
+class ScoringRules:
+    """
+    Validated, read-only view of the scoring configuration.
+    """
+
+    version: str
+
+    # (component, weight) in crime / irsd / irsad order
+    location_weights: tuple[tuple[str, float], ...]
+    crime_score_bands: tuple[Band, ...]
+    location_bands: tuple[Band, ...]
+    location_flags: Mapping[str, str]
+
+    lga_irsad_bands: tuple[Band, ...]
+
+    zoning_bands: tuple[Band, ...]
+    zoning_restrictive_max_score: float
+    zoning_restrictive_flag: str
+
+    composite_bands: tuple[Band, ...]
+
+    # policy_text.yaml
+    crime_rationale_missing: str
+    crime_rationale_bands: tuple[Band, ...]
+    irsd_rationale: str
+    irsad_rationale: str
+    location_insufficient_text: str
+
+
+# =====================================================
+# Validation / compilation
+# =====================================================
+def _section(doc: dict, path: str):
+    node = doc
+    for part in path.split("."):
+        if not isinstance(node, dict) or part not in node:
+            raise ValueError(f"Scoring rules missing '{path}'")
+        node = node[part]
+    return node
+
+
+def _number(value, where: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{where} must be a number, got {value!r}")
+    return value
+
+
+def _text(value, where: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{where} must be non-empty text")
+    return value
+
+
+def _bands(doc: dict, path: str, required: tuple[str, ...]) -> tuple[Band, ...]:
+    rows = _section(doc, path)
+    if not isinstance(rows, list) or not rows:
+        raise ValueError(f"{path} must be a non-empty list of bands")
+
+    bands = []
+    for i, row in enumerate(rows):
+        where = f"{path}[{i}]"
+        if not isinstance(row, dict):
+            raise ValueError(f"{where} must be a mapping")
+
+        unknown = set(row) - {"min", "below", "label", "icon", "score", "text"}
+        if unknown:
+            raise ValueError(f"{where} has unknown keys: {sorted(unknown)}")
+        if "min" in row and "below" in row:
+            raise ValueError(f"{where} cannot set both min and below")
+        for key in required:
+            if key not in row:
+                raise ValueError(f"{where} missing '{key}'")
+
+        bands.append(
+            Band(
+                min=_number(row["min"], f"{where}.min") if "min" in row else None,
+                below=_number(row["below"], f"{where}.below") if "below" in row else None,
+                label=_text(row["label"], f"{where}.label") if "label" in row else None,
+                icon=str(row["icon"]) if "icon" in row else None,
+                score=_number(row["score"], f"{where}.score") if "score" in row else None,
+                text=_text(row["text"], f"{where}.text") if "text" in row else None,
+            )
+        )
+
+    *conditional, fallback = bands
+    if fallback.min is not None or fallback.below is not None:
+        raise ValueError(f"{path}: last band must be the fallback (no min / below)")
+    if any(b.min is None and b.below is None for b in conditional):
+        raise ValueError(f"{path}: only the last band may omit min / below")
+
+    # Checked in order, so thresholds must move away from the fallback
+    mins = [b.min for b in conditional if b.min is not None]
+    belows = [b.below for b in conditional if b.below is not None]
+    if mins and belows:
+        raise ValueError(f"{path}: use either min or below, not both")
+    if mins != sorted(mins, reverse=True) or belows != sorted(belows):
+        raise ValueError(f"{path}: band thresholds are out of order")
+
+    return tuple(bands)
+
+
+def compile_scoring_rules(
+    risk_weights: dict,
+    policy_text: dict,
+    version: str,
+) -> ScoringRules:
+    """
+    Validate the parsed YAML documents and build ScoringRules.
+    Raises ValueError describing the first problem found.
+    """
+    if not isinstance(risk_weights, dict):
+        raise ValueError("risk_weights.yaml is empty or not a mapping")
+    if not isinstance(policy_text, dict):
+        raise ValueError("policy_text.yaml is empty or not a mapping")
+
+    weights = _section(risk_weights, "location.weights")
+    if not isinstance(weights, dict) or set(weights) != set(LOCATION_COMPONENTS):
+        raise ValueError(
+            f"location.weights must define exactly {list(LOCATION_COMPONENTS)}"
+        )
+    location_weights = tuple(
+        (name, _number(weights[name], f"location.weights.{name}"))
+        for name in LOCATION_COMPONENTS
+    )
+    if any(w <= 0 for _, w in location_weights):
+        raise ValueError("location.weights must all be positive")
+
+    location_flags = {
+        key: _text(
+            _section(risk_weights, f"location.flags.{key}"), f"location.flags.{key}"
+        )
+        for key in ("insufficient_data", "partial_data")
+    }
+
+    return ScoringRules(
+        version=version,
+        location_weights=location_weights,
+        crime_score_bands=_bands(risk_weights, "location.crime_score_bands", ("score",)),
+        location_bands=_bands(risk_weights, "location.bands", ("label", "icon")),
+        location_flags=MappingProxyType(location_flags),
+        lga_irsad_bands=_bands(risk_weights, "lga.irsad_bands", ("label", "icon", "score")),
+        zoning_bands=_bands(risk_weights, "zoning.bands", ("label", "icon")),
+        zoning_restrictive_max_score=_number(
+            _section(risk_weights, "zoning.flags.restrictive_max_score"),
+            "zoning.flags.restrictive_max_score",
+        ),
+        zoning_restrictive_flag=_text(
+            _section(risk_weights, "zoning.flags.restrictive"),
+            "zoning.flags.restrictive",
+        ),
+        composite_bands=_bands(risk_weights, "composite.bands", ("label", "icon")),
+        crime_rationale_missing=_text(
+            _section(policy_text, "location.crime_rationale.missing"),
+            "location.crime_rationale.missing",
+        ),
+        crime_rationale_bands=_bands(
+            policy_text, "location.crime_rationale.bands", ("text",)
+        ),
+        irsd_rationale=_text(
+            _section(policy_text, "location.irsd_rationale"), "location.irsd_rationale"
+        ),
+        irsad_rationale=_text(
+            _section(policy_text, "location.irsad_rationale"), "location.irsad_rationale"
+        ),
+        location_insufficient_text=_text(
+            _section(policy_text, "location.insufficient_data"),
+            "location.insufficient_data",
+        ),
+    )
+
+
+def load_scoring_rules(
+    risk_weights_path: Path = RISK_WEIGHTS_PATH,
+    policy_text_path: Path = POLICY_TEXT_PATH,
+) -> ScoringRules:
+    """
+    Parse and compile both YAML files. The version is a short hash of
+    their contents.
+    """
+    raw_weights = risk_weights_path.read_bytes()
+    raw_text = policy_text_path.read_bytes()
+
+    version = hashlib.sha256(raw_weights + b"\0" + raw_text).hexdigest()[:12]
+
+    try:
+        risk_weights = yaml.safe_load(raw_weights)
+        policy_text = yaml.safe_load(raw_text)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Scoring rules are not valid YAML: {exc}") from exc
+
+    return compile_scoring_rules(risk_weights, policy_text, version)
+
+
+# =====================================================
+# Serialisation (scoring snapshots)
+# =====================================================
+def _band_to_dict(band: Band) -> dict:
+    return {
+        f.name: getattr(band, f.name)
+        for f in fields(Band)
+        if getattr(band, f.name) is not None
+    }
+
+
+def scoring_rules_to_dict(rules: ScoringRules) -> dict:
+    """
+    JSON-ready form of compiled rules; scoring_rules_from_dict() is its
+    inverse.
+    """
+    doc = {}
+    for f in fields(ScoringRules):
+        value = getattr(rules, f.name)
+        if f.name == "location_weights":
+            value = [list(pair) for pair in value]
+        elif isinstance(value, tuple):
+            value = [_band_to_dict(b) for b in value]
+        elif isinstance(value, Mapping):
+            value = dict(value)
+        doc[f.name] = value
+    return doc
+
+
+def scoring_rules_from_dict(doc: dict) -> ScoringRules:
+    values = {}
+    for f in fields(ScoringRules):
+        value = doc[f.name]
+        if f.name == "location_weights":
+            value = tuple((name, weight) for name, weight in value)
+        elif isinstance(value, list):
+            value = tuple(Band(**row) for row in value)
+        elif isinstance(value, dict):
+            value = MappingProxyType(dict(value))
+        values[f.name] = value
+    return ScoringRules(**values)
+
+
+# =====================================================
+# Process-wide rules with safe reload
+# =====================================================
+_PATHS = (RISK_WEIGHTS_PATH, POLICY_TEXT_PATH)
+
+_LOCK = threading.Lock()
+_RULES: ScoringRules | None = None
+_SIGNATURE: tuple | None = None
+_NEXT_CHECK = 0.0
+_LAST_ERROR: str | None = None
+
+_PINNED: ContextVar[ScoringRules | None] = ContextVar(
+    "pinned_scoring_rules", default=None
+)
+
+
+def _file_signature() -> tuple:
+    signature = []
+    for path in _PATHS:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def get_scoring_rules() -> ScoringRules:
+    """
+    Current rules. Loaded on first use; re-checked for file changes at
+    most every RELOAD_CHECK_SECONDS. Inside use_scoring_rules(), the
+    pinned rules.
+    """
+    global _RULES, _SIGNATURE, _NEXT_CHECK, _LAST_ERROR
+
+    pinned = _PINNED.get()
+    if pinned is not None:
+        return pinned
+
+    rules = _RULES
+    if rules is not None and time.monotonic() < _NEXT_CHECK:
+        return rules
+
+    with _LOCK:
+        if _RULES is not None and time.monotonic() < _NEXT_CHECK:
+            return _RULES
+
+        signature = _file_signature()
+        if _RULES is None or signature != _SIGNATURE:
+            try:
+                _RULES = load_scoring_rules(*_PATHS)
+                _LAST_ERROR = None
+            except (OSError, ValueError) as exc:
+                if _RULES is None:
+                    raise
+                _LAST_ERROR = str(exc)
+                warnings.warn(
+                    f"Scoring rules not reloaded, keeping version "
+                    f"{_RULES.version}: {exc}",
+                    RuntimeWarning,
+                )
+            _SIGNATURE = signature
+
+        _NEXT_CHECK = time.monotonic() + RELOAD_CHECK_SECONDS
+        return _RULES
+
+
+@contextmanager
+def use_scoring_rules(rules: ScoringRules):
+    """
+    Score with `rules` instead of the live config inside the block
+    (current thread / context only).
+    """
+    token = _PINNED.set(rules)
+    try:
+        yield rules
+    finally:
+        _PINNED.reset(token)
+
+
+def scoring_rules_version() -> str:
+    return get_scoring_rules().version
+
+
+def last_reload_error() -> str | None:
+    """
+    Why the most recent file change was rejected, if it was.
+    """
+    return _LAST_ERROR
@@ -0,0 +1,230 @@
+# =====================================================
+# Compiled policy lookup tables
+# =====================================================
+# The policy modules define their scoring tables as small DataFrames
+# (or inline dicts). Building and filtering those on every assessment
+# is the largest fixed cost of a scalar call, so they are compiled once
+# per process into read-only dicts keyed by zoning code, decile or
+# marketability level.
+#
+# The DataFrame loaders stay the source of truth; bump
+# POLICY_TABLES_VERSION whenever one of them changes. Tables derived
+# from config/risk_weights.yaml (LGA bands) are recompiled when the
+# scoring rules reload.
+#
+# content_hash identifies the compiled tables plus the rules they were
+# compiled with; it is what scoring snapshots record as the policy
+# version, and use_policy_tables() pins a snapshotted set for the
+# current context.
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from policies.scoring_rules import get_scoring_rules
+
+
+POLICY_TABLES_VERSION = "1.0"
+
+
+@dataclass(frozen=True)
+class PolicyTables:
+    """
+    Read-only lookup tables shared by every policy entry point.
+    """
+
+    version: str
+    rules_version: str
+
+    # sha256 of the table contents + rules_version (see policy_tables_hash)
+    content_hash: str
+
+    # zoning code → score
+    residential_zoning: Mapping[str, int]
+    non_residential_zoning: Mapping[str, int]
+
+    # SEIFA decile (1–10) → location component score
+    irsd_decile_scores: Mapping[int, int]
+    irsad_decile_scores: Mapping[int, int]
+
+    # LGA IRSAD decile (1–10) → (label, icon, score)
+    lga_irsad_bands: Mapping[int, tuple[str, str, int]]
+
+    # marketability level → (score, label)
+    marketability: Mapping[str, tuple[int, str]]
+
+
+def _frame_to_dict(df, key_col: str, value_col: str) -> Mapping:
+    return MappingProxyType(
+        {k: int(v) for k, v in zip(df[key_col].tolist(), df[value_col].tolist())}
+    )
+
+
+_TABLE_FIELDS = (
+    "residential_zoning",
+    "non_residential_zoning",
+    "irsd_decile_scores",
+    "irsad_decile_scores",
+    "lga_irsad_bands",
+    "marketability",
+)
+
+
+def _tables_doc(rules_version: str, tables: dict[str, Mapping]) -> dict:
+    # JSON keys are strings; values become lists
+    doc = {"rules_version": rules_version}
+    for name in _TABLE_FIELDS:
+        doc[name] = {
+            str(k): list(v) if isinstance(v, tuple) else v
+            for k, v in tables[name].items()
+        }
+    return doc
+
+
+def policy_tables_hash(rules_version: str, tables: dict[str, Mapping]) -> str:
+    canonical = json.dumps(
+        _tables_doc(rules_version, tables), sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _make_tables(version: str, rules_version: str, tables: dict[str, Mapping]):
+    return PolicyTables(
+        version=version,
+        rules_version=rules_version,
+        content_hash=policy_tables_hash(rules_version, tables),
+        **{name: MappingProxyType(dict(tables[name])) for name in _TABLE_FIELDS},
+    )
+
+
+def policy_tables_to_dict(tables: PolicyTables) -> dict:
+    """
+    JSON-ready form of compiled tables (scoring snapshots).
+    """
+    doc = _tables_doc(
+        tables.rules_version, {n: getattr(tables, n) for n in _TABLE_FIELDS}
+    )
+    doc["version"] = tables.version
+    doc["content_hash"] = tables.content_hash
+    return doc
+
+
+def policy_tables_from_dict(doc: dict) -> PolicyTables:
+    """
+    Inverse of policy_tables_to_dict; raises ValueError if the contents
+    no longer match the recorded hash.
+    """
+    def decile_keyed(name):
+        return {int(k): v for k, v in doc[name].items()}
+
+    tables = {
+        "residential_zoning": doc["residential_zoning"],
+        "non_residential_zoning": doc["non_residential_zoning"],
+        "irsd_decile_scores": decile_keyed("irsd_decile_scores"),
+        "irsad_decile_scores": decile_keyed("irsad_decile_scores"),
+        "lga_irsad_bands": {
+            k: tuple(v) for k, v in decile_keyed("lga_irsad_bands").items()
+        },
+        "marketability": {k: tuple(v) for k, v in doc["marketability"].items()},
+    }
+
+    restored = _make_tables(doc["version"], doc["rules_version"], tables)
+    if restored.content_hash != doc["content_hash"]:
+        raise ValueError(
+            f"Policy tables do not match their hash {doc['content_hash']}"
+        )
+    return restored
+
+
+def compile_policy_tables(rules_version: str) -> PolicyTables:
+    """
+    Build the lookup tables from the policy modules' own definitions.
+    """
+    # Imported here: the policy modules import this one
+    from policies.lga import classify_lga_irsad_decile
+    from policies.location import _load_decile_scoring_table
+    from policies.marketability import MARKETABILITY_POLICY
+    from policies.zoning import (
+        load_non_residential_zoning_scoring_table,
+        load_residential_zoning_scoring_table,
+    )
+
+    return _make_tables(
+        POLICY_TABLES_VERSION,
+        rules_version,
+        {
+            "residential_zoning": _frame_to_dict(
+                load_residential_zoning_scoring_table(), "Zoning Code", "Score"
+            ),
+            "non_residential_zoning": _frame_to_dict(
+                load_non_residential_zoning_scoring_table(), "Zoning Code", "Score"
+            ),
+            "irsd_decile_scores": _frame_to_dict(
+                _load_decile_scoring_table("IRSD_decile"), "IRSD_decile", "score"
+            ),
+            "irsad_decile_scores": _frame_to_dict(
+                _load_decile_scoring_table("IRSAD_decile"), "IRSAD_decile", "score"
+            ),
+            "lga_irsad_bands": {
+                d: classify_lga_irsad_decile(d) for d in range(1, 11)
+            },
+            "marketability": dict(MARKETABILITY_POLICY),
+        },
+    )
+
+
+_LOCK = threading.Lock()
+_TABLES: PolicyTables | None = None
+
+_PINNED: ContextVar[PolicyTables | None] = ContextVar(
+    "pinned_policy_tables", default=None
+)
+
+
+def get_policy_tables() -> PolicyTables:
+    """
+    Compiled tables, built on first use and shared until the scoring
+    rules change. Inside use_policy_tables(), the pinned tables.
+    """
+    global _TABLES
+
+    pinned = _PINNED.get()
+    if pinned is not None:
+        return pinned
+
+    rules_version = get_scoring_rules().version
+    tables = _TABLES
+    if tables is not None and tables.rules_version == rules_version:
+        return tables
+
+    with _LOCK:
+        if _TABLES is None or _TABLES.rules_version != rules_version:
+            _TABLES = compile_policy_tables(rules_version)
+        return _TABLES
+
+
+@contextmanager
+def use_policy_tables(tables: PolicyTables):
+    """
+    Score with `tables` inside the block (current thread / context only).
+    """
+    token = _PINNED.set(tables)
+    try:
+        yield tables
+    finally:
+        _PINNED.reset(token)
+
+
+def policy_tables_version() -> str:
+    return get_policy_tables().version
+
+
+def policy_hash() -> str:
+    """
+    Content hash of the policy configuration in force (tables + rules).
+    """
+    return get_policy_tables().content_hash
@@ -1,6 +1,10 @@
 import pandas as pd
 from typing import Dict, List
 
+from policies.memo import memoise_policy
+from policies.scoring_rules import classify, get_scoring_rules
+from policies.tables import get_policy_tables
+
 # -------------------------------------------------
 # Zoning Scoring Tables
 # -------------------------------------------------
@@ -49,12 +53,8 @@ def classify_zoning_risk(score: int) -> tuple[str, str]:
     Classify zoning risk based on numeric score.
     Returns (risk_label, icon).
     """
-    if score >= 70:
-        return "Low Risk", "🟢"
-    elif score >= 50:
-        return "Moderate Risk", "🟡"
-    else:
-        return "Elevated Risk", "🔴"
+    band = classify(get_scoring_rules().zoning_bands, score)
+    return band.label, band.icon
 
 
 # -------------------------------------------------
@@ -99,6 +99,10 @@ ZONING_POLICY_REGISTRY: Dict[str, Dict] = {
 # -------------------------------------------------
 # Policy Entry Point
 # -------------------------------------------------
+@memoise_policy(
+    "zoning",
+    key=lambda zoning_code: zoning_code.upper().strip() if zoning_code else None,
+)
 def assess_zoning_risk(zoning_code: str) -> dict:
     """
     Policy entry point for Zoning risk assessment.
@@ -127,8 +131,7 @@ def assess_zoning_risk(zoning_code: str) -> dict:
 
     zoning_code = zoning_code.upper().strip()
 
-    res_df = load_residential_zoning_scoring_table()
-    non_res_df = load_non_residential_zoning_scoring_table()
+    tables = get_policy_tables()
 
     flags: List[str] = []
     policy_context = None
@@ -136,13 +139,9 @@ def assess_zoning_risk(zoning_code: str) -> dict:
     # -----------------------------
     # Residential zoning
     # -----------------------------
-    if zoning_code in res_df["Zoning Code"].values:
-        score = int(
-            res_df.loc[
-                res_df["Zoning Code"] == zoning_code, "Score"
-            ].values[0]
-        )
+    score = tables.residential_zoning.get(zoning_code)
 
+    if score is not None:
         label, icon = classify_zoning_risk(score)
 
         if zoning_code in ZONING_POLICY_REGISTRY:
@@ -164,20 +163,17 @@ def assess_zoning_risk(zoning_code: str) -> dict:
     # -----------------------------
     # Non-residential / special zoning
     # -----------------------------
-    if zoning_code in non_res_df["Zoning Code"].values:
-        score = int(
-            non_res_df.loc[
-                non_res_df["Zoning Code"] == zoning_code, "Score"
-            ].values[0]
-        )
+    score = tables.non_residential_zoning.get(zoning_code)
 
+    if score is not None:
         label, icon = classify_zoning_risk(score)
 
         policy_context = ZONING_POLICY_REGISTRY["NON_RESIDENTIAL"]
         flags.append(policy_context["flag"])
 
-        if score <= 20:
-            flags.append("RESTRICTIVE_ZONING")
+        rules = get_scoring_rules()
+        if score <= rules.zoning_restrictive_max_score:
+            flags.append(rules.zoning_restrictive_flag)
 
         return {
             "risk_name": "Zoning",
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The app runs from the repository root (streamlit run app.py); make
+# its top-level packages importable the same way under pytest.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from data.autocomplete import PrefixIndex, get_suburb_index
+from data.loaders import get_dataset, use_datasets
+from data.normalisation import normalise_lga_name, normalise_suburb_name
+
+SOURCES = {
+    "seifa": ("SUBURB_KEY", "suburb_name", normalise_suburb_name),
+    "lga_irsad": ("LGA_KEY", "lga_name", normalise_lga_name),
+}
+
+
+def _brute_force(names, suffixes, prefix):
+    keys = sorted(names)
+    whole = [key for key in keys if key.startswith(prefix)]
+    words = [
+        key
+        for key in keys
+        if not key.startswith(prefix)
+        and any(suffix.startswith(prefix) for suffix in suffixes[key])
+    ]
+    return [(key, names[key]) for key in whole + words]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_completions_match_brute_force(source):
+    key_col, name_col, normalise = SOURCES[source]
+    df = get_dataset(source)
+    entries = list(zip(df[key_col].astype(str), df[name_col].astype(str)))
+
+    names = {}
+    for key, display in entries:
+        names.setdefault(key, display)
+    # Every word of a key onwards, after the first
+    suffixes = {
+        key: [key[i + 1:] for i, c in enumerate(key) if c == " "] for key in names
+    }
+    index = PrefixIndex(entries, normalise)
+
+    rng = np.random.default_rng(22)
+    keys = sorted(names)
+    prefixes = ["", "A", "MOUNT", "ST ", "PARK", "HILL", "X", "ZZZ", " ", "NORTH SYD"]
+    for key in rng.choice(keys, 150):
+        cut = rng.integers(1, len(key) + 1)
+        start = rng.choice([0, *[i + 1 for i, c in enumerate(key) if c == " "]])
+        prefixes.append(key[start:start + cut])
+
+    for prefix in prefixes:
+        normalised = normalise(prefix) if prefix else ""
+        expected = _brute_force(names, suffixes, normalised) if normalised else []
+        for k in (0, 1, 8, 50):
+            assert index.complete(prefix, k) == expected[:k], (prefix, k)
+            assert index.complete(prefix.lower(), k) == expected[:k], (prefix, k)
+
+
+def test_pinned_seifa_does_not_replace_live_index():
+    live = get_suburb_index()
+    seifa = get_dataset("seifa")
+    pinned = seifa[seifa["SUBURB_KEY"] != "BLACKTOWN"].reset_index(drop=True)
+
+    with use_datasets({"seifa": ("test-no-blacktown", pinned)}):
+        assert get_suburb_index() is not live
+        assert "BLACKTOWN" not in get_suburb_index()
+
+    assert get_suburb_index() is live
+    assert "BLACKTOWN" in get_suburb_index()
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.compact import COMPACT_ENV_VAR, compact_dataset
+from data.features import FEATURE_COLUMNS, build_suburb_feature_table
+from data.loaders import LOCATION_REGISTRY, get_dataset, get_location_inputs
+from data.resolver import SAL_STATE_PREFIX, resolve_suburb, resolved_suburb_features
+
+
+def _compact(name):
+    return compact_dataset(get_dataset(name), name)[0]
+
+
+def test_compact_frames_score_the_same():
+    full = build_suburb_feature_table(get_dataset("crime"), get_dataset("seifa"))
+    compact = build_suburb_feature_table(_compact("crime"), _compact("seifa"))
+
+    assert compact["SUBURB_KEY"].astype(str).tolist() == full["SUBURB_KEY"].tolist()
+    for col in FEATURE_COLUMNS:
+        if pd.api.types.is_numeric_dtype(full[col]):
+            np.testing.assert_array_equal(
+                pd.to_numeric(compact[col]).to_numpy(dtype=float, na_value=np.nan),
+                full[col].to_numpy(dtype=float),
+                err_msg=col,
+            )
+        else:
+            assert compact[col].tolist() == full[col].tolist(), col
+
+
+def test_compact_frames_return_the_same_inputs():
+    names = ("crime", "seifa", "lga_irsad")
+    full = {name: get_dataset(name) for name in names}
+    compact = {name: _compact(name) for name in names}
+
+    suburb_keys = full["seifa"]["SUBURB_KEY"].tolist()[::5] + ["NOT A SUBURB"]
+    lga_keys = (full["lga_irsad"]["LGA_KEY"].tolist() * 20)[: len(suburb_keys)]
+
+    expected = get_location_inputs(full, suburb_keys, lga_keys)
+    actual = get_location_inputs(compact, suburb_keys, lga_keys)
+
+    for part, cols in [
+        ("crime", ["crime_12m", "crime_percentile"]),
+        ("seifa", ["IRSD_decile", "IRSAD_decile"]),
+        ("lga", ["IRSAD_decile"]),
+    ]:
+        for col in cols:
+            np.testing.assert_array_equal(
+                actual[part][col].to_numpy(dtype=float, na_value=np.nan),
+                expected[part][col].to_numpy(dtype=float, na_value=np.nan),
+                err_msg=f"{part}.{col}",
+            )
+
+
+def _duplicate_resolutions():
+    seifa = get_dataset("seifa")
+    rows = seifa[seifa["SUBURB_KEY"].duplicated()]
+    # Every duplicate with a missing decile, plus some complete ones
+    missing = rows[["IRSD_decile", "IRSAD_decile"]].isna().any(axis=1)
+    rows = pd.concat([rows[missing], rows[~missing].head(40)])
+    states = rows["suburb_code"].astype(str).str[:1].map(SAL_STATE_PREFIX)
+    return [
+        resolved_suburb_features(resolve_suburb(key, state))
+        for key, state in zip(rows["SUBURB_KEY"], states)
+    ]
+
+
+@pytest.fixture
+def compact_mode(monkeypatch):
+    def enable():
+        monkeypatch.setenv(COMPACT_ENV_VAR, "1")
+        for name in ("crime", "seifa"):
+            LOCATION_REGISTRY.unload(name)
+
+    yield enable
+    monkeypatch.delenv(COMPACT_ENV_VAR)
+    for name in ("crime", "seifa"):
+        LOCATION_REGISTRY.unload(name)
+
+
+def test_compact_mode_resolves_duplicate_suburbs_the_same(compact_mode):
+    full = _duplicate_resolutions()
+    assert any(f["score"] is None for f in full)
+
+    compact_mode()
+    assert get_dataset("seifa")["IRSD_decile"].dtype == "Int8"
+    assert _duplicate_resolutions() == full
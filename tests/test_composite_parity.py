@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.composite import (
+    CompositeScore,
+    compute_location_neighbourhood_score,
+    compute_location_neighbourhood_scores,
+)
+from policies.scoring_rules import round_score
+
+COMPONENTS = ["Location", "Zoning", "Lga", "Marketability"]
+
+
+def _random_scores(rng, n):
+    scores = rng.uniform(0, 100, size=(n, len(COMPONENTS)))
+    # Mix of 0, 1 and 2 dp scores, with some components missing
+    decimals = rng.integers(0, 3, size=scores.shape)
+    scores = np.choose(decimals, [np.round(scores), np.round(scores, 1), np.round(scores, 2)])
+    scores[rng.random(scores.shape) < 0.15] = np.nan
+    return pd.DataFrame(scores, columns=COMPONENTS)
+
+
+def _scalar(row, weights=None):
+    results = [
+        {"risk_name": name, "score": None if np.isnan(v) else float(v)}
+        for name, v in row.items()
+    ]
+    try:
+        return compute_location_neighbourhood_score(results, weights)
+    except ValueError:
+        return np.nan
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [None, {"Location": 0.35, "Zoning": 0.25, "Lga": 0.3, "Marketability": 0.1}],
+)
+def test_matrix_matches_scalar_on_float_scores(weights):
+    rng = np.random.default_rng(14)
+    scores = _random_scores(rng, 20_000)
+
+    matrix = compute_location_neighbourhood_scores(scores, weights)["score"].to_numpy()
+    scalar = np.array([_scalar(row, weights) for _, row in scores.iterrows()])
+
+    np.testing.assert_array_equal(matrix, scalar)
+
+
+def test_incremental_composite_matches_scalar():
+    rng = np.random.default_rng(21)
+    scores = dict(zip(COMPONENTS, [71.3, 40.0, 65.55, None]))
+    composite = CompositeScore(scores)
+
+    for _ in range(5_000):
+        name = COMPONENTS[rng.integers(len(COMPONENTS))]
+        value = None if rng.random() < 0.1 else float(np.round(rng.uniform(0, 100), 1))
+        scores[name] = value
+        update = composite.update(name, value)
+
+        expected = _scalar(pd.Series(scores, dtype=float))
+        assert update["score"] == expected or (
+            update["score"] is None and np.isnan(expected)
+        )
+
+
+def test_round_score_matches_python_round():
+    rng = np.random.default_rng(1)
+    values = np.concatenate(
+        [rng.uniform(0, 100, 100_000), rng.integers(0, 2_000, 100_000) / 20]
+    )
+
+    expected = np.array([round(v, 1) for v in values.tolist()])
+    np.testing.assert_array_equal(round_score(values), expected)
+    assert np.isnan(round_score(np.array([np.nan]))[0])
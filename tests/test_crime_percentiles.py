@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from data.crime_breakpoints import CrimeBreakpoints
+from data.crime_ingest import WINDOW_MONTHS, CrimeWindow
+
+
+def _window(totals):
+    months = list(pd.period_range("2024-07", periods=WINDOW_MONTHS, freq="M"))
+    counts = np.zeros((len(totals), WINDOW_MONTHS), dtype=np.int64)
+    counts[:, 0] = totals
+    return CrimeWindow([f"SUBURB {i}" for i in range(len(totals))], months, counts)
+
+
+def test_window_and_breakpoints_share_percentile_lookup():
+    totals = np.random.default_rng(10).integers(0, 400, 2_000)
+    window = _window(totals)
+    breakpoints = CrimeBreakpoints(totals)
+
+    for count in [*range(-5, 410), 10**6, 2.5, None, np.nan, "n/a"]:
+        assert window.percentile_of(count) == breakpoints.percentile_of(count)
+
+
+def test_percentile_capped_at_100():
+    window = _window([1, 2, 3])
+    assert window.percentile_of(3) == 100.0
+    assert window.percentile_of(1_000) == 100.0
+
+
+def test_empty_window_has_no_percentile():
+    assert _window([]).percentile_of(10) is None
+    assert CrimeBreakpoints([]).percentile_of(10) is None
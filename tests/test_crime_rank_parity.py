@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from data.crime_breakpoints import CrimeBreakpoints
+from data.crime_ingest import CrimeWindow
+from data.loaders import get_dataset
+
+
+def _rank(crime_12m):
+    return (crime_12m.rank(pct=True) * 100).to_numpy()
+
+
+def test_breakpoints_match_rank():
+    crime_12m = get_dataset("crime")["crime_12m"].astype(float).copy()
+    crime_12m.iloc[::97] = np.nan
+    breakpoints = CrimeBreakpoints(crime_12m)
+
+    np.testing.assert_array_equal(breakpoints.percentiles_of(crime_12m), _rank(crime_12m))
+    scalar = [breakpoints.percentile_of(c) for c in crime_12m]
+    np.testing.assert_array_equal(np.array(scalar, dtype=float), _rank(crime_12m))
+
+
+def test_window_matches_rank_before_and_after_roll():
+    crime = get_dataset("crime")
+    window = CrimeWindow.from_frame(crime)
+    np.testing.assert_array_equal(window.percentiles(), _rank(crime["crime_12m"]))
+
+    rng = np.random.default_rng(18)
+    for month in ["Jul 2025", "Aug 2025", "Sep 2025"]:
+        counts = pd.Series(
+            rng.integers(0, 60, len(window)), index=window.suburbs
+        ).sample(frac=0.8, random_state=rng.integers(1 << 31))
+        counts["A SUBURB NOT YET SEEN"] = int(rng.integers(0, 60))
+        window.roll(month, counts)
+
+        df = window.to_frame()
+        np.testing.assert_array_equal(df["crime_percentile"], _rank(df["crime_12m"]))
@@ -0,0 +1,66 @@
+import errno
+import os
+import shutil
+
+import pytest
+
+from data import crime_ingest, loaders
+from data.loaders import LOCATION_REGISTRY, crime_data_path, dataset_version, get_dataset
+
+
+@pytest.fixture
+def crime_dir(tmp_path, monkeypatch):
+    shutil.copy(crime_data_path(), tmp_path / crime_data_path().name)
+    monkeypatch.setattr(loaders, "COLLATERAL_DATA_DIR", tmp_path)
+    monkeypatch.setattr(loaders, "DATASET_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(loaders, "CRIME_CHECK_SECONDS", 0.0)
+    monkeypatch.setattr(loaders, "_CRIME_NEXT_CHECK", 0.0)
+    LOCATION_REGISTRY.unload("crime")
+    yield tmp_path
+    LOCATION_REGISTRY.unload("crime")
+
+
+def test_crime_reloaded_when_a_newer_window_is_published(crime_dir):
+    first = get_dataset("crime")
+    generation = dataset_version("crime")
+    assert get_dataset("crime") is first
+
+    # Another process publishes the next window
+    source = crime_dir / crime_data_path().name
+    newer = crime_dir / "suburb_crime_risk_12m_2999_01_to_2999_12.csv"
+    shutil.copy(source, newer)
+
+    assert get_dataset("crime") is not first
+    assert dataset_version("crime") > generation
+    assert crime_data_path() == newer
+
+
+def test_crime_reloaded_when_the_window_file_changes(crime_dir):
+    first = get_dataset("crime")
+    source = crime_data_path()
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert get_dataset("crime") is not first
+
+
+def test_failed_publish_leaves_the_window_for_a_retry(crime_dir, monkeypatch):
+    monkeypatch.setattr(crime_ingest, "_WINDOW", None)
+    window = crime_ingest.get_crime_window()
+    months = window.months
+    next_month = (months[-1] + 1).strftime(crime_ingest.MONTH_LABEL_FORMAT)
+    counts = {suburb: 1 for suburb in window.suburbs[:50]}
+
+    def disk_full(path, write):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    with monkeypatch.context() as m:
+        m.setattr(crime_ingest, "write_atomic", disk_full)
+        with pytest.raises(OSError):
+            crime_ingest.ingest_crime_month(next_month, counts, out_dir=crime_dir)
+
+    assert crime_ingest.get_crime_window().months == months
+
+    report = crime_ingest.ingest_crime_month(next_month, counts, out_dir=crime_dir)
+    assert report["month"] == next_month
+    assert crime_ingest.get_crime_window().months == months[1:] + [months[-1] + 1]
@@ -0,0 +1,39 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from data import cache, loaders
+from data.cache import load_cached_dataset
+
+SOURCES = [
+    ("crime", loaders.crime_data_path().name, loaders._build_crime_data),
+    ("seifa", "suburb_irsd_irsad.csv", loaders._build_seifa_data),
+    ("lga_irsad", "lga_irsad_2021_clean.csv", loaders._build_lga_irsad_data),
+]
+
+
+@pytest.mark.skipif(cache.feather is None, reason="pyarrow not installed")
+@pytest.mark.parametrize("name, file_name, build", SOURCES, ids=[s[0] for s in SOURCES])
+def test_cached_frame_matches_fresh_build(tmp_path, monkeypatch, name, file_name, build):
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, "1")
+    source = tmp_path / file_name
+    shutil.copy(loaders.COLLATERAL_DATA_DIR / file_name, source)
+    cache_dir = tmp_path / "cache"
+    expected = build(source)
+
+    builds = []
+    counted = lambda path: builds.append(path) or build(path)
+
+    cold = load_cached_dataset(name, source, counted, cache_dir)
+    warm = load_cached_dataset(name, source, counted, cache_dir)
+
+    # Touched but identical source: the artifact is reused
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = load_cached_dataset(name, source, counted, cache_dir)
+
+    assert len(builds) == 1
+    for frame in (cold, warm, touched):
+        pd.testing.assert_frame_equal(frame, expected)
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from data.features import get_suburb_features, location_result_from_features
+from data.loaders import get_location_datasets, get_location_inputs
+from policies.location import assess_location_risk
+
+
+def _value(row, col, cast):
+    if row is None or col not in row or pd.isna(row[col]):
+        return None
+    return cast(row[col])
+
+
+def test_features_match_lookup_and_scalar_policy():
+    datasets = get_location_datasets()
+    keys = set(datasets["crime"]["SUBURB_KEY"]) | set(datasets["seifa"]["SUBURB_KEY"])
+
+    for key in sorted(keys) + ["NOT A SUBURB", None]:
+        inputs = get_location_inputs(datasets, key)
+        expected = assess_location_risk(
+            crime_percentile=_value(inputs["crime"], "crime_percentile", float),
+            irsd_decile=_value(inputs["seifa"], "IRSD_decile", int),
+            irsad_decile=_value(inputs["seifa"], "IRSAD_decile", int),
+        )
+
+        assert location_result_from_features(get_suburb_features(key)) == expected, key
@@ -0,0 +1,59 @@
+import dataclasses
+import threading
+
+from data.features import get_suburb_feature_table, get_suburb_features
+from policies.scoring_rules import get_scoring_rules, use_scoring_rules
+from policies.tables import compile_policy_tables, use_policy_tables
+
+SUBURB = "BLACKTOWN"
+
+
+def _crime_only_rules():
+    return dataclasses.replace(
+        get_scoring_rules(),
+        location_weights=(("crime", 1.0), ("irsd", 0.0), ("irsad", 0.0)),
+        version="test-crime-only",
+    )
+
+
+def test_pinned_rules_do_not_leak_into_live_features():
+    live = get_suburb_features(SUBURB)["score"]
+    live_table = get_suburb_feature_table()
+    rules = _crime_only_rules()
+
+    with use_scoring_rules(rules), use_policy_tables(compile_policy_tables(rules.version)):
+        pinned = get_suburb_features(SUBURB)["score"]
+        assert get_suburb_feature_table() is not live_table
+
+    assert pinned != live
+    assert get_suburb_features(SUBURB)["score"] == live
+    assert get_suburb_feature_table() is live_table
+
+
+def test_concurrent_pinned_and_live_readers():
+    live = get_suburb_features(SUBURB)["score"]
+    rules = _crime_only_rules()
+    tables = compile_policy_tables(rules.version)
+    pinned = []
+    live_reads = []
+    start = threading.Barrier(2)
+
+    def pinned_reader():
+        start.wait()
+        for _ in range(50):
+            with use_scoring_rules(rules), use_policy_tables(tables):
+                pinned.append(get_suburb_features(SUBURB)["score"])
+
+    def live_reader():
+        start.wait()
+        for _ in range(50):
+            live_reads.append(get_suburb_features(SUBURB)["score"])
+
+    threads = [threading.Thread(target=pinned_reader), threading.Thread(target=live_reader)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert set(live_reads) == {live}
+    assert len(set(pinned)) == 1 and pinned[0] != live
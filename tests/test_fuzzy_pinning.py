@@ -0,0 +1,22 @@
+from data.fuzzy import get_suburb_matcher, suggest_suburbs
+from data.loaders import get_dataset, use_datasets
+
+
+def test_pinned_seifa_does_not_replace_live_matcher():
+    live = get_suburb_matcher()
+    seifa = get_dataset("seifa")
+    pinned_frame = seifa[seifa["SUBURB_KEY"] != "BLACKTOWN"].reset_index(drop=True)
+    crime = get_dataset("crime")
+    pinned_crime = crime[crime["SUBURB_KEY"] != "BLACKTOWN"].reset_index(drop=True)
+
+    with use_datasets(
+        {
+            "seifa": ("test-no-blacktown", pinned_frame),
+            "crime": ("test-no-blacktown-crime", pinned_crime),
+        }
+    ):
+        assert get_suburb_matcher() is not live
+        assert "BLACKTOWN" not in [key for key, _ in suggest_suburbs("BLACKTOWN")]
+
+    assert get_suburb_matcher() is live
+    assert suggest_suburbs("BLACKTONW")[0][0] == "BLACKTOWN"
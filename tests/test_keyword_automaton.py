@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from doc.Collateral.data.keyword_automaton import KeywordAutomaton, ahocorasick
+from doc.Collateral.data.land_risk_overlays import (
+    OVERLAY_KEYWORDS,
+    OVERLAY_RISK_PRIORITY,
+    classify_overlay_effect,
+)
+from doc.Collateral.data.land_risk_zoning_effect import (
+    ZONING_KEYWORDS,
+    ZONING_RISK_PRIORITY,
+    classify_zoning_effect,
+)
+
+TABLES = {
+    "overlay": (OVERLAY_KEYWORDS, OVERLAY_RISK_PRIORITY, classify_overlay_effect),
+    "zoning": (ZONING_KEYWORDS, ZONING_RISK_PRIORITY, classify_zoning_effect),
+}
+
+
+# The nested keyword loop the automaton replaced
+def _previous_classify(keywords, priority, text):
+    if not isinstance(text, str):
+        return "unknown"
+    text = text.lower().strip()
+    for level in priority:
+        for keyword in keywords[level]:
+            if keyword in text:
+                return level
+    return "unknown"
+
+
+def _texts(keywords, n=2_000):
+    rng = np.random.default_rng(15)
+    words = [k for level in keywords.values() for k in level]
+    fragments = [
+        " ", ", ", ". ", "the site ", "NOT ", "no ", "Zone ", "affected by ",
+        "\n", "  ", "-", "R2", "É",
+    ]
+    # Keyword halves give near misses as well as whole matches
+    fragments += [k[: len(k) // 2] for k in words]
+    pieces = words + fragments
+
+    texts = [None, "", "   ", 42]
+    for _ in range(n):
+        text = "".join(rng.choice(pieces, rng.integers(1, 8)))
+        texts.append(text.upper() if rng.random() < 0.3 else text)
+    return texts
+
+
+@pytest.mark.skipif(ahocorasick is None, reason="pyahocorasick not installed")
+@pytest.mark.parametrize("table", TABLES)
+def test_backends_find_identical_matches(table):
+    keywords, priority, _ = TABLES[table]
+    c_backend = KeywordAutomaton(keywords, priority, use_c_backend=True)
+    py_backend = KeywordAutomaton(keywords, priority, use_c_backend=False)
+
+    for text in _texts(keywords):
+        assert c_backend.find_all(text) == py_backend.find_all(text)
+        assert c_backend.classify(text) == py_backend.classify(text)
+
+
+@pytest.mark.parametrize("use_c_backend", [True, False])
+@pytest.mark.parametrize("table", TABLES)
+def test_classification_matches_previous(table, use_c_backend):
+    keywords, priority, classify = TABLES[table]
+    automaton = KeywordAutomaton(keywords, priority, use_c_backend=use_c_backend)
+
+    for text in _texts(keywords):
+        expected = _previous_classify(keywords, priority, text)
+        assert automaton.classify(text)[0] == expected
+        assert classify(text) == expected
@@ -0,0 +1,111 @@
+import json
+
+import pandas as pd
+import pytest
+
+from doc.Collateral.data import land_risk_batch
+from doc.Collateral.data.land_risk_batch import OUTPUT_COLUMNS, run_batch
+from doc.Collateral.data.land_risk_overlays import score_overlay_effect
+from doc.Collateral.data.land_risk_valuation_risk_alerts import score_valuation_risk_alert
+from doc.Collateral.data.land_risk_zoning_effect import score_zoning_effect
+
+DOCUMENTS = [
+    {
+        "doc_id": "16_Middleton_Avenue",
+        "overlay": "No overlays affect the subject property.",
+        "zoning_effect": "Residential use is permitted.",
+        "valuation_risk_alert": "No",
+    },
+    {
+        "doc_id": 7,
+        "overlay": "Heritage listed; flood-prone land to the rear.",
+        "zoning_effect": "Existing use is non-conforming and development potential may be limited.",
+        "valuation_risk_alert": "Yes",
+    },
+    {"doc_id": "no_sections"},
+    {
+        "overlay": "FLOOD OVERLAY APPLIES",
+        "zoning_effect": "Use prohibited",
+        "valuation_risk_alert": " yes ",
+    },
+]
+
+
+def _serial(record, source, error=None):
+    overlay = score_overlay_effect(record.get("overlay"))
+    zoning = score_zoning_effect(record.get("zoning_effect"))
+    alert = score_valuation_risk_alert(record.get("valuation_risk_alert"))
+    doc_id = record.get("doc_id")
+    return {
+        "doc_id": str(doc_id) if doc_id is not None else source,
+        "source": source,
+        "overlay_risk_level": overlay["overlay_risk_level"],
+        "overlay_score": overlay["overlay_score"],
+        "overlay_evidence": json.dumps(overlay["overlay_evidence"], ensure_ascii=False),
+        "zoning_risk_level": zoning["zoning_risk_level"],
+        "zoning_score": zoning["zoning_score"],
+        "zoning_evidence": json.dumps(zoning["zoning_evidence"], ensure_ascii=False),
+        "valuation_risk_level": alert["valuation_risk_level"],
+        "valuation_risk_score": alert["valuation_risk_score"],
+        "error": error,
+    }
+
+
+@pytest.fixture
+def sections(tmp_path):
+    source = tmp_path / "sections"
+    source.mkdir()
+
+    lines = [json.dumps(doc) for doc in DOCUMENTS[:3]]
+    (source / "a.jsonl").write_text(
+        lines[0] + "\n\n" + lines[1] + "\n{not json\n" + lines[2] + "\n[1, 2]\n",
+        encoding="utf-8",
+    )
+    (source / "b.json").write_text(json.dumps(DOCUMENTS[3]), encoding="utf-8")
+    (source / "c_empty.json").write_text("", encoding="utf-8")
+
+    expected = [
+        _serial(DOCUMENTS[0], "a.jsonl:1"),
+        _serial(DOCUMENTS[1], "a.jsonl:3"),
+        _serial({}, "a.jsonl:4", "invalid JSON"),
+        _serial(DOCUMENTS[2], "a.jsonl:5"),
+        _serial({}, "a.jsonl:6", "record is not a JSON object"),
+        _serial(DOCUMENTS[3], "b.json"),
+        _serial({}, "c_empty.json", "invalid JSON"),
+    ]
+    return source, pd.DataFrame(expected, columns=OUTPUT_COLUMNS)
+
+
+def _read(path):
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 500), (2, 1), (3, 2)])
+def test_batch_matches_serial_scoring(sections, tmp_path, workers, chunk_size):
+    source, expected = sections
+    report = run_batch(source, tmp_path / "scores.parquet", workers, chunk_size)
+
+    assert report["documents"] == len(expected)
+    assert report["errors"] == expected["error"].notna().sum()
+
+    actual = _read(report["output"])
+    # Parse errors carry the parser's message after the prefix
+    for error, prefix in zip(actual["error"], expected["error"]):
+        assert pd.isna(error) if pd.isna(prefix) else error.startswith(prefix)
+    pd.testing.assert_frame_equal(
+        actual.drop(columns="error"),
+        expected.drop(columns="error"),
+        check_dtype=False,
+    )
+
+
+def test_csv_output_without_pyarrow(sections, tmp_path, monkeypatch):
+    source, expected = sections
+    monkeypatch.setattr(land_risk_batch, "pa", None)
+
+    report = run_batch(source, tmp_path / "scores.parquet", workers=1)
+
+    assert report["output"].endswith(".csv")
+    actual = _read(report["output"])
+    assert actual["doc_id"].astype(str).tolist() == expected["doc_id"].tolist()
+    assert actual["overlay_score"].tolist() == expected["overlay_score"].tolist()
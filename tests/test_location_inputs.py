@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from data.loaders import build_key_index, get_location_datasets, get_location_inputs
+
+SOURCES = [("crime", "SUBURB_KEY"), ("seifa", "SUBURB_KEY"), ("lga_irsad", "LGA_KEY")]
+
+
+# The boolean-mask lookup the key index replaced
+def _previous_row(df, key_col, key):
+    matched = df[df[key_col] == key]
+    return None if matched.empty else matched.iloc[0]
+
+
+@pytest.fixture(scope="module")
+def datasets():
+    return get_location_datasets()
+
+
+@pytest.mark.parametrize("name, key_col", SOURCES)
+def test_key_index_is_first_occurrence(datasets, name, key_col):
+    df = datasets[name]
+    index = build_key_index(df, key_col)
+
+    first = pd.Series(range(len(df))).groupby(df[key_col].to_numpy()).min()
+    assert index == first.to_dict()
+
+
+def test_inputs_match_mask_lookup(datasets):
+    suburb_keys = sorted(
+        set(datasets["crime"]["SUBURB_KEY"]) | set(datasets["seifa"]["SUBURB_KEY"])
+    )[::7]
+    lga_keys = sorted(set(datasets["lga_irsad"]["LGA_KEY"]))
+    lga_keys = (lga_keys * (len(suburb_keys) // len(lga_keys) + 1))[: len(suburb_keys)]
+
+    suburb_keys[::10] = ["NOT A SUBURB"] * len(suburb_keys[::10])
+    lga_keys[::15] = ["NOT AN LGA"] * len(lga_keys[::15])
+
+    bulk = get_location_inputs(datasets, suburb_keys, lga_keys)
+
+    for i, (suburb_key, lga_key) in enumerate(zip(suburb_keys, lga_keys)):
+        single = get_location_inputs(datasets, suburb_key, lga_key)
+        keys = {"crime": suburb_key, "seifa": suburb_key, "lga": lga_key}
+
+        for (name, key_col), part in zip(SOURCES, ["crime", "seifa", "lga"]):
+            expected = _previous_row(datasets[name], key_col, keys[part])
+            if expected is None:
+                assert single[part] is None
+                assert bulk[part].iloc[i].isna().all()
+            else:
+                pd.testing.assert_series_equal(single[part], expected)
+                pd.testing.assert_series_equal(
+                    bulk[part].iloc[i], expected, check_names=False, check_dtype=False
+                )
@@ -0,0 +1,62 @@
+import dataclasses
+import itertools
+
+import numpy as np
+import pytest
+
+from policies.location import assess_location_risk, assess_location_risk_batch
+from policies.scoring_rules import LOCATION_COMPONENTS, get_scoring_rules, use_scoring_rules
+from policies.tables import compile_policy_tables, use_policy_tables
+
+PERCENTILES = [None, *np.arange(0, 100.5, 0.5).tolist()]
+DECILES = [None, *range(1, 11)]
+
+
+def _random_policy(seed: int):
+    """
+    Live rules and tables (seed 0), or a YAML-like variant: weights in
+    steps of 0.05 and integer crime / decile scores. Those put weighted
+    means exactly on .x5, where np.round and round() disagree.
+    """
+    rules = get_scoring_rules()
+    if seed == 0:
+        return rules, compile_policy_tables(rules.version)
+
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 20, len(LOCATION_COMPONENTS)) / 20
+    crime_scores = rng.integers(0, 101, len(rules.crime_score_bands))
+    rules = dataclasses.replace(
+        rules,
+        location_weights=tuple(zip(LOCATION_COMPONENTS, weights.tolist())),
+        crime_score_bands=tuple(
+            dataclasses.replace(band, score=int(score))
+            for band, score in zip(rules.crime_score_bands, crime_scores)
+        ),
+        version=f"test-random-{seed}",
+    )
+    tables = dataclasses.replace(
+        compile_policy_tables(rules.version),
+        irsd_decile_scores=dict(zip(range(1, 11), rng.integers(0, 101, 10).tolist())),
+        irsad_decile_scores=dict(zip(range(1, 11), rng.integers(0, 101, 10).tolist())),
+    )
+    return rules, tables
+
+
+@pytest.mark.parametrize("seed", [0, 6, 10, 17])
+def test_batch_matches_scalar(seed):
+    rules, tables = _random_policy(seed)
+    combos = list(itertools.product(PERCENTILES, DECILES, DECILES))
+    crime, irsd, irsad = (
+        np.array([np.nan if v is None else v for v in column], dtype=float)
+        for column in zip(*combos)
+    )
+
+    with use_scoring_rules(rules), use_policy_tables(tables):
+        batch = assess_location_risk_batch(crime, irsd, irsad)
+        scalar = [assess_location_risk(*combo) for combo in combos]
+
+    expected = np.array([np.nan if r["score"] is None else r["score"] for r in scalar])
+    np.testing.assert_array_equal(batch["score"].to_numpy(), expected)
+    assert batch["label"].astype(object).fillna("Unknown").tolist() == [
+        r["label"] for r in scalar
+    ]
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.loaders import get_dataset
+from data.normalisation import (
+    normalise_lga_name,
+    normalise_lga_names,
+    normalise_suburb_name,
+    normalise_suburb_names,
+)
+
+STATE_SUFFIXES = ["(NSW)", "(VIC)", "(QLD)", "(WA)", "(SA)", "(TAS)", "(ACT)", "(NT)"]
+
+
+# The chained .replace implementations the compiled patterns replaced
+def _previous_suburb(name):
+    if pd.isna(name):
+        return ""
+    for suffix in STATE_SUFFIXES:
+        name = name.upper().replace(suffix, "")
+    return name.upper().strip()
+
+
+def _previous_lga(name):
+    if not name:
+        return ""
+    cleaned = name.upper()
+    for noise in [*STATE_SUFFIXES, "COUNCIL", "CITY OF", "CITY"]:
+        cleaned = cleaned.replace(noise, "")
+    return " ".join(cleaned.strip().split())
+
+
+def _dataset_names():
+    return pd.concat(
+        [
+            get_dataset("crime")["Suburb"],
+            get_dataset("seifa")["suburb_name"],
+            get_dataset("lga_irsad")["lga_name"],
+        ],
+        ignore_index=True,
+    ).astype(str)
+
+
+def _token_names(n=50_000):
+    rng = np.random.default_rng(4)
+    tokens = [
+        *STATE_SUFFIXES, "COUNCIL", "CITY OF", "CITY", "City", "council",
+        "The", "Hills", "Shire", " ", "  ", "(", ")", "ÉCOLE", "\t",
+        # Token halves, so removing one token can join another
+        "(N", "SW)", "(V", "IC)", "COUN", "CIL", "C", "ITY", "CITY O", "F",
+    ]
+    nested = ["COUN(NSW)CIL", "CCITY OFITY", "(V(NSW)IC) X", "CITY O(NSW)F", "(NS(VIC)W)"]
+    return pd.Series(
+        nested + ["".join(rng.choice(tokens, rng.integers(1, 7))) for _ in range(n)],
+        dtype=str,
+    )
+
+
+@pytest.mark.parametrize("names", [_dataset_names, _token_names], ids=["datasets", "tokens"])
+def test_vectorised_normalisation_matches_previous(names):
+    names = names()
+
+    assert normalise_suburb_names(names).tolist() == [_previous_suburb(n) for n in names]
+    assert normalise_lga_names(names).tolist() == [_previous_lga(n) for n in names]
+    assert [normalise_suburb_name(n) for n in names] == [_previous_suburb(n) for n in names]
+    assert [normalise_lga_name(n) for n in names] == [_previous_lga(n) for n in names]
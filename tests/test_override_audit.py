@@ -0,0 +1,120 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from data import override_audit
+from data.override_audit import OverrideAuditLog
+
+PAGES = Path(__file__).resolve().parents[1] / "pages"
+
+
+def _override(component, adjusted):
+    return {
+        "module": "location",
+        "component": component,
+        "original_score": 40.0,
+        "adjusted_score": adjusted,
+        "trigger": "analyst review",
+        "justification": f"{component} checked on site",
+    }
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = OverrideAuditLog(tmp_path / "audit.sqlite3")
+    log.append(_override("Crime", 60.0), analyst="amy", assessment_id="a1")
+    log.append(_override("Zoning", 70.0), analyst="bo", assessment_id="a2")
+    log.flush()
+    yield log
+    log.close()
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "UPDATE override_audit SET adjusted_score = 100",
+        "UPDATE override_audit SET justification = 'n/a' WHERE component = 'Crime'",
+        "DELETE FROM override_audit",
+        "DELETE FROM override_audit WHERE analyst = 'bo'",
+    ],
+)
+def test_log_is_append_only(log, sql):
+    before = log.entries()
+    assert len(before) == 2
+
+    conn = sqlite3.connect(log.path)
+    try:
+        with pytest.raises(sqlite3.DatabaseError, match="append-only"):
+            conn.execute(sql)
+            conn.commit()
+    finally:
+        conn.close()
+
+    assert log.entries() == before
+
+
+def test_appends_still_accepted(log):
+    log.append(_override("Crime", 80.0), analyst="amy", assessment_id="a1")
+    log.flush()
+
+    assert [e["adjusted_score"] for e in log.entries(component="Crime")] == [60.0, 80.0]
+
+
+def _broken(log, monkeypatch):
+    def fail(conn, writes):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(log, "_commit_with_retry", fail)
+
+
+@pytest.mark.filterwarnings("ignore:.*write failed")
+def test_record_raises_when_the_entry_is_not_committed(log, monkeypatch):
+    log.record(_override("Crime", 90.0), analyst="amy")
+    assert len(log.entries()) == 3
+
+    _broken(log, monkeypatch)
+    with pytest.raises(sqlite3.OperationalError, match="disk I/O"):
+        log.record(_override("Crime", 95.0), analyst="amy")
+    monkeypatch.undo()
+
+    assert [e["adjusted_score"] for e in log.entries(component="Crime")] == [60.0, 90.0]
+
+
+def _confirm_override(log, monkeypatch):
+    monkeypatch.setattr(override_audit, "_LOG", log)
+
+    at = AppTest.from_file(str(PAGES / "5_Manual_Review.py"), default_timeout=60)
+    at.session_state["manual_override"] = {
+        "module": "Zoning",
+        "component": "Zoning",
+        "original_score": 40,
+        "trigger": "Policy Warning",
+    }
+    at.session_state["applied_overrides"] = {}
+    at.run()
+    at.text_area[0].input("Council confirmed the rezoning")
+    analyst = at.text_input[0]
+    if not analyst.disabled:
+        analyst.input("amy")
+    next(b for b in at.button if "Confirm" in b.label).click()
+    at.run()
+    return at
+
+
+@pytest.mark.filterwarnings("ignore:.*write failed")
+def test_override_not_applied_without_its_audit_entry(log, monkeypatch):
+    _broken(log, monkeypatch)
+    at = _confirm_override(log, monkeypatch)
+
+    assert "audit log" in at.error[0].value
+    assert at.session_state["applied_overrides"] == {}
+    assert at.session_state["manual_override"] is not None
+
+
+def test_override_applied_once_its_audit_entry_is_committed(log, monkeypatch):
+    at = _confirm_override(log, monkeypatch)
+
+    assert "Zoning" in at.session_state["applied_overrides"]
+    assert log.entries(component="Zoning")[-1]["justification"] == "Council confirmed the rezoning"
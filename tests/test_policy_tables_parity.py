@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from data.loaders import get_dataset
+from policies.lga import assess_lga_risk
+from policies.location import assess_location_risk
+from policies.marketability import assess_marketability_risk
+from policies.zoning import (
+    ZONING_POLICY_REGISTRY,
+    assess_zoning_risk,
+    load_non_residential_zoning_scoring_table,
+    load_residential_zoning_scoring_table,
+)
+
+
+# Policies as they were before the compiled tables and the YAML rules:
+# DataFrame lookups and hard-coded weights, bands and text
+def _previous_location(crime_percentile, irsd_decile, irsad_decile):
+    def crime_score(p):
+        if p is None:
+            return None
+        for cut, score in [(90, 100), (75, 80), (50, 60), (25, 40)]:
+            if p >= cut:
+                return score
+        return 20
+
+    def crime_text(p):
+        if p is None:
+            return "Crime data unavailable at suburb level."
+        if p >= 75:
+            return "Crime incidence is materially lower than comparable suburbs."
+        if p >= 50:
+            return "Crime levels are broadly in line with metropolitan averages."
+        return "Elevated crime incidence relative to comparable suburbs."
+
+    def decile_score(decile):
+        return decile * 10 if decile in range(1, 11) else None
+
+    scores = [
+        (crime_score(crime_percentile), 0.4),
+        (decile_score(irsd_decile), 0.3),
+        (decile_score(irsad_decile), 0.3),
+    ]
+    weighted = sum(s * w for s, w in scores if s is not None)
+    total = sum(w for s, w in scores if s is not None)
+    if total == 0:
+        return {
+            "risk_name": "Location", "score": None, "label": "Unknown", "icon": "⚪",
+            "flags": ["INSUFFICIENT_DATA"], "requires_manual_review": True,
+            "rationale": "Insufficient data to assess location risk.",
+        }
+
+    score = round(weighted / total, 1)
+    label, icon = (
+        ("Low Risk", "🟢") if score >= 75
+        else ("Moderate Risk", "🟡") if score >= 50
+        else ("Elevated Risk", "🔴")
+    )
+    partial = any(s is None for s, _ in scores)
+
+    rationale = [crime_text(crime_percentile)]
+    if scores[1][0] is not None:
+        rationale.append(f"IRSD decile {irsd_decile} reflects relative socio-economic disadvantage.")
+    if scores[2][0] is not None:
+        rationale.append(f"IRSAD decile {irsad_decile} indicates overall advantage/disadvantage profile.")
+
+    return {
+        "risk_name": "Location", "score": score, "label": label, "icon": icon,
+        "flags": ["PARTIAL_DATA_USED"] if partial else [],
+        "requires_manual_review": partial, "rationale": " ".join(rationale),
+    }
+
+
+def _previous_zoning_band(score):
+    if score >= 70:
+        return "Low Risk", "🟢"
+    if score >= 50:
+        return "Moderate Risk", "🟡"
+    return "Elevated Risk", "🔴"
+
+
+def _previous_lga_band(decile):
+    if decile >= 8:
+        return "Low Risk", "🟢", 90
+    if decile >= 5:
+        return "Moderate Risk", "🟡", 60
+    return "Elevated Risk", "🔴", 30
+
+
+def test_location_matches_previous_on_grid():
+    percentiles = [None, *np.arange(0, 100.5, 0.5).tolist(), 24.999, 89.99]
+    deciles = [None, *range(0, 12)]
+
+    for p in percentiles:
+        for irsd in deciles:
+            for irsad in deciles:
+                assert assess_location_risk(p, irsd, irsad) == _previous_location(
+                    p, irsd, irsad
+                ), (p, irsd, irsad)
+
+
+def test_zoning_matches_source_tables():
+    residential = load_residential_zoning_scoring_table()
+    non_residential = load_non_residential_zoning_scoring_table()
+    # Residential codes are looked up first
+    non_residential = non_residential[
+        ~non_residential["Zoning Code"].isin(residential["Zoning Code"])
+    ]
+
+    for code, score in zip(residential["Zoning Code"], residential["Score"]):
+        result = assess_zoning_risk(f" {code.lower()} ")
+        policy = ZONING_POLICY_REGISTRY.get(code)
+        assert result["score"] == score
+        assert (result["label"], result["icon"]) == _previous_zoning_band(score)
+        assert result["flags"] == ([policy["flag"]] if policy else [])
+
+    for code, score in zip(non_residential["Zoning Code"], non_residential["Score"]):
+        result = assess_zoning_risk(code)
+        assert result["score"] == score
+        assert (result["label"], result["icon"]) == _previous_zoning_band(score)
+        assert result["flags"] == ["NON_RESIDENTIAL_ZONING"] + (
+            ["RESTRICTIVE_ZONING"] if score <= 20 else []
+        )
+
+    unclassified = assess_zoning_risk("ZZ9")
+    assert (unclassified["score"], unclassified["label"]) == (20, "Elevated Risk")
+
+
+def test_lga_matches_previous_bands():
+    # Names normalise to their key; the first row of a key is used
+    lgas = get_dataset("lga_irsad").drop_duplicates("LGA_KEY")
+    for name, decile in zip(lgas["lga_name"], lgas["IRSAD_decile"]):
+        result = assess_lga_risk(name)
+        assert (result["label"], result["icon"], result["score"]) == _previous_lga_band(
+            int(decile)
+        ), name
+
+
+@pytest.mark.parametrize(
+    "level, expected",
+    [
+        ("very good", (90, "Low Risk")),
+        ("Good", (80, "Low Risk")),
+        (" AVERAGE ", (60, "Moderate Risk")),
+        ("fair", (40, "Elevated Risk")),
+        ("POOR", (20, "High Risk")),
+        ("excellent", (None, "Unknown")),
+    ],
+)
+def test_marketability_matches_previous(level, expected):
+    result = assess_marketability_risk(level)
+    assert (result["score"], result["label"]) == expected
@@ -0,0 +1,24 @@
+from data.loaders import get_dataset, install_dataset, use_datasets
+from data.resolver import get_suburb_resolver, resolve_suburb
+
+
+def test_pinned_seifa_does_not_replace_live_resolver():
+    live = get_suburb_resolver()
+    seifa = get_dataset("seifa")
+    pinned_frame = seifa[seifa["SUBURB_KEY"] != "BLACKTOWN"].reset_index(drop=True)
+
+    with use_datasets({"seifa": ("test-no-blacktown", pinned_frame)}):
+        pinned = get_suburb_resolver()
+        assert pinned is not live
+        assert resolve_suburb("BLACKTOWN").key is None
+        assert get_suburb_resolver() is pinned
+
+    assert get_suburb_resolver() is live
+    assert resolve_suburb("BLACKTOWN").key == "BLACKTOWN"
+
+
+def test_resolver_rebuilt_when_seifa_is_replaced():
+    live = get_suburb_resolver()
+    install_dataset("seifa", get_dataset("seifa").copy())
+
+    assert get_suburb_resolver() is not live
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from engine.composite import CompositeScore, compute_location_neighbourhood_score
+from policies.marketability import assess_marketability_risk
+
+PAGES = Path(__file__).resolve().parents[1] / "pages"
+
+
+def _assess(marketability):
+    at = AppTest.from_file(str(PAGES / "2_Neighbourhood_Risk.py"), default_timeout=60)
+    at.run()
+    at.text_input[0].input("1 Main St")
+    at.text_input[1].input("Castle Hill")
+    at.text_input[2].input("2154")
+    at.text_input[-1].input("The Hills Shire Council")
+    for box in at.selectbox:
+        if box.label == "Marketability Assessment":
+            box.select(marketability)
+    at.run()
+    assert not at.exception
+    return at.session_state["neighbourhood_result"]
+
+
+# Location 100 / Zoning 65 / LGA 90 / Marketability 80
+def test_engine_scores_marketability():
+    results = [
+        {"risk_name": "Location", "score": 100.0},
+        {"risk_name": "Zoning", "score": 65},
+        {"risk_name": "LGA Socio-Economic", "score": 90},
+        assess_marketability_risk("GOOD"),
+    ]
+    components = {
+        "Location": {"score": 100.0},
+        "Zoning": {"score": 65},
+        "Lga": {"score": 90},
+        "Marketability": assess_marketability_risk("GOOD"),
+    }
+
+    assert compute_location_neighbourhood_score(results) == 83.8
+    assert CompositeScore.from_components(components).score == 83.8
+
+
+@pytest.mark.parametrize("marketability", ["Good", "Poor"])
+def test_stored_score_matches_results_page(marketability):
+    result = _assess(marketability)
+
+    assert result["components"]["Marketability"]["score"] is not None
+    assert result["score"] == CompositeScore.from_components(result["components"]).score
+
+    results_page = AppTest.from_file(
+        str(PAGES / "3_Neighbourhood_Risk_Results.py"), default_timeout=60
+    )
+    results_page.session_state["neighbourhood_result"] = result
+    results_page.run()
+    assert not results_page.exception
+    assert results_page.session_state["neighbourhood_result"]["composite"].score == result["score"]
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from engine.composite import compute_location_neighbourhood_score
+from engine.sensitivity import _weighted_scores, composite_sensitivity, weight_grid
+
+COMPONENTS = ["Location", "Zoning", "Lga", "Marketability"]
+
+
+def _random_scores(rng, n):
+    scores = np.round(rng.uniform(0, 100, size=(n, len(COMPONENTS))), 1)
+    scores[rng.random(scores.shape) < 0.15] = np.nan
+    return pd.DataFrame(scores, columns=COMPONENTS)
+
+
+def _scalar(row, weights):
+    results = [
+        {"risk_name": name, "score": None if np.isnan(v) else float(v)}
+        for name, v in row.items()
+    ]
+    try:
+        return compute_location_neighbourhood_score(results, weights)
+    except ValueError:
+        return np.nan
+
+
+def test_scenario_scores_match_scalar():
+    rng = np.random.default_rng(19)
+    scores = _random_scores(rng, 4_000)
+    # YAML-like weights (steps of 0.05) put many means exactly on .x5
+    weights = rng.integers(1, 20, size=(6, len(COMPONENTS))) / 20
+
+    scenario_scores = _weighted_scores(scores.to_numpy(), weights)
+
+    for scenario, row_weights in zip(scenario_scores, weights):
+        named = dict(zip(COMPONENTS, row_weights.tolist()))
+        expected = np.array([_scalar(row, named) for _, row in scores.iterrows()])
+        np.testing.assert_array_equal(scenario, expected)
+
+
+def test_live_scenario_reproduces_live_ratings():
+    rng = np.random.default_rng(20)
+    scores = _random_scores(rng, 4_000)
+    grid = weight_grid({c: [1.0, 0.5] for c in COMPONENTS}, COMPONENTS)
+
+    result = composite_sensitivity(scores, grid)
+
+    # Scenario 0 is the live (equal) weighting: nothing migrates
+    assert result.scenarios.loc[0, "changed"] == 0
+    assert np.trace(result.migrations[0]) == len(scores)
@@ -0,0 +1,53 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+
+from data.features import FEATURE_COLUMNS, get_suburb_feature_table
+from data.snapshots import SnapshotStore
+from policies.scoring_rules import get_scoring_rules, use_scoring_rules
+from policies.tables import compile_policy_tables, use_policy_tables
+
+
+def _assert_same(actual, expected):
+    for col in FEATURE_COLUMNS:
+        if pd.api.types.is_numeric_dtype(expected[col]):
+            np.testing.assert_array_equal(
+                actual[col].to_numpy(dtype=float, na_value=np.nan),
+                expected[col].to_numpy(dtype=float, na_value=np.nan),
+                err_msg=col,
+            )
+        else:
+            assert actual[col].tolist() == expected[col].tolist(), col
+
+
+def test_rescoring_the_live_version_reproduces_the_feature_table(tmp_path):
+    store = SnapshotStore(tmp_path)
+    version = store.save()
+
+    live = get_suburb_feature_table().set_index("SUBURB_KEY")
+    keys = [*live.index[::-1], "NOT A SUBURB"]
+
+    rescored = store.rescore_location(keys, version)
+
+    assert rescored.index.tolist() == keys
+    assert rescored.attrs["scoring_version"]["id"] == version.id
+    _assert_same(rescored, live.reindex(keys))
+
+
+def test_rescoring_a_changed_version_differs(tmp_path):
+    store = SnapshotStore(tmp_path)
+    rules = dataclasses.replace(
+        get_scoring_rules(),
+        location_weights=(("crime", 1.0), ("irsd", 0.0), ("irsad", 0.0)),
+        version="test-crime-only",
+    )
+    with use_scoring_rules(rules), use_policy_tables(compile_policy_tables(rules.version)):
+        crime_only = store.save()
+        expected = get_suburb_feature_table().set_index("SUBURB_KEY")
+
+    live = get_suburb_feature_table().set_index("SUBURB_KEY")
+    rescored = store.rescore_location(live.index, crime_only)
+
+    _assert_same(rescored, expected.reindex(live.index))
+    assert (rescored["score"] != live["score"]).any()
@@ -0,0 +1,44 @@
+import pytest
+
+from data import snapshots
+from data.snapshots import SnapshotStore, stamp_scoring_version
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, "_SAVED_VERSIONS", set())
+    return SnapshotStore(tmp_path)
+
+
+def test_stamped_version_is_saved_once(store, monkeypatch):
+    saves = []
+    save = store.save
+    monkeypatch.setattr(store, "save", lambda: saves.append(1) or save())
+
+    first = stamp_scoring_version(store)
+    second = stamp_scoring_version(store)
+
+    assert first == second
+    assert len(saves) == 1
+    assert store.get_version(first.id) == first
+
+
+def test_stamped_version_can_be_replayed(store):
+    version = stamp_scoring_version(store)
+
+    with store.pinned(version.id) as pinned:
+        assert snapshots.scoring_version() == pinned
+
+
+def test_unwritable_store_still_stamps(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, "_SAVED_VERSIONS", set())
+    # A file where the store's directories should go
+    root = tmp_path / "snapshots"
+    root.write_text("")
+    store = SnapshotStore(root)
+
+    with pytest.warns(UserWarning, match="not saved"):
+        version = stamp_scoring_version(store)
+
+    assert version == snapshots.scoring_version()
+    assert version.id not in snapshots._SAVED_VERSIONS
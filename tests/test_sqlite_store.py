@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+from data import sqlite_store
+from data.sqlite_store import BatchedSQLiteStore
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, body TEXT NOT NULL);"
+
+
+class FlakyCommitConnection(sqlite3.Connection):
+    """
+    Connection whose first `failures` COMMITs fail as a busy database
+    would, after the statements of the transaction have run.
+    """
+
+    failures = 0
+
+    def execute(self, sql, *args):
+        if sql == "COMMIT" and FlakyCommitConnection.failures:
+            FlakyCommitConnection.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().execute(sql, *args)
+
+
+class FlakyStore(BatchedSQLiteStore):
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, factory=FlakyCommitConnection
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "COMMIT_RETRY_SECONDS", 0.0)
+    monkeypatch.setattr(FlakyCommitConnection, "failures", 0)
+    store = FlakyStore(tmp_path / "notes.sqlite3", SCHEMA)
+    yield store
+    store.close()
+
+
+def _note(body):
+    return [("INSERT INTO notes (body) VALUES (?)", (body,))]
+
+
+def _bodies(store):
+    return [r["body"] for r in store._reader().execute("SELECT body FROM notes ORDER BY id")]
+
+
+def test_busy_commit_is_rolled_back_and_retried(store):
+    FlakyCommitConnection.failures = 2
+    store._submit(_note("first"))
+    store._submit(_note("second"))
+
+    assert _bodies(store) == ["first", "second"]
+    assert store.last_error is None
+
+    # The writer's connection was left usable
+    store._submit(_note("third"))
+    assert _bodies(store) == ["first", "second", "third"]
+
+
+@pytest.mark.filterwarnings("ignore:.*write failed")
+def test_persistent_commit_failure_is_reported_not_half_applied(store):
+    FlakyCommitConnection.failures = 10 * sqlite_store.COMMIT_ATTEMPTS
+    store._submit(_note("lost"))
+    store.flush()
+
+    FlakyCommitConnection.failures = 0
+    assert "locked" in store.last_error
+    assert _bodies(store) == []
+
+    store._submit(_note("kept"))
+    assert _bodies(store) == ["kept"]
+
+
+@pytest.mark.filterwarnings("ignore:.*write failed")
+def test_bad_write_only_loses_itself(store):
+    good = store._submit(_note("good"))
+    bad = store._submit(_note(None))
+    also_good = store._submit(_note("also good"))
+
+    assert _bodies(store) == ["good", "also good"]
+    assert "NOT NULL" in store.last_error
+
+    # Each write's future reports its own outcome
+    assert good.result() is None and also_good.result() is None
+    with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+        bad.result()
@@ -0,0 +1,50 @@
+import yaml
+
+from utils.startup_profile import app_scripts, check_budget, profile_app
+
+PAGES = [s for s in app_scripts() if s.startswith("pages/")]
+
+
+def test_profiles_every_page_against_the_budget(tmp_path):
+    # Generous defaults so a slow machine doesn't flake; one page is
+    # given an impossible render budget so the check has to flag it
+    budget = tmp_path / "budget.yaml"
+    budget.write_text(
+        yaml.safe_dump(
+            {
+                "default": {"import_ms": 60_000, "render_ms": 60_000},
+                "pages": {PAGES[0]: {"render_ms": 0}},
+            }
+        )
+    )
+
+    report = profile_app(PAGES, budget)
+
+    assert [r["script"] for r in report["scripts"]] == PAGES
+    for result in report["scripts"]:
+        assert "error" not in result, result.get("error")
+        assert result["import_ms"] > 0 and result["render_ms"] > 0
+        assert result["imports"] and all(i["error"] is None for i in result["imports"])
+        assert result["render_exceptions"] == []
+        # The location registry loads lazily, on first render
+        assert result["datasets_loaded_on_import"] == []
+
+    first, *rest = report["scripts"]
+    assert first["budget"] == {"import_ms": 60_000, "render_ms": 0}
+    assert first["over_budget"] == [f"render_ms {first['render_ms']:.0f} > 0"]
+    assert all(r["ok"] for r in rest)
+    assert report["over_budget"] == [PAGES[0]] and not report["ok"]
+
+
+def test_eager_dataset_load_breaches_the_budget():
+    result = {
+        "import_ms": 10,
+        "render_ms": 10,
+        "render_exceptions": [],
+        "datasets_loaded_on_import": ["crime", "seifa"],
+    }
+
+    assert check_budget(result, {"import_ms": 2000, "render_ms": 1500}) == [
+        "datasets loaded on import: crime, seifa"
+    ]
+    assert check_budget({"error": "exit code 1"}, {}) == ["profile failed: exit code 1"]
@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+
+from data import valuation_report
+from data.valuation_report import (
+    FIELDS,
+    extract_valuation_report,
+    extract_valuation_reports,
+    parse_valuation_report,
+    section_record,
+)
+
+SAMPLE = (
+    Path(__file__).resolve().parents[1]
+    / "doc"
+    / "Submission pack and supporting docs"
+    / "1.1.5 Valuation Report Report_16_Middleton_Avenue (1).pdf"
+)
+
+pytestmark = pytest.mark.skipif(
+    valuation_report.PdfReader is None, reason="pypdf not installed"
+)
+
+
+def _pdf(pages: list[list[str]]) -> bytes:
+    """
+    Minimal PDF with one Helvetica text line per entry.
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None]
+    font = 3
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    kids = []
+    for lines in pages:
+        text = " ".join(
+            f"({line.replace('(', '[').replace(')', ']')}) Tj 0 -14 Td" for line in lines
+        )
+        stream = f"BT /F1 10 Tf 40 800 Td {text} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content = len(objects)
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return out
+
+
+def test_sample_report_fields():
+    result = parse_valuation_report(SAMPLE)
+    fields = result["fields"]
+
+    assert fields == {
+        "property_address": "26/16 Middleton Avenue, Castle Hill, New South Wales 2154",
+        "title_search_sighted": "No",
+        "encumbrances": "Not Known",
+        "site_dimensions": "Irregular in shape",
+        "zoning": "R4 (High Density Residential) / The Hills LEP 2019.",
+        "lga": "The Hills Shire Council",
+        "units_lot_entitlement": "1150 out of 324005",
+        "zoning_effect": "Permits single residential property.",
+        "overlays": "Unknown, no formal searches undertaken",
+        "valuation_risk_alert": "No",
+    }
+    assert result["locations"]["valuation_risk_alert"]["page"] == 4
+    assert len(result["risk_alerts"]) == 4
+    # Stops at section 9; the rest of the report is never parsed
+    assert result["pages_read"] < result["page_count"]
+
+    assert section_record({**result, "source": str(SAMPLE)}) == {
+        "doc_id": SAMPLE.stem,
+        "overlay": "Unknown, no formal searches undertaken",
+        "zoning_effect": "Permits single residential property.",
+        "valuation_risk_alert": "No",
+    }
+
+
+def test_report_with_missing_fields():
+    pdf = _pdf(
+        [
+            [
+                "1 PROPERTY SUMMARY",
+                "Property Address: 1 Main Street, Castle Hill NSW 2154",
+                "Zoning: R2 Low Density Residential",
+            ],
+            ["4 THE LAND", "Zoning Effect: Residential use is permitted."],
+            ["9 ASSUMPTIONS", "Overlays:", "Never read: past section 8"],
+        ]
+    )
+
+    result = parse_valuation_report(pdf)
+
+    assert result["fields"] == {
+        "property_address": "1 Main Street, Castle Hill NSW 2154",
+        "zoning": "R2 Low Density Residential",
+        "zoning_effect": "Residential use is permitted.",
+    }
+    assert set(result["fields"]) < set(FIELDS)
+    assert result["risk_alerts"] == []
+    assert section_record(result, "main_st") == {
+        "doc_id": "main_st",
+        "overlay": None,
+        "zoning_effect": "Residential use is permitted.",
+        "valuation_risk_alert": None,
+    }
+
+
+def test_results_cached_by_content(tmp_path):
+    first = extract_valuation_report(SAMPLE, cache_dir=tmp_path)
+    second = extract_valuation_report(SAMPLE.read_bytes(), cache_dir=tmp_path)
+
+    assert not first["cached"] and second["cached"]
+    assert second["fields"] == first["fields"]
+
+
+def test_damaged_file_does_not_stop_the_batch(tmp_path):
+    damaged = tmp_path / "damaged.pdf"
+    damaged.write_bytes(b"%PDF-1.4\nnot really a pdf")
+
+    results = extract_valuation_reports(
+        [SAMPLE, damaged, SAMPLE], cache_dir=tmp_path / "cache", workers=2
+    )
+
+    assert [r["source"] for r in results] == [str(SAMPLE), str(damaged), str(SAMPLE)]
+    assert results[0]["fields"]["lga"] == "The Hills Shire Council"
+    assert "error" in results[1]
+    assert results[2]["sha256"] == results[0]["sha256"]
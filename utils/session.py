@@ -1,5 +1,14 @@
+import uuid
+
 import streamlit as st
 
+from data.assessment_store import get_assessment_store
+
+# URL query parameter carrying the current assessment between pages,
+# refreshes and workers
+ASSESSMENT_PARAM = "assessment"
+
+
 def init_session_state():
     defaults = {
         "input_suburb": "",
@@ -11,3 +20,104 @@ def init_session_state():
     for k, v in defaults.items():
         if k not in st.session_state:
             st.session_state[k] = v
+
+    restore_assessment()
+
+
+# =====================================================
+# Persistent assessment state
+# =====================================================
+def current_assessment_id() -> str | None:
+    return st.session_state.get("assessment_id") or st.query_params.get(ASSESSMENT_PARAM)
+
+
+def assessment_query() -> dict:
+    """
+    Query params for st.switch_page so the next page (on any worker)
+    finds the same assessment.
+    """
+    assessment_id = current_assessment_id()
+    return {ASSESSMENT_PARAM: assessment_id} if assessment_id else {}
+
+
+def restore_assessment() -> None:
+    """
+    Reload the assessment named in the URL from the store when this
+    session does not hold it (browser refresh, restarted or different
+    worker).
+    """
+    assessment_id = st.query_params.get(ASSESSMENT_PARAM)
+    if not assessment_id or st.session_state.get("assessment_id") == assessment_id:
+        return
+
+    stored = get_assessment_store().load(assessment_id)
+    if stored is None:
+        return
+
+    st.session_state["assessment_id"] = assessment_id
+    st.session_state["neighbourhood_result"] = stored["neighbourhood_result"]
+    st.session_state["applied_overrides"] = stored["applied_overrides"]
+    if stored["manual_override"] is not None:
+        st.session_state["manual_override"] = stored["manual_override"]
+    else:
+        st.session_state.pop("manual_override", None)
+
+
+def set_neighbourhood_result(result: dict, inputs: tuple) -> None:
+    """
+    Make `result` the session's current neighbourhood assessment.
+    Nothing is written to the store here (this runs on every rerun);
+    see persist_assessment. New inputs start a new assessment: the
+    session lets go of the stored one, and its overrides do not carry
+    over.
+    """
+    if st.session_state.get("_assessment_inputs") != inputs:
+        st.session_state.pop("assessment_id", None)
+        st.query_params.pop(ASSESSMENT_PARAM, None)
+        st.session_state["applied_overrides"] = {}
+        st.session_state.pop("manual_override", None)
+        st.session_state["_assessment_inputs"] = inputs
+
+    st.session_state["neighbourhood_result"] = result
+
+
+def persist_assessment() -> str | None:
+    """
+    Store the session's current assessment, on an explicit action
+    (leaving the page, applying an override). The first call gives it
+    an id; later calls update the same row.
+    """
+    assessment_id = current_assessment_id()
+    result = st.session_state.get("neighbourhood_result")
+    if result is None:
+        return assessment_id
+
+    if assessment_id is None:
+        assessment_id = uuid.uuid4().hex
+        st.session_state["assessment_id"] = assessment_id
+        st.query_params[ASSESSMENT_PARAM] = assessment_id
+
+    get_assessment_store().save_assessment(assessment_id, result)
+    return assessment_id
+
+
+def save_applied_overrides(overrides: dict) -> None:
+    st.session_state["applied_overrides"] = overrides
+
+    assessment_id = current_assessment_id() or persist_assessment()
+    if assessment_id:
+        get_assessment_store().save_overrides(assessment_id, overrides)
+
+
+def save_manual_override(context: dict | None) -> None:
+    """
+    Set, or clear with None, the pending manual review context.
+    """
+    if context is None:
+        st.session_state.pop("manual_override", None)
+    else:
+        st.session_state["manual_override"] = context
+
+    assessment_id = current_assessment_id() or persist_assessment()
+    if assessment_id:
+        get_assessment_store().save_manual_override(assessment_id, context)
@@ -0,0 +1,277 @@
+# =====================================================
+# Startup profiler / import-cost budget
+# =====================================================
+# Cold start decides how quickly new workers can take load, so each
+# script (app.py and every page) is profiled in its own fresh
+# interpreter:
+#
+# - import: the script's top-level imports, timed one by one in source
+#   order (a module another import already pulled in costs ~0), plus
+#   the heaviest modules underneath from python -X importtime
+# - datasets loaded during import (should be none: the registry loads
+#   lazily, on first use)
+# - first render: one run of the script through streamlit's AppTest
+#
+# Results are checked against config/startup_budget.yaml and written
+# as JSON. The command exits 1 when any script is over budget, so it
+# can gate CI or a deploy.
+#
+#     python -m utils.startup_profile                # all scripts
+#     python -m utils.startup_profile pages/2_Neighbourhood_Risk.py
+#     python -m utils.startup_profile --output profile.json
+import argparse
+import ast
+import importlib
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+
+APP_DIR = Path(__file__).resolve().parents[1]
+BUDGET_PATH = APP_DIR / "config" / "startup_budget.yaml"
+REPORT_PATH = APP_DIR / ".cache" / "startup_profile.json"
+
+# Heaviest transitive modules kept per script
+TOP_MODULES = 15
+
+RENDER_TIMEOUT_SECONDS = 60
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def app_scripts() -> list[str]:
+    """
+    app.py and the pages, relative to the app directory.
+    """
+    pages = sorted((APP_DIR / "pages").glob("*.py"))
+    return ["app.py"] + [p.relative_to(APP_DIR).as_posix() for p in pages]
+
+
+def script_imports(script: Path) -> list[str]:
+    """
+    Modules a script imports at top level, in source order.
+    """
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(n for n in names if n not in modules)
+    return modules
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+# =====================================================
+# Child: runs in the fresh interpreter
+# =====================================================
+def _profile_in_process(script: str) -> dict:
+    path = APP_DIR / script
+
+    imports = []
+    start = time.perf_counter()
+    for module in script_imports(path):
+        t = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(module)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        imports.append(
+            {"module": module, "ms": _ms(time.perf_counter() - t), "error": error}
+        )
+    import_ms = _ms(time.perf_counter() - start)
+
+    loaded = []
+    if "data.loaders" in sys.modules:
+        loaded = sys.modules["data.loaders"].LOCATION_REGISTRY.loaded()
+
+    from streamlit.testing.v1 import AppTest
+
+    t = time.perf_counter()
+    app = AppTest.from_file(str(path), default_timeout=RENDER_TIMEOUT_SECONDS)
+    app.run()
+    render_ms = _ms(time.perf_counter() - t)
+
+    return {
+        "imports": imports,
+        "import_ms": import_ms,
+        "render_ms": render_ms,
+        "datasets_loaded_on_import": loaded,
+        "render_exceptions": [e.message for e in app.exception],
+    }
+
+
+# =====================================================
+# Parent: one subprocess per script
+# =====================================================
+def _heaviest_modules(importtime: str, n: int = TOP_MODULES) -> list[dict]:
+    modules = []
+    for line in importtime.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules.append(
+                {
+                    "module": name,
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                }
+            )
+    modules.sort(key=lambda m: m["self_ms"], reverse=True)
+    return modules[:n]
+
+
+def profile_script(script: str) -> dict:
+    """
+    Cold-start profile of one script in a fresh interpreter.
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "utils.startup_profile",
+         "--child", script],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=RENDER_TIMEOUT_SECONDS * 2,
+    )
+    wall_ms = _ms(time.perf_counter() - start)
+
+    result = {"script": script, "wall_ms": wall_ms}
+    try:
+        result.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    except (IndexError, ValueError):
+        tail = proc.stderr.strip().splitlines()[-5:]
+        result["error"] = "\n".join(
+            line for line in tail if not line.startswith("import time:")
+        ) or f"exit code {proc.returncode}"
+        return result
+
+    result["heaviest_modules"] = _heaviest_modules(proc.stderr)
+    return result
+
+
+def load_budget(path: Path = BUDGET_PATH) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        doc = yaml.safe_load(fh) or {}
+    return {"default": doc.get("default", {}), "pages": doc.get("pages") or {}}
+
+
+def budget_for(budget: dict, script: str) -> dict:
+    return {**budget["default"], **budget["pages"].get(script, {})}
+
+
+def check_budget(result: dict, limits: dict) -> list[str]:
+    """
+    Budget breaches of one profiled script, e.g.
+    ["render_ms 5120 > 4000"]. A script that failed to profile, raised
+    on first render or loaded datasets while importing is always
+    flagged.
+    """
+    if "error" in result:
+        return [f"profile failed: {result['error']}"]
+
+    breaches = [
+        f"{metric} {result[metric]:.0f} > {limit}"
+        for metric, limit in limits.items()
+        if metric in result and result[metric] > limit
+    ]
+    if result.get("render_exceptions"):
+        breaches.append(f"{len(result['render_exceptions'])} render exception(s)")
+    if result.get("datasets_loaded_on_import"):
+        breaches.append(
+            "datasets loaded on import: "
+            + ", ".join(result["datasets_loaded_on_import"])
+        )
+    return breaches
+
+
+def profile_app(scripts: list[str] | None = None, budget_path: Path = BUDGET_PATH) -> dict:
+    """
+    Profile scripts (default: app.py and every page) and check them
+    against the budget.
+
+    Returns
+    -------
+    dict
+        {
+            "generated_at", "python", "budget_file",
+            "scripts": [
+                {
+                    "script", "wall_ms", "import_ms", "render_ms",
+                    "imports": [{"module", "ms", "error"}],
+                    "heaviest_modules": [{"module", "self_ms", "cumulative_ms"}],
+                    "datasets_loaded_on_import", "render_exceptions",
+                    "budget", "over_budget": [str], "ok"
+                }
+            ],
+            "over_budget": [script],
+            "ok": bool
+        }
+    """
+    budget = load_budget(budget_path)
+
+    results = []
+    for script in scripts or app_scripts():
+        result = profile_script(script)
+        result["budget"] = budget_for(budget, script)
+        result["over_budget"] = check_budget(result, result["budget"])
+        result["ok"] = not result["over_budget"]
+        results.append(result)
+
+    failed = [r["script"] for r in results if not r["ok"]]
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "budget_file": str(budget_path),
+        "scripts": results,
+        "over_budget": failed,
+        "ok": not failed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile app cold start")
+    parser.add_argument("scripts", nargs="*", help="default: app.py and every page")
+    parser.add_argument("--output", type=Path, default=REPORT_PATH)
+    parser.add_argument("--budget", type=Path, default=BUDGET_PATH)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_profile_in_process(args.child)))
+        sys.exit(0)
+
+    report = profile_app(args.scripts or None, args.budget)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for r in report["scripts"]:
+        timings = (
+            f"import {r['import_ms']:7.0f} ms  render {r['render_ms']:7.0f} ms"
+            if "error" not in r
+            else "failed".ljust(37)
+        )
+        status = "ok" if r["ok"] else "; ".join(r["over_budget"])
+        print(f"{r['script']:<42} {timings}  {status}")
+    print(f"→ {args.output}")
+
+    sys.exit(0 if report["ok"] else 1)